@@ -0,0 +1,171 @@
+"""
+Best responses to a fixed dealer or non-dealer strategy over the whole strategy space, without calculating the results matrix.
+
+The dealer gain is a sum over card pairs, except for the share of the carried pot, which depends on the number of checked rounds.
+A round is only checked if both players check, so once the cards a player opens on are fixed, the number of checked rounds against each opponent strategy is fixed, and the player's gain is a sum of one term per card.
+The player's action at a card is split into an open and see after a raise part, and a see or raise part, which add up separately, so the best open and see after a raise strategy pair and the best see or raise strategy are found separately for each set of open cards.
+"""
+
+from typing import Mapping, Sequence, TypedDict
+import numpy as np
+
+from configuration import CARD_HIGH_NUMBER, ANTE_BET, IS_CARRY_POT, OPEN_BET_OPTIONS, SEE_BET_OPTIONS, Strategy
+from matrix_manipulation import Player_Type
+from strategy_encoding import encode_strategy_list
+from vectorized_simulator import create_payoff_tables, encode_strategy_triples, one_hot_actions
+
+class BestResponse(TypedDict):
+    Strategies: tuple[dict[int, str], dict[int, str], dict[int, str]] # The open, see or raise, and see after a raise strategies
+    Index: int # The index of the strategy set in the product of the open, see or raise, and see after a raise strategy lists, i.e., its column (dealer) or row (non-dealer) in the results matrix
+    Value: float # The dealer gain per round of the best response against the opponent's strategy
+
+class Exploitability(TypedDict):
+    Dealer_Best_Response: BestResponse # The dealer's best response to the non-dealer strategy
+    Non_Dealer_Best_Response: BestResponse # The non-dealer's best response to the dealer strategy
+    Exploitability: float # The dealer best response gain minus the non-dealer best response gain, as reported by matrix_manipulation.calc_approximate_strategy_combos, which is 0 for optimal strategies
+
+def calc_best_response(
+    player: Player_Type,
+    opponent_actions: np.ndarray,
+    opponent_percentages: np.ndarray,
+    open_strategy_list: Sequence[Mapping[int, str]],
+    see_strategy_list: Sequence[Mapping[int, str]],
+    raise_strategy_list: Sequence[Mapping[int, str]],
+) -> BestResponse:
+    """
+    Finds the strategy set with the best dealer gain (for the dealer) or the lowest dealer gain (for the non-dealer) against a mix of opponent strategy sets.
+    The strategy sets searched are every combination of the open, see or raise, and see after a raise strategy lists, but the combinations are never listed.
+
+    Args:
+        player (Player_Type): The player to find the best response for, "dealer" or "non-dealer".
+        opponent_actions (np.ndarray): The opponent's strategy sets as rows of vectorized_simulator.encode_strategy_triples.
+        opponent_percentages (np.ndarray): The percentage the opponent plays each strategy set, e.g. from matrix_manipulation.calc_optimal_strategy_combos.
+        open_strategy_list, see_strategy_list, raise_strategy_list: The player's strategy lists, e.g. from utilities.generate_possible_lists.
+
+    Returns:
+        BestResponse: The best response strategies, their index and their value.
+    """
+    tables = create_payoff_tables()
+    num_cards, num_actions = CARD_HIGH_NUMBER, tables["Dealer_Cash"].shape[1]
+    num_open_codes, num_see_codes = len(OPEN_BET_OPTIONS) + 1, len(SEE_BET_OPTIONS) + 1
+    num_deals = num_cards * (num_cards - 1)
+    cards = np.arange(num_cards)
+
+    is_played = opponent_percentages > 0
+    percentages = np.asarray(opponent_percentages, dtype=np.float64)[is_played]
+    opponent_one_hot = one_hot_actions(opponent_actions[is_played], num_actions)
+    num_card_actions = num_cards * num_actions
+
+    def sum_over_opponent_cards(table: np.ndarray) -> np.ndarray:
+        # For each opponent strategy set, sum the table over the opponent's cards, leaving one value per (card, action) of the player
+        flat_table = table.reshape(num_card_actions, num_card_actions)
+        summed = opponent_one_hot @ (flat_table.T if player == "dealer" else flat_table)
+        return summed.astype(np.float64).reshape(-1, num_cards, num_actions)
+
+    cash = sum_over_opponent_cards(tables["Dealer_Cash"])
+    dealer_wins = sum_over_opponent_cards(tables["Is_Dealer_Win"])
+    checked = sum_over_opponent_cards(tables["Is_Checked"])
+
+    open_codes = encode_strategy_list(open_strategy_list, OPEN_BET_OPTIONS).astype(np.intp)[:, 1:]
+    see_codes = encode_strategy_list(see_strategy_list, SEE_BET_OPTIONS).astype(np.intp)[:, 1:]
+    raise_codes = (encode_strategy_list(raise_strategy_list, SEE_BET_OPTIONS)[:, 1:] > 0).astype(np.intp)
+    # The dealer maximizes the dealer gain and the non-dealer minimizes it
+    sign = 1 if player == "dealer" else -1
+
+    best_value, best_index = -np.inf, (0, 0, 0)
+    for open_cards in np.unique(open_codes > 0, axis=0):
+        # The checked rounds against each opponent strategy set, which do not depend on the amounts opened or on the see strategies
+        reference_open_codes = open_cards.astype(np.intp)
+        reference_actions = reference_open_codes * num_see_codes * 2
+        num_checked = checked[:, cards, reference_actions].sum(axis=1)
+        if IS_CARRY_POT:
+            num_wins = num_deals - num_checked
+            # The dealer's share of the carried pot is 2 * ANTE_BET * num_checked * dealer wins / num_wins
+            carry_factors = np.divide(2 * ANTE_BET * num_checked, num_wins, out=np.zeros_like(num_checked), where=num_wins > 0)
+            constant = -(percentages @ num_checked) * ANTE_BET / num_deals
+        else:
+            carry_factors = np.zeros_like(num_checked)
+            constant = 0.0
+        # The dealer gain per round for each (card, action) of the player, which add up over the cards
+        values = (np.tensordot(percentages, cash + carry_factors[:, None, None] * dealer_wins, axes=1) / num_deals).reshape(
+            num_cards, num_open_codes, num_see_codes, 2
+        )
+        # Split the value at each card into the open and see after a raise part, and the see or raise part
+        open_raise_values = values[:, :, 0, :]
+        see_values = values[cards, reference_open_codes, :, 0] - values[cards, reference_open_codes, 0, 0][:, None]
+
+        open_indices = np.flatnonzero(((open_codes > 0) == open_cards).all(axis=1))
+        open_raise_totals = open_raise_values[cards, open_codes[open_indices][:, None, :], raise_codes[None, :, :]].sum(axis=2)
+        see_totals = see_values[cards, see_codes].sum(axis=1)
+        open_raise_best = np.unravel_index(np.argmax(sign * open_raise_totals), open_raise_totals.shape)
+        see_best = int(np.argmax(sign * see_totals))
+        value = open_raise_totals[open_raise_best] + see_totals[see_best] + constant
+        if sign * value > best_value:
+            best_value = sign * value
+            best_index = (int(open_indices[open_raise_best[0]]), see_best, int(open_raise_best[1]))
+
+    open_index, see_index, raise_index = best_index
+    return {
+        "Strategies": (
+            dict(open_strategy_list[open_index]),
+            dict(see_strategy_list[see_index]),
+            dict(raise_strategy_list[raise_index]),
+        ),
+        "Index": (open_index * len(see_strategy_list) + see_index) * len(raise_strategy_list) + raise_index,
+        "Value": float(sign * best_value),
+    }
+
+def calc_exploitability(
+    dealer_actions: np.ndarray,
+    dealer_percentages: np.ndarray,
+    non_dealer_actions: np.ndarray,
+    non_dealer_percentages: np.ndarray,
+    open_strategy_list: Sequence[Mapping[int, str]],
+    see_strategy_list: Sequence[Mapping[int, str]],
+    raise_strategy_list: Sequence[Mapping[int, str]],
+) -> Exploitability:
+    """
+    Finds each player's best response to the other player's strategy, e.g. to check the percentages from a solver against the whole strategy space.
+
+    Args:
+        dealer_actions, non_dealer_actions (np.ndarray): The strategy sets of each player, as rows of vectorized_simulator.encode_strategy_triples.
+        dealer_percentages, non_dealer_percentages (np.ndarray): The percentage each player plays each strategy set.
+        open_strategy_list, see_strategy_list, raise_strategy_list: The strategy lists searched for best responses.
+
+    Returns:
+        Exploitability: The best responses and the exploitability.
+    """
+    dealer_best_response = calc_best_response(
+        "dealer", non_dealer_actions, non_dealer_percentages, open_strategy_list, see_strategy_list, raise_strategy_list
+    )
+    non_dealer_best_response = calc_best_response(
+        "non-dealer", dealer_actions, dealer_percentages, open_strategy_list, see_strategy_list, raise_strategy_list
+    )
+    return {
+        "Dealer_Best_Response": dealer_best_response,
+        "Non_Dealer_Best_Response": non_dealer_best_response,
+        "Exploitability": dealer_best_response["Value"] - non_dealer_best_response["Value"],
+    }
+
+def calc_player_exploitability(
+    strategy: Strategy,
+    open_strategy_list: Sequence[Mapping[int, str]],
+    see_strategy_list: Sequence[Mapping[int, str]],
+    raise_strategy_list: Sequence[Mapping[int, str]],
+) -> Exploitability:
+    """
+    Finds the best responses to a player's strategy, e.g. player1.PlayerCode().strategy, playing its dealer strategies as dealer and its non-dealer strategies as non-dealer.
+    """
+    dealer_actions = encode_strategy_triples(
+        [strategy["Dealer_Opens"]],
+        [strategy["Dealer_Sees_after_Non_Dealer_Opens_after_Dealer_Checks"]],
+        [strategy["Dealer_Sees_after_Non_Dealer_Raises_after_Dealer_Opens"]],
+    )
+    non_dealer_actions = encode_strategy_triples(
+        [strategy["Non_Dealer_Opens_after_Dealer_Checks"]],
+        [strategy["Non_Dealer_Sees_after_Dealer_Opens"]],
+        [strategy["Non_Dealer_Sees_after_Dealer_Raises_after_Non_Dealer_Opens_after_Dealer_Checks"]],
+    )
+    return calc_exploitability(
+        dealer_actions, np.ones(1), non_dealer_actions, np.ones(1), open_strategy_list, see_strategy_list, raise_strategy_list
+    )
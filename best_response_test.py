@@ -0,0 +1,48 @@
+from typing import cast
+import unittest
+import numpy as np
+
+from best_response import calc_best_response, calc_player_exploitability
+from configuration import OpenBetValues, SeeBetValues
+from player1 import PlayerCode
+from utilities import generate_possible_lists
+from vectorized_simulator import batched_dealer_gain_matrix, encode_strategy_triples
+
+
+class TestBestResponse(unittest.TestCase):
+
+    def setUp(self):
+        self.open_list = cast(list[dict[int, OpenBetValues]], generate_possible_lists(3, "HML", "345"))
+        self.see_list = cast(list[dict[int, SeeBetValues]], generate_possible_lists(3, "HMS", "345"))
+        self.raise_list = cast(list[dict[int, SeeBetValues]], generate_possible_lists(3, "S"))
+        self.strategy_lists = (self.open_list, self.see_list, self.raise_list)
+        self.actions = encode_strategy_triples(*self.strategy_lists)
+        # Rows are non-dealer strategy sets and columns are dealer strategy sets
+        self.results_matrix = batched_dealer_gain_matrix(*self.strategy_lists, *self.strategy_lists)
+
+    def test_matches_results_matrix(self):
+        rng = np.random.default_rng(0)
+        num_triples = len(self.actions)
+        for _ in range(5):
+            # A mix of a few strategy sets, as a solver would return
+            percentages = np.zeros(num_triples)
+            percentages[rng.choice(num_triples, size=4, replace=False)] = rng.dirichlet(np.ones(4))
+
+            dealer_best_response = calc_best_response("dealer", self.actions, percentages, *self.strategy_lists)
+            col_gains = percentages @ self.results_matrix
+            self.assertAlmostEqual(dealer_best_response["Value"], col_gains.max())
+            self.assertAlmostEqual(col_gains[dealer_best_response["Index"]], col_gains.max())
+
+            non_dealer_best_response = calc_best_response("non-dealer", self.actions, percentages, *self.strategy_lists)
+            row_gains = self.results_matrix @ percentages
+            self.assertAlmostEqual(non_dealer_best_response["Value"], row_gains.min())
+            self.assertAlmostEqual(row_gains[non_dealer_best_response["Index"]], row_gains.min())
+
+    def test_player_exploitability(self):
+        exploitability = calc_player_exploitability(PlayerCode().strategy, *self.strategy_lists)
+        self.assertGreaterEqual(exploitability["Exploitability"], 0)
+        open_strategy, see_strategy, raise_strategy = exploitability["Dealer_Best_Response"]["Strategies"]
+        self.assertIn(open_strategy, self.open_list)
+
+if __name__ == '__main__':
+    unittest.main()
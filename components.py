@@ -7,7 +7,62 @@ Author: Seán Young
 
 from __future__ import annotations
 import random
-from typing import Sequence
+from typing import TYPE_CHECKING, Literal, Optional, Sequence, TypeVar, Union, overload
+
+# NumPy is imported by the functions that use it, so importing the game does not load it
+if TYPE_CHECKING:
+    import numpy as np
+
+# A random number generator for shuffling and dealing, either a random.Random or a numpy Generator
+# Where a generator is optional None means the functions of the random module, i.e., its global generator
+RNG = Union[random.Random, "np.random.Generator"]
+
+T = TypeVar("T")
+
+@overload
+def derive_rng(master_seed: int, *stream: int, numpy: Literal[False] = False) -> random.Random: ...
+@overload
+def derive_rng(master_seed: int, *stream: int, numpy: Literal[True]) -> np.random.Generator: ...
+@overload
+def derive_rng(master_seed: int, *stream: int, numpy: bool) -> RNG: ...
+def derive_rng(master_seed: int, *stream: int, numpy: bool = False) -> RNG:
+    """
+    Returns a generator for one stream of random numbers derived from a master seed, e.g. derive_rng(seed, game_index) for each game of a parallel run.
+    The streams are derived with numpy.random.SeedSequence, so they are independent of each other and the same on every run and in every process.
+
+    Args:
+        master_seed (int): The master seed.
+        stream (int): The keys of the stream, e.g. a game or worker index.
+        numpy (bool): True for a numpy Generator, False for a random.Random.
+    """
+    import numpy as np
+    seed_sequence = np.random.SeedSequence(master_seed, spawn_key=stream)
+    if numpy:
+        return np.random.default_rng(seed_sequence)
+    return random.Random(int.from_bytes(seed_sequence.generate_state(4).tobytes(), "little"))
+
+def rng_shuffle(items: list[T], rng: Optional[RNG] = None) -> None:
+    """Shuffles a list in place with rng, or with the random module if rng is None"""
+    if rng is None:
+        random.shuffle(items)
+    else:
+        rng.shuffle(items)
+
+def rng_sample(items: Sequence[T], count: int, rng: Optional[RNG] = None) -> list[T]:
+    """Returns count different items chosen at random with rng, or with the random module if rng is None"""
+    if rng is None:
+        return random.sample(items, count)
+    if isinstance(rng, random.Random):
+        return rng.sample(items, count)
+    return [items[i] for i in rng.choice(len(items), count, replace=False).tolist()]
+
+def rng_choice(items: Sequence[T], rng: Optional[RNG] = None) -> T:
+    """Returns an item chosen at random with rng, or with the random module if rng is None"""
+    if rng is None:
+        return random.choice(items)
+    if isinstance(rng, random.Random):
+        return rng.choice(items)
+    return items[int(rng.integers(len(items)))]
 
 class Card:
 
@@ -31,26 +86,28 @@ class Card:
 class Deck(Sequence[Card]):
 # Deck is a subclass of List that will contain objects of type Card
 
-    def __init__(self, cards: list[Card]) -> None:
+    def __init__(self, cards: list[Card], rng: Optional[RNG] = None) -> None:
         if not all(isinstance(card, Card) for card in cards): # type: ignore
             raise TypeError("The Deck object must consist of Card objects")
         self.cards = cards
+        # The generator used to shuffle and deal, or None for the random module
+        self.rng = rng
 
     @classmethod
-    def create(cls, count: int, shuffle: bool = False) -> Deck:
-        """Create a new deck of cards"""
+    def create(cls, count: int, shuffle: bool = False, rng: Optional[RNG] = None) -> Deck:
+        """Create a new deck of cards, shuffled with rng if shuffle is True"""
         if not count > 3:
             raise ValueError("The deck must have three cards minimum")
         cards = [Card(n) for n in list(range(1, count + 1))]
         if shuffle:
-            random.shuffle(cards)
-        return cls(cards)
+            rng_shuffle(cards, rng)
+        return cls(cards, rng)
 
     def deal(self, count: int = 2) -> list[Card]:
         """Deal a set of count random cards from the deck"""
         if not count < len(self):
             raise ValueError("The deal must be less than the deck size")
-        deal = random.sample(self.cards, count)
+        deal = rng_sample(self.cards, count, self.rng)
         return deal
 
     def __len__(self) -> int:
@@ -69,3 +126,48 @@ class Deck(Sequence[Card]):
     def __repr__(self) -> str:
         return " ".join(repr(c) for c in self.cards)
 
+
+class DealSource:
+    """
+        Deals from pre-generated arrays of deals, so dealing a round is a read of one row of an array rather than a shuffle and a sample.
+        The deals are generated a chunk of rounds at a time, each row holding one different card for each player.
+        Chunk i is generated with derive_rng(seed, *stream, i, numpy=True), so the deal of any round can be regenerated on its own, e.g. to replay one round of a long game.
+    Args:
+        count (int): The number of cards in the deck, numbered 1 to count.
+        num_players (int): The number of cards dealt in each round.
+        seed (int): The master seed.
+        stream (tuple[int, ...]): The keys of the stream of deals, e.g. a game index.
+        chunk_size (int): The number of rounds generated at a time. Each chunk holds a float64 key for every card of every round while it is generated, so the default keeps a chunk to about 1 MB.
+    """
+
+    def __init__(self, count: int, num_players: int = 2, seed: int = 0, stream: tuple[int, ...] = (), chunk_size: int = 10_000) -> None:
+        if not count > 3:
+            raise ValueError("The deck must have three cards minimum")
+        if not num_players < count:
+            raise ValueError("The deal must be less than the deck size")
+        self.count = count
+        self.num_players = num_players
+        self.seed = seed
+        self.stream = stream
+        self.chunk_size = chunk_size
+        import numpy as np
+        self._chunk_index = -1
+        self._chunk = np.empty((0, num_players), dtype=np.uint8)
+
+    def create_chunk(self, chunk_index: int) -> np.ndarray:
+        """
+        Returns the deals of chunk chunk_index, one row per round.
+        The cards of a row are the first num_players of a random permutation of the deck, found by sorting random keys, so every ordered deal is equally likely.
+        """
+        import numpy as np
+        rng = derive_rng(self.seed, *self.stream, chunk_index, numpy=True)
+        keys = rng.random((self.chunk_size, self.count))
+        return (np.argsort(keys, axis=1)[:, :self.num_players] + 1).astype(np.uint8)
+
+    def deal(self, index: int) -> list[int]:
+        """Returns the card numbers dealt in round index, counting from 0"""
+        chunk_index, row = divmod(index, self.chunk_size)
+        if chunk_index != self._chunk_index:
+            self._chunk = self.create_chunk(chunk_index)
+            self._chunk_index = chunk_index
+        return self._chunk[row].tolist()
@@ -1,5 +1,7 @@
+import random
 import unittest
-from components import Deck, Card
+import numpy as np
+from components import Deck, Card, DealSource, derive_rng
 
 class TestCard(unittest.TestCase):
 
@@ -53,6 +55,43 @@ class TestDeck(unittest.TestCase):
         expected_repr = " ".join(repr(Card(n)) for n in range(1, 11))
         self.assertEqual(repr(self.deck), expected_repr)
 
+class TestRNG(unittest.TestCase):
+
+    def test_derive_rng(self):
+        for numpy in (False, True):
+            # Cards are compared by their repr as Card does not define equality
+            deck = repr(Deck.create(9, shuffle=True, rng=derive_rng(1, 2, numpy=numpy)))
+            self.assertEqual(repr(Deck.create(9, shuffle=True, rng=derive_rng(1, 2, numpy=numpy))), deck)
+            self.assertNotEqual(repr(Deck.create(9, shuffle=True, rng=derive_rng(1, 3, numpy=numpy))), deck)
+        self.assertIsInstance(derive_rng(1), random.Random)
+        self.assertIsInstance(derive_rng(1, numpy=True), np.random.Generator)
+
+    def test_deal_with_rng(self):
+        for numpy in (False, True):
+            deck = Deck.create(9, rng=derive_rng(4, numpy=numpy))
+            deals = [deck.deal(2) for _ in range(50)]
+            self.assertTrue(all(card1.number != card2.number for card1, card2 in deals))
+            deck = Deck.create(9, rng=derive_rng(4, numpy=numpy))
+            self.assertEqual([[card.number for card in deck.deal(2)] for _ in range(50)], [[card.number for card in deal] for deal in deals])
+
+class TestDealSource(unittest.TestCase):
+
+    def test_deals(self):
+        deal_source = DealSource(9, num_players=3, seed=2, chunk_size=100)
+        deals = np.array([deal_source.deal(i) for i in range(1000)])
+        self.assertEqual(deals.shape, (1000, 3))
+        self.assertTrue(((deals >= 1) & (deals <= 9)).all())
+        self.assertTrue(all(len(set(deal)) == 3 for deal in deals.tolist()))
+        # Every card is dealt to every seat
+        self.assertTrue(all(set(deals[:, seat].tolist()) == set(range(1, 10)) for seat in range(3)))
+
+    def test_random_access(self):
+        deal_source = DealSource(9, seed=2, stream=(5,), chunk_size=100)
+        deals = [deal_source.deal(i) for i in range(350)]
+        other_source = DealSource(9, seed=2, stream=(5,), chunk_size=100)
+        self.assertEqual([other_source.deal(i) for i in (349, 0, 150, 99, 100)], [deals[i] for i in (349, 0, 150, 99, 100)])
+        self.assertNotEqual([DealSource(9, seed=2, stream=(6,), chunk_size=100).deal(i) for i in range(10)], deals[:10])
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -3,9 +3,12 @@ This module holds the configuration for the Pokerlite program.
 Author: Seán Young
 """
 
+from array import array
 from datetime import datetime
 import logging
-from typing import Literal, TypedDict
+import logging.config
+import os
+from typing import Any, Literal, Optional, TypedDict
 
 #############################################
 # Set the game configuration parameters here
@@ -38,6 +41,12 @@ SEE_BET_OPTIONS: dict[str, float] = {
 MAX_RAISES: int = 1 
 # True to carry the pot when a game is checked, false to give the pot back to the players
 IS_CARRY_POT = True
+# How the game records are kept - "All" keeps every round, "Off" keeps none, "Last" keeps the last RECORD_LAST_ROUNDS rounds,
+# "Sample" keeps every RECORD_SAMPLE_ROUNDS-th round (the last RECORD_LAST_ROUNDS of them), and "File" writes every record to RECORD_FILE_PATH and keeps the last RECORD_LAST_ROUNDS rounds
+RECORD_POLICY: "RecordPolicy" = "Last"
+RECORD_LAST_ROUNDS: int = 1000
+RECORD_SAMPLE_ROUNDS: int = 1000
+RECORD_FILE_PATH: str = "game_records.csv"
 
 #############################################
 
@@ -46,6 +55,9 @@ current_player_files: list[str] = []
 for i in CURRENT_PLAYER_FILE_NUMBERS:
     current_player_files.append(ALL_PLAYER_FILES[i-1])
 
+# Define type for the game record policy
+RecordPolicy = Literal["All", "Off", "Last", "Sample", "File"]
+
 # Define type for passing game configuration data
 class GameConfig(TypedDict):
     PLAYER_FILES: list[str]
@@ -57,6 +69,10 @@ class GameConfig(TypedDict):
     SEE_BET_OPTIONS: dict[str, float]
     MAX_RAISES: int
     IS_CARRY_POT: bool
+    RECORD_POLICY: RecordPolicy
+    RECORD_LAST_ROUNDS: int
+    RECORD_SAMPLE_ROUNDS: int
+    RECORD_FILE_PATH: str
 
 GAME_CONFIG: GameConfig = {
     "PLAYER_FILES": current_player_files,
@@ -67,7 +83,11 @@ GAME_CONFIG: GameConfig = {
     "OPEN_BET_OPTIONS": OPEN_BET_OPTIONS,
     "SEE_BET_OPTIONS": SEE_BET_OPTIONS,
     "MAX_RAISES": MAX_RAISES,
-    "IS_CARRY_POT": IS_CARRY_POT
+    "IS_CARRY_POT": IS_CARRY_POT,
+    "RECORD_POLICY": RECORD_POLICY,
+    "RECORD_LAST_ROUNDS": RECORD_LAST_ROUNDS,
+    "RECORD_SAMPLE_ROUNDS": RECORD_SAMPLE_ROUNDS,
+    "RECORD_FILE_PATH": RECORD_FILE_PATH
 }
 
 # Game states are used in game records to describe the state of the game
@@ -95,6 +115,15 @@ Strategy = TypedDict('Strategy', {
     "Non_Dealer_Sees_after_Dealer_Opens": dict[int, SeeBetValues],
     "Non_Dealer_Sees_after_Dealer_Raises_after_Non_Dealer_Opens_after_Dealer_Checks": dict[int, SeeBetValues]
 }, total=True)
+# The same strategies encoded as int8 arrays indexed by card number - see strategy_encoding.py
+StrategyCodes = TypedDict('StrategyCodes', {
+    "Dealer_Opens": array,
+    "Dealer_Sees_after_Non_Dealer_Opens_after_Dealer_Checks": array,
+    "Dealer_Sees_after_Non_Dealer_Raises_after_Dealer_Opens": array,
+    "Non_Dealer_Opens_after_Dealer_Checks": array,
+    "Non_Dealer_Sees_after_Dealer_Opens": array,
+    "Non_Dealer_Sees_after_Dealer_Raises_after_Non_Dealer_Opens_after_Dealer_Checks": array
+}, total=True)
 
 # Define type for a record of betting activity in a betting round
 PlayerList = Literal["None", "player1", "player2", "player3", "player4"]
@@ -114,15 +143,26 @@ class GameRecord(TypedDict):
     Player: PlayerList
     Value: int
 
-# Initialize the game data list
-game_records: list[GameRecord] = [{
-    "Game_Id": "",
-    "Round_Number": 0,
-    "Pot": 0,
-    "Description": "Game Start",
-    "Player": "None",
-    "Value": 0
-}]
+# The logging configuration file, found next to this module so it does not depend on the working directory
+LOGGING_CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logging.conf")
+_is_logging_configured = False
+
+def configure_logging(config: Optional[dict[str, Any]] = None, force: bool = False) -> None:
+    """
+    Configures logging for the process from LOGGING_CONFIG_FILE, or from config if passed.
+    Only the first call configures logging and later calls return at once, so it can be called wherever a logger is set up, e.g. in every Game and Player constructor.
+    Args:
+        config (Optional[dict[str, Any]]): A configuration dictionary for logging.config.dictConfig to use instead of the file.
+        force (bool): True to configure logging again even if it has already been configured.
+    """
+    global _is_logging_configured
+    if _is_logging_configured and not force:
+        return
+    if config is None:
+        logging.config.fileConfig(LOGGING_CONFIG_FILE)
+    else:
+        logging.config.dictConfig(config)
+    _is_logging_configured = True
 
 # Miscellaneous constants
 BOLD = "\033[1m"
@@ -133,7 +173,8 @@ if __name__ == "__main__":
     from pokerlite import Game
     from utilities import print_records
     game_id: str = datetime.now().strftime("%d-%b-%Y %H:%M:%S")
-    game = Game(game_id)
+    # Keep every round so that the debug dump below prints the whole game
+    game = Game(game_id, GAME_CONFIG={**GAME_CONFIG, "RECORD_POLICY": "All"})
     game.play()
     if game.logger.getEffectiveLevel() == logging.DEBUG: 
         print_records(game.game_records)
@@ -0,0 +1,33 @@
+import logging
+import os
+import unittest
+from unittest import mock
+
+import configuration
+from configuration import configure_logging
+
+class TestConfigureLogging(unittest.TestCase):
+
+    def test_configures_once(self):
+        configure_logging()
+        with mock.patch("logging.config.fileConfig") as file_config:
+            configure_logging()
+            file_config.assert_not_called()
+
+    def test_config_dictionary(self):
+        level = logging.getLogger("pokerlite").level
+        try:
+            configure_logging({"version": 1, "incremental": True, "loggers": {"pokerlite": {"level": "DEBUG"}}}, force=True)
+            self.assertEqual(logging.getLogger("pokerlite").level, logging.DEBUG)
+        finally:
+            logging.getLogger("pokerlite").setLevel(level)
+
+    def test_config_file_does_not_depend_on_working_directory(self):
+        with mock.patch("logging.config.fileConfig") as file_config:
+            configure_logging(force=True)
+        file_config.assert_called_once_with(configuration.LOGGING_CONFIG_FILE)
+        self.assertTrue(os.path.isabs(configuration.LOGGING_CONFIG_FILE))
+        self.assertTrue(os.path.isfile(configuration.LOGGING_CONFIG_FILE))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,261 @@
+"""
+A disk cache for the dealer vs. non-dealer results matrix.
+
+Each cache entry is a directory named by a hash of the game configuration (CARD_HIGH_NUMBER, ANTE_BET, OPEN_BET_OPTIONS, SEE_BET_OPTIONS, IS_CARRY_POT), the simulator configuration (max_len_strategies, limits) and the encoded strategy lists, so a rerun with the same configuration finds the matrix computed by an earlier run.
+An entry holds:
+- metadata.json: The configuration the entry was calculated with, and the dtype of the results matrix.
+- strategies.npz: The six strategy lists encoded by strategy_encoding.encode_strategy_list.
+- matrix.npy: The results matrix in its own dtype, which is loaded memory-mapped so it is only read from disk as it is used.
+
+Entries are invalidated by changing CACHE_VERSION, e.g. when the game engine changes so that old results are wrong, and unreadable entries are deleted when found.
+The least recently used entries are evicted whenever the cache directory grows beyond its size cap.
+"""
+
+from typing import Any, Mapping, Optional, Sequence, TypedDict
+import hashlib
+import json
+import os
+import shutil
+import numpy as np
+
+from configuration import CARD_HIGH_NUMBER, ANTE_BET, OPEN_BET_OPTIONS, SEE_BET_OPTIONS, IS_CARRY_POT
+from strategy_encoding import encode_strategy_list
+
+# Change this to invalidate all existing cache entries
+CACHE_VERSION = 2
+
+# The strategy lists stored in each entry, in the order the simulator passes them
+STRATEGY_LIST_NAMES = (
+    "dealer_open",
+    "dealer_see",
+    "dealer_raise",
+    "non_dealer_open",
+    "non_dealer_see",
+    "non_dealer_raise",
+)
+
+_METADATA_FILE = "metadata.json"
+_STRATEGIES_FILE = "strategies.npz"
+_MATRIX_FILE = "matrix.npy"
+# The metadata field holding the dtype of the results matrix, which is not part of the cache key
+_DTYPE_FIELD = "dtype"
+
+class CacheParameters(TypedDict):
+    CACHE_VERSION: int
+    CARD_HIGH_NUMBER: int
+    ANTE_BET: int
+    OPEN_BET_OPTIONS: dict[str, int]
+    SEE_BET_OPTIONS: dict[str, float]
+    IS_CARRY_POT: bool
+    max_len_strategies: int
+    limits: str
+
+def get_cache_parameters(max_len_strategies: int, limits: str) -> CacheParameters:
+    """
+    Returns the configuration that determines the results matrix, for use in the cache key.
+    """
+    return {
+        "CACHE_VERSION": CACHE_VERSION,
+        "CARD_HIGH_NUMBER": CARD_HIGH_NUMBER,
+        "ANTE_BET": ANTE_BET,
+        "OPEN_BET_OPTIONS": dict(OPEN_BET_OPTIONS),
+        "SEE_BET_OPTIONS": dict(SEE_BET_OPTIONS),
+        "IS_CARRY_POT": IS_CARRY_POT,
+        "max_len_strategies": max_len_strategies,
+        "limits": limits,
+    }
+
+def encode_strategy_lists(strategy_lists: Sequence[Sequence[Mapping[int, str]]]) -> dict[str, np.ndarray]:
+    """
+    Encodes the six dealer and non-dealer strategy lists, in the order of STRATEGY_LIST_NAMES.
+    """
+    bet_options = (OPEN_BET_OPTIONS, SEE_BET_OPTIONS, SEE_BET_OPTIONS) * 2
+    return {
+        name: encode_strategy_list(strategy_list, options)
+        for name, strategy_list, options in zip(STRATEGY_LIST_NAMES, strategy_lists, bet_options)
+    }
+
+def get_cache_key(parameters: CacheParameters, strategy_codes: Mapping[str, np.ndarray]) -> str:
+    """
+    Returns the hash of the configuration and the encoded strategy lists which names a cache entry.
+    """
+    digest = hashlib.sha256(json.dumps(parameters, sort_keys=True).encode())
+    for name in STRATEGY_LIST_NAMES:
+        codes = np.ascontiguousarray(strategy_codes[name])
+        digest.update(name.encode())
+        digest.update(str(codes.shape).encode())
+        digest.update(codes.tobytes())
+    return digest.hexdigest()[:32]
+
+def load_results_matrix(cache_dir: str, key: str, mmap: bool = True) -> Optional[np.ndarray]:
+    """
+    Loads the results matrix from a cache entry.
+
+    Args:
+        cache_dir (str): The cache directory.
+        key (str): The cache key from get_cache_key.
+        mmap (bool): True to memory-map the matrix read-only rather than reading it all into memory.
+
+    Returns:
+        Optional[np.ndarray]: The results matrix, or None if there is no valid entry for the key.
+    """
+    entry_dir = os.path.join(cache_dir, key)
+    if not os.path.isdir(entry_dir):
+        return None
+    try:
+        with open(os.path.join(entry_dir, _METADATA_FILE)) as file:
+            metadata = json.load(file)
+        if metadata["CACHE_VERSION"] != CACHE_VERSION:
+            raise ValueError(f"Cache version {metadata['CACHE_VERSION']} is not {CACHE_VERSION}")
+        matrix = np.load(os.path.join(entry_dir, _MATRIX_FILE), mmap_mode="r" if mmap else None)
+        if matrix.dtype != np.dtype(metadata[_DTYPE_FIELD]):
+            raise ValueError(f"Matrix dtype {matrix.dtype} is not {metadata[_DTYPE_FIELD]}")
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Discarding invalid cache entry {entry_dir}: {e}")
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        return None
+    # Mark the entry as recently used for eviction
+    os.utime(entry_dir)
+    return matrix
+
+def load_strategy_codes(cache_dir: str, key: str) -> dict[str, np.ndarray]:
+    """
+    Loads the encoded strategy lists from a cache entry.
+    """
+    with np.load(os.path.join(cache_dir, key, _STRATEGIES_FILE)) as strategies:
+        return {name: strategies[name] for name in STRATEGY_LIST_NAMES}
+
+def load_cache_parameters(cache_dir: str, key: str) -> CacheParameters:
+    """
+    Loads the configuration a cache entry was calculated with.
+    """
+    with open(os.path.join(cache_dir, key, _METADATA_FILE)) as file:
+        metadata = json.load(file)
+    metadata.pop(_DTYPE_FIELD, None)
+    return metadata
+
+def find_prior_entries(cache_dir: str, parameters: CacheParameters) -> list[str]:
+    """
+    Returns the keys of the cache entries calculated with the same game configuration as parameters, but possibly different max_len_strategies and limits, most recently used first.
+    The rows and columns of these matrices for strategy triples that are also in the new strategy lists can be reused, see match_strategy_triples.
+    """
+    if not os.path.isdir(cache_dir):
+        return []
+    game_parameters = {name: value for name, value in parameters.items() if name not in ("max_len_strategies", "limits")}
+    keys: list[tuple[float, str]] = []
+    for entry in os.scandir(cache_dir):
+        if not entry.is_dir() or entry.name.startswith("."):
+            continue
+        try:
+            prior_parameters = load_cache_parameters(cache_dir, entry.name)
+        except (OSError, ValueError):
+            continue
+        if all(prior_parameters.get(name) == value for name, value in game_parameters.items()):
+            keys.append((entry.stat().st_mtime, entry.name))
+    return [key for _, key in sorted(keys, reverse=True)]
+
+def match_strategy_triples(
+    prior_strategy_codes: Mapping[str, np.ndarray],
+    strategy_codes: Mapping[str, np.ndarray],
+    role: str,
+) -> np.ndarray:
+    """
+    Matches the dealer or non-dealer strategy triples (every combination of an open, a see or raise, and a see after a raise strategy, ordered as the simulator orders them) to the triples of a prior cache entry by their encoding.
+
+    Args:
+        prior_strategy_codes (Mapping[str, np.ndarray]): The encoded strategy lists of the prior entry, from load_strategy_codes.
+        strategy_codes (Mapping[str, np.ndarray]): The encoded strategy lists, from encode_strategy_lists.
+        role (str): "dealer" or "non_dealer".
+
+    Returns:
+        np.ndarray: For each triple, the index of the same triple in the prior entry, or -1 if it is new.
+    """
+    prior_indices: list[np.ndarray] = []
+    prior_sizes: list[int] = []
+    for strategy_type in ("open", "see", "raise"):
+        name = f"{role}_{strategy_type}"
+        prior_codes = prior_strategy_codes[name]
+        codes = strategy_codes[name]
+        prior_index = {row.tobytes(): index for index, row in enumerate(prior_codes)}
+        prior_indices.append(np.array([prior_index.get(row.tobytes(), -1) for row in codes], dtype=np.intp))
+        prior_sizes.append(len(prior_codes))
+    open_index, see_index, raise_index = np.ix_(*prior_indices)
+    triple_index = (open_index * prior_sizes[1] + see_index) * prior_sizes[2] + raise_index
+    is_new = (open_index < 0) | (see_index < 0) | (raise_index < 0)
+    return np.where(is_new, -1, triple_index).ravel()
+
+def save_results_matrix(
+    cache_dir: str,
+    key: str,
+    parameters: CacheParameters,
+    strategy_codes: Mapping[str, np.ndarray],
+    results_matrix: Any,
+    max_cache_bytes: int,
+) -> None:
+    """
+    Saves a results matrix and the encoded strategy lists it was calculated from as a cache entry, and then evicts entries if the cache is over its size cap.
+    The entry is written to a temporary directory and renamed into place, so a run that is interrupted, or another process reading the cache, never sees a partial entry.
+
+    Args:
+        cache_dir (str): The cache directory, which is created if necessary.
+        key (str): The cache key from get_cache_key.
+        parameters (CacheParameters): The configuration, from get_cache_parameters.
+        strategy_codes (Mapping[str, np.ndarray]): The encoded strategy lists, from encode_strategy_lists.
+        results_matrix (Any): The results matrix, as a NumPy array (saved in its own dtype without a copy, so a memory-mapped matrix is written straight from disk) or a list of rows.
+        max_cache_bytes (int): The size cap on the cache directory.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    entry_dir = os.path.join(cache_dir, key)
+    temp_dir = os.path.join(cache_dir, f".{key}.{os.getpid()}.tmp")
+    shutil.rmtree(temp_dir, ignore_errors=True)
+    os.makedirs(temp_dir)
+    results_array = np.asanyarray(results_matrix)
+    try:
+        with open(os.path.join(temp_dir, _METADATA_FILE), "w") as file:
+            json.dump({**parameters, _DTYPE_FIELD: results_array.dtype.str}, file, sort_keys=True, indent=4)
+        strategy_arrays: dict[str, Any] = {name: strategy_codes[name] for name in STRATEGY_LIST_NAMES}
+        np.savez(os.path.join(temp_dir, _STRATEGIES_FILE), **strategy_arrays)
+        np.save(os.path.join(temp_dir, _MATRIX_FILE), results_array)
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        os.replace(temp_dir, entry_dir)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    evict_cache_entries(cache_dir, max_cache_bytes, keep=key)
+
+def _entry_size(entry_dir: str) -> int:
+    return sum(entry.stat().st_size for entry in os.scandir(entry_dir) if entry.is_file())
+
+def evict_cache_entries(cache_dir: str, max_cache_bytes: int, keep: Optional[str] = None) -> list[str]:
+    """
+    Deletes the least recently used cache entries until the cache directory is no bigger than max_cache_bytes.
+
+    Args:
+        cache_dir (str): The cache directory.
+        max_cache_bytes (int): The size cap on the cache directory.
+        keep (Optional[str]): A key that is not evicted, e.g. the entry just saved.
+
+    Returns:
+        list[str]: The keys of the evicted entries.
+    """
+    if not os.path.isdir(cache_dir):
+        return []
+    entries = [entry for entry in os.scandir(cache_dir) if entry.is_dir() and not entry.name.startswith(".")]
+    sizes = {entry.name: _entry_size(entry.path) for entry in entries}
+    total_size = sum(sizes.values())
+    evicted: list[str] = []
+    # Oldest first
+    for entry in sorted(entries, key=lambda entry: entry.stat().st_mtime):
+        if total_size <= max_cache_bytes:
+            break
+        if entry.name == keep:
+            continue
+        shutil.rmtree(entry.path, ignore_errors=True)
+        total_size -= sizes[entry.name]
+        evicted.append(entry.name)
+    return evicted
+
+def clear_cache(cache_dir: str) -> None:
+    """
+    Deletes all cache entries.
+    """
+    shutil.rmtree(cache_dir, ignore_errors=True)
@@ -0,0 +1,66 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+import numpy as np
+
+from matrix_cache import get_cache_parameters, encode_strategy_lists, get_cache_key, load_results_matrix, load_strategy_codes, save_results_matrix, evict_cache_entries
+from utilities import generate_possible_lists
+
+
+class TestMatrixCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir, ignore_errors=True)
+        open_list = generate_possible_lists(2, "HML", "345")
+        see_list = generate_possible_lists(2, "HMS", "345")
+        raise_list = generate_possible_lists(2, "S")
+        self.strategy_codes = encode_strategy_lists((open_list, see_list, raise_list, open_list, see_list, raise_list))
+        self.parameters = get_cache_parameters(2, "345")
+        self.key = get_cache_key(self.parameters, self.strategy_codes)
+
+    def test_save_and_load(self):
+        self.assertIsNone(load_results_matrix(self.cache_dir, self.key))
+        matrix = np.arange(12, dtype=np.float64).reshape(3, 4) / 7
+        save_results_matrix(self.cache_dir, self.key, self.parameters, self.strategy_codes, matrix.tolist(), 2**30)
+        loaded = load_results_matrix(self.cache_dir, self.key)
+        assert loaded is not None
+        self.assertEqual(loaded.tolist(), matrix.tolist())
+        for name, codes in load_strategy_codes(self.cache_dir, self.key).items():
+            self.assertTrue((codes == self.strategy_codes[name]).all())
+
+    def test_matrix_is_saved_in_its_own_dtype(self):
+        matrix = np.lib.format.open_memmap(os.path.join(self.cache_dir, "matrix.npy"), mode="w+", dtype=np.float32, shape=(3, 4))
+        matrix[:] = np.arange(12).reshape(3, 4) / 8
+        save_results_matrix(self.cache_dir, self.key, self.parameters, self.strategy_codes, matrix, 2**30)
+        loaded = load_results_matrix(self.cache_dir, self.key)
+        assert loaded is not None
+        self.assertEqual(loaded.dtype, np.float32)
+        self.assertEqual(loaded.tolist(), matrix.tolist())
+        del matrix
+
+    def test_key_depends_on_configuration(self):
+        self.assertNotEqual(get_cache_key(get_cache_parameters(2, "888"), self.strategy_codes), self.key)
+        self.assertEqual(get_cache_key(get_cache_parameters(2, "345"), self.strategy_codes), self.key)
+
+    def test_invalid_entry_is_discarded(self):
+        save_results_matrix(self.cache_dir, self.key, self.parameters, self.strategy_codes, [[1.0]], 2**30)
+        os.remove(os.path.join(self.cache_dir, self.key, "matrix.npy"))
+        self.assertIsNone(load_results_matrix(self.cache_dir, self.key))
+        self.assertFalse(os.path.exists(os.path.join(self.cache_dir, self.key)))
+
+    def test_least_recently_used_entries_are_evicted(self):
+        matrix = np.zeros((100, 100))
+        for key in ("a", "b", "c"):
+            save_results_matrix(self.cache_dir, key, self.parameters, self.strategy_codes, matrix, 2**30)
+            time.sleep(0.01)
+        # Use "a" so "b" is the least recently used entry
+        load_results_matrix(self.cache_dir, "a")
+        entry_size = sum(entry.stat().st_size for entry in os.scandir(os.path.join(self.cache_dir, "a")))
+        self.assertEqual(evict_cache_entries(self.cache_dir, 2 * entry_size), ["b"])
+        self.assertEqual(sorted(os.listdir(self.cache_dir)), ["a", "c"])
+
+if __name__ == '__main__':
+    unittest.main()
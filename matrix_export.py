@@ -0,0 +1,181 @@
+"""
+Exports of the dealer vs. non-dealer strategies matrix, as a CSV streamed one row at a time, or as a binary export.
+
+The CSV has the dealer strategies in the first three rows and the non-dealer strategies in the first three columns, from the fifth row or column on, with the percentages in the fourth row and column and the results matrix below and to the right.
+
+The binary export is a directory holding:
+- metadata.json: The shape of the matrix, the best gains per round and the bet options the strategies were encoded with.
+- matrix.npy: The float32 results matrix, with one row per non-dealer strategy set and one column per dealer strategy set.
+- rows.npy, cols.npy: The index of each row (column) in the product of the non-dealer (dealer) open, see or raise, and see after a raise strategy lists, which is just 0, 1, 2, ... unless only a restricted game was calculated.
+- non_dealer_percentages.npy, dealer_percentages.npy: The optimal percentage for each row (column).
+- strategies.npz: The six strategy lists encoded by strategy_encoding.encode_strategy_list, named as in matrix_cache.STRATEGY_LIST_NAMES.
+
+The .npy files are loaded memory-mapped by default, so opening even a very large export is instant and only the parts used are read from disk.
+"""
+
+from typing import Any, Mapping, Optional, TypedDict
+import csv
+import json
+import os
+import shutil
+import numpy as np
+
+from configuration import OPEN_BET_OPTIONS, SEE_BET_OPTIONS
+from matrix_cache import STRATEGY_LIST_NAMES
+from strategy_encoding import decode_strategy, decode_strategy_list
+
+# The data type of the exported results matrix
+EXPORT_MATRIX_TYPE = np.float32
+
+_METADATA_FILE = "metadata.json"
+_STRATEGIES_FILE = "strategies.npz"
+_ARRAY_FILES = {
+    "Results_Matrix": "matrix.npy",
+    "Rows": "rows.npy",
+    "Cols": "cols.npy",
+    "Non_Dealer_Percentages": "non_dealer_percentages.npy",
+    "Dealer_Percentages": "dealer_percentages.npy",
+}
+
+class StrategiesMatrix(TypedDict):
+    Results_Matrix: np.ndarray # The dealer gain per round for each non-dealer (row) and dealer (column) strategy set
+    Rows: np.ndarray # The index of each row in the product of the non-dealer strategy lists
+    Cols: np.ndarray # The index of each column in the product of the dealer strategy lists
+    Non_Dealer_Percentages: np.ndarray # The optimal percentage for each row
+    Dealer_Percentages: np.ndarray # The optimal percentage for each column
+    Non_Dealer_Best_Gain: float
+    Dealer_Best_Gain: float
+    Strategy_Codes: dict[str, np.ndarray] # The six strategy lists encoded by matrix_cache.encode_strategy_lists
+
+def download_strategies_matrix(file_path: str, strategies_matrix: StrategiesMatrix) -> None:
+    """
+    Downloads the strategies matrix to a CSV file, writing the header rows and then one row of results at a time.
+    Each strategy list is decoded once and the rows and columns refer to its strategies, so no matrix of strategies and results is built in memory.
+
+    Args:
+        file_path (str): The file path to save the CSV file.
+        strategies_matrix (StrategiesMatrix): The results matrix, strategies and percentages.
+    """
+    strategy_codes = strategies_matrix["Strategy_Codes"]
+
+    def strategy_sets(role: str, indices: np.ndarray):
+        strategy_lists = [
+            decode_strategy_list(strategy_codes[f"{role}_{strategy_type}"], bet_options)
+            for strategy_type, bet_options in zip(("open", "see", "raise"), (OPEN_BET_OPTIONS, SEE_BET_OPTIONS, SEE_BET_OPTIONS))
+        ]
+        list_indices = np.unravel_index(np.asarray(indices), tuple(len(strategy_list) for strategy_list in strategy_lists))
+        return [[strategy_list[index] for index in list_index.tolist()] for strategy_list, list_index in zip(strategy_lists, list_indices)]
+
+    dealer_open, dealer_see, dealer_raise = strategy_sets("dealer", strategies_matrix["Cols"])
+    try:
+        with open(file_path, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(["", "Dealer Best Gain per Round ", strategies_matrix["Dealer_Best_Gain"], "Dealer Open", *dealer_open])
+            writer.writerow(["Non-Dealer Best Gain per Round", "", "", "Dealer See", *dealer_see])
+            writer.writerow([strategies_matrix["Non_Dealer_Best_Gain"], "", "", "Dealer Raise", *dealer_raise])
+            writer.writerow(["Non-Dealer Open", "Non-Dealer See", "Non-Dealer Raise", "Percentages", *np.asarray(strategies_matrix["Dealer_Percentages"], dtype=np.float64).tolist()])
+            del dealer_open, dealer_see, dealer_raise
+            non_dealer_sets = zip(*strategy_sets("non_dealer", strategies_matrix["Rows"]))
+            non_dealer_percentages = np.asarray(strategies_matrix["Non_Dealer_Percentages"], dtype=np.float64).tolist()
+            for non_dealer_set, percentage, row in zip(non_dealer_sets, non_dealer_percentages, strategies_matrix["Results_Matrix"]):
+                # The results are calculated to 4 decimal places, which also drops the float32 rounding error of a binary export
+                writer.writerow([*non_dealer_set, percentage, *np.asarray(row, dtype=np.float64).round(4).tolist()])
+    except PermissionError:
+        input(f"Please close the file {file_path} and press Enter to continue...")
+    except Exception as e:
+        print(f"An unexpected error occurred: {e}")
+
+def save_strategies_matrix(dir_path: str, strategies_matrix: StrategiesMatrix) -> None:
+    """
+    Saves the strategies matrix as a binary export directory, replacing any existing export at the path.
+    The export is written to a temporary directory and renamed into place, so a reader never sees a partial export.
+    An I/O error is reported rather than raised, as for the CSV, so it does not lose a completed run.
+
+    Args:
+        dir_path (str): The export directory.
+        strategies_matrix (StrategiesMatrix): The results matrix, strategies and percentages.
+    """
+    dir_path = os.path.abspath(dir_path)
+    temp_dir = f"{dir_path}.{os.getpid()}.tmp"
+    shutil.rmtree(temp_dir, ignore_errors=True)
+    results_matrix = strategies_matrix["Results_Matrix"]
+    try:
+        os.makedirs(temp_dir)
+        metadata = {
+            "Shape": list(np.shape(results_matrix)),
+            "Non_Dealer_Best_Gain": float(strategies_matrix["Non_Dealer_Best_Gain"]),
+            "Dealer_Best_Gain": float(strategies_matrix["Dealer_Best_Gain"]),
+            "OPEN_BET_OPTIONS": dict(OPEN_BET_OPTIONS),
+            "SEE_BET_OPTIONS": dict(SEE_BET_OPTIONS),
+        }
+        with open(os.path.join(temp_dir, _METADATA_FILE), "w") as file:
+            json.dump(metadata, file, indent=4)
+        for name, file_name in _ARRAY_FILES.items():
+            dtype = EXPORT_MATRIX_TYPE if name == "Results_Matrix" else np.intp if name in ("Rows", "Cols") else np.float64
+            np.save(os.path.join(temp_dir, file_name), np.asarray(strategies_matrix[name], dtype=dtype))
+        strategy_arrays: dict[str, Any] = {name: strategies_matrix["Strategy_Codes"][name] for name in STRATEGY_LIST_NAMES}
+        np.savez(os.path.join(temp_dir, _STRATEGIES_FILE), **strategy_arrays)
+        shutil.rmtree(dir_path, ignore_errors=True)
+        os.replace(temp_dir, dir_path)
+    except OSError as e:
+        print(f"An error occurred saving the binary export to {dir_path}: {e}")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+def load_strategies_matrix(dir_path: str, mmap: bool = True) -> StrategiesMatrix:
+    """
+    Loads a binary export saved by save_strategies_matrix.
+
+    Args:
+        dir_path (str): The export directory.
+        mmap (bool): True to memory-map the arrays read-only rather than reading them all into memory.
+
+    Returns:
+        StrategiesMatrix: The results matrix, strategies and percentages.
+    """
+    with open(os.path.join(dir_path, _METADATA_FILE)) as file:
+        metadata = json.load(file)
+    arrays = {
+        name: np.load(os.path.join(dir_path, file_name), mmap_mode="r" if mmap else None)
+        for name, file_name in _ARRAY_FILES.items()
+    }
+    with np.load(os.path.join(dir_path, _STRATEGIES_FILE)) as strategies:
+        strategy_codes = {name: strategies[name] for name in STRATEGY_LIST_NAMES}
+    return {
+        "Results_Matrix": arrays["Results_Matrix"],
+        "Rows": arrays["Rows"],
+        "Cols": arrays["Cols"],
+        "Non_Dealer_Percentages": arrays["Non_Dealer_Percentages"],
+        "Dealer_Percentages": arrays["Dealer_Percentages"],
+        "Non_Dealer_Best_Gain": metadata["Non_Dealer_Best_Gain"],
+        "Dealer_Best_Gain": metadata["Dealer_Best_Gain"],
+        "Strategy_Codes": strategy_codes,
+    }
+
+def decode_strategy_triple(
+    strategy_codes: Mapping[str, np.ndarray],
+    role: str,
+    index: int,
+    bet_options: Optional[tuple[Mapping[str, float], Mapping[str, float]]] = None,
+) -> tuple[dict[int, str], dict[int, str], dict[int, str]]:
+    """
+    Decodes the open, see or raise, and see after a raise strategies of a dealer or non-dealer strategy set from its index in the product of the strategy lists, e.g. a value in Rows or Cols.
+
+    Args:
+        strategy_codes (Mapping[str, np.ndarray]): The encoded strategy lists, e.g. Strategy_Codes of an export.
+        role (str): "dealer" or "non_dealer".
+        index (int): The index of the strategy set in the product of the strategy lists.
+        bet_options (Optional[tuple[Mapping[str, float], Mapping[str, float]]]): The open and see bet options the strategies were encoded with. Defaults to OPEN_BET_OPTIONS and SEE_BET_OPTIONS.
+
+    Returns:
+        tuple[dict[int, str], dict[int, str], dict[int, str]]: The open, see or raise, and see after a raise strategies.
+    """
+    open_options, see_options = bet_options or (OPEN_BET_OPTIONS, SEE_BET_OPTIONS)
+    open_codes, see_codes, raise_codes = (strategy_codes[f"{role}_{strategy_type}"] for strategy_type in ("open", "see", "raise"))
+    open_index, rest = divmod(int(index), len(see_codes) * len(raise_codes))
+    see_index, raise_index = divmod(rest, len(raise_codes))
+    return (
+        decode_strategy(open_codes[open_index], open_options),
+        decode_strategy(see_codes[see_index], see_options),
+        decode_strategy(raise_codes[raise_index], see_options),
+    )
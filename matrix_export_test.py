@@ -0,0 +1,75 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+import numpy as np
+
+from configuration import OPEN_BET_OPTIONS, SEE_BET_OPTIONS
+from matrix_cache import encode_strategy_lists
+from matrix_export import download_strategies_matrix, save_strategies_matrix, load_strategies_matrix, decode_strategy_triple
+from matrix_store import MatrixStore
+from utilities import generate_possible_lists
+
+class TestMatrixExport(unittest.TestCase):
+
+    def setUp(self):
+        self.open_list = generate_possible_lists(2, "HL", "22")
+        self.see_list = generate_possible_lists(2, "HS", "22")
+        self.raise_list = generate_possible_lists(1, "S")
+        num_triples = len(self.open_list) * len(self.see_list) * len(self.raise_list)
+        rng = np.random.default_rng(0)
+        self.strategies_matrix = {
+            "Results_Matrix": rng.normal(size=(num_triples, num_triples)).round(4),
+            "Rows": np.arange(num_triples),
+            "Cols": np.arange(num_triples),
+            "Non_Dealer_Percentages": rng.dirichlet(np.ones(num_triples)),
+            "Dealer_Percentages": rng.dirichlet(np.ones(num_triples)),
+            "Non_Dealer_Best_Gain": -0.25,
+            "Dealer_Best_Gain": 0.25,
+            "Strategy_Codes": encode_strategy_lists([self.open_list, self.see_list, self.raise_list] * 2),
+        }
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            dir_path = os.path.join(temp_dir, "export")
+            save_strategies_matrix(dir_path, self.strategies_matrix)  # type: ignore
+            loaded = load_strategies_matrix(dir_path)
+            self.assertIsInstance(loaded["Results_Matrix"], np.memmap)
+            self.assertEqual(loaded["Results_Matrix"].dtype, np.float32)
+            np.testing.assert_allclose(loaded["Results_Matrix"], self.strategies_matrix["Results_Matrix"], atol=1e-6)
+            np.testing.assert_array_equal(loaded["Rows"], self.strategies_matrix["Rows"])
+            np.testing.assert_allclose(loaded["Dealer_Percentages"], self.strategies_matrix["Dealer_Percentages"])
+            self.assertEqual(loaded["Dealer_Best_Gain"], 0.25)
+            del loaded
+
+    def test_save_error_is_reported(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "file")
+            open(file_path, "w").close()
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                save_strategies_matrix(os.path.join(file_path, "export"), self.strategies_matrix)  # type: ignore
+            self.assertIn("An error occurred saving the binary export", output.getvalue())
+            self.assertEqual(os.listdir(temp_dir), ["file"])
+
+    def test_download_csv(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "matrix.csv")
+            download_strategies_matrix(file_path, self.strategies_matrix)  # type: ignore
+            store = MatrixStore.from_csv(file_path)
+        np.testing.assert_array_equal(store.results_matrix, self.strategies_matrix["Results_Matrix"])
+        np.testing.assert_array_equal(store.dealer_percentages, self.strategies_matrix["Dealer_Percentages"])
+        self.assertEqual(store.non_dealer_best_gain, -0.25)
+        self.assertEqual(store.dealer_strategy_sets[5], decode_strategy_triple(self.strategies_matrix["Strategy_Codes"], "dealer", 5))
+
+    def test_decode_strategy_triple(self):
+        codes = self.strategies_matrix["Strategy_Codes"]
+        triples = [
+            (open_strategy, see_strategy, raise_strategy)
+            for open_strategy in self.open_list for see_strategy in self.see_list for raise_strategy in self.raise_list
+        ]
+        for index, triple in enumerate(triples):
+            self.assertEqual(decode_strategy_triple(codes, "dealer", index, (OPEN_BET_OPTIONS, SEE_BET_OPTIONS)), triple)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,35 @@
-from typing import Literal
+from typing import Callable, Literal, TypedDict
 import numpy as np
 from scipy.optimize import linprog # type: ignore
 
 Player_Type = Literal["dealer", "non-dealer"]
 
+class OptimalStrategies(TypedDict):
+    Dealer_Percentages: np.ndarray # One percentage per dealer strategy set, i.e., per column of the results matrix
+    Non_Dealer_Percentages: np.ndarray # One percentage per non-dealer strategy set, i.e., per row of the results matrix
+    Dealer_Best_Gain: float # The maximum dealer gain when the non-dealer plays their optimal percentages
+    Non_Dealer_Best_Gain: float # The maximum non-dealer gain when the dealer plays their optimal percentages
+
+class ApproximateStrategies(OptimalStrategies):
+    Exploitability: float # Dealer_Best_Gain + Non_Dealer_Best_Gain, i.e., the most either player could gain, in total, by deviating from their percentages, which is 0 at an exact solution
+    Iterations: int # The number of iterations run
+
+class DoubleOracleStrategies(ApproximateStrategies):
+    Rows: np.ndarray # The indices of the non-dealer strategies in the restricted game, in the order they were added
+    Cols: np.ndarray # The indices of the dealer strategies in the restricted game, in the order they were added
+    Results_Matrix: np.ndarray # The results matrix of the restricted game, with the percentages in Dealer_Percentages and Non_Dealer_Percentages
+
+def _build_strategy_sum_matrix(results_matrix: np.ndarray, r: int) -> np.ndarray:
+    """
+    Builds the inequality constraint matrix with one row per row of results_matrix, holding r times the row, followed by -1 for the maximum/minimum sum variable.
+    The matrix is filled in place, so a transposed view of the results matrix is copied once, straight into the constraint matrix.
+    """
+    m, n = results_matrix.shape
+    strategy_sum_matrix = np.empty((m, n + 1))
+    np.multiply(results_matrix, r, out=strategy_sum_matrix[:, :-1])
+    strategy_sum_matrix[:, -1] = -1
+    return strategy_sum_matrix
+
 def calc_optimal_strategy_combo( \
     results_matrix: np.ndarray, \
     player_being_analyzed: Player_Type \
@@ -67,15 +93,6 @@ def calc_optimal_strategy_combo( \
 
     num_rows, num_cols = results_matrix.shape    
     
-    # Objective function: The probability variable are multiplied by 0 and only the maximum/minimum value variable is multiplied by 1
-    obj_fn = np.zeros((1, num_rows + 1)) # 1 row of (num_rows + 1) columns all containing 0
-    obj_fn[-1] = 1  # Multiply the the last variable by 1 as it is the maximum/minimum value we want to minimize
-    
-    # Constraints: The probability variable are multiplied by 1 and the maximum/minimum value variable is multiplied by 0
-    sum_of_prob_fn = np.ones((1, num_rows + 1)) # 1 row of (num_rows + 1) columns all containing 1
-    sum_of_prob_fn[0, -1] = 0 # Set the last element of the row to 0, so that the maximum/minimum value is not included in the sum
-    sum_of_prob_eq = np.array([1]) # The sum of the percentages must be 1
-    
     if player_being_analyzed == "non-dealer":
         m = num_cols
         n = num_rows
@@ -86,15 +103,22 @@ def calc_optimal_strategy_combo( \
         n = num_cols
         r = -1
     
+    # There is one probability variable per strategy of the player being analyzed, i.e. n, which is not num_rows if the matrix is not square, e.g. after dominated strategies are removed
+    # Objective function: The probability variable are multiplied by 0 and only the maximum/minimum value variable is multiplied by 1
+    obj_fn = np.zeros(n + 1) # (n + 1) elements all containing 0
+    obj_fn[-1] = 1  # Multiply the the last variable by 1 as it is the maximum/minimum value we want to minimize
+    
+    # Constraints: The probability variable are multiplied by 1 and the maximum/minimum value variable is multiplied by 0
+    sum_of_prob_fn = np.ones((1, n + 1)) # 1 row of (n + 1) columns all containing 1
+    sum_of_prob_fn[0, -1] = 0 # Set the last element of the row to 0, so that the maximum/minimum value is not included in the sum
+    sum_of_prob_eq = np.array([1]) # The sum of the percentages must be 1
+    
     # Constraints: The probability values are multiplied by the corresponding strategy result and the maximum/minimum sum variable is multiplied by -1
-    strategy_sum_matrix = np.zeros((m, n + 1))
-    for j in range(m):
-        strategy_sum_matrix[j, :-1] = r * results_matrix[j, :]
-        strategy_sum_matrix[j, -1] = -1
+    strategy_sum_matrix = _build_strategy_sum_matrix(results_matrix, r)
     strategy_sum_result_matrix = np.zeros(m) # Each row equation is less than 0
     
     # Bounds for the variables: The percentage variables between 0 and 1, i.e, (0,1), and the maximum/minimum value is unbounded, i.e. (None, None)
-    bounds = [(0, 1) for _ in range(num_rows)] + [(None, None)]
+    bounds = [(0, 1) for _ in range(n)] + [(None, None)]
     
     # Solve the linear programming problem
     result = linprog(obj_fn, A_ub=strategy_sum_matrix, b_ub=strategy_sum_result_matrix, A_eq=sum_of_prob_fn, b_eq=sum_of_prob_eq, bounds=bounds, method='highs')
@@ -106,6 +130,311 @@ def calc_optimal_strategy_combo( \
     else:
         raise ValueError("Optimization failed")
 
+def calc_optimal_strategy_combos(results_matrix: np.ndarray) -> OptimalStrategies:
+    
+    """
+    Calculates the optimal percentages for both players, and each player's best-case gain, from one linear program.
+    The result is the same as calling calc_optimal_strategy_combo for "dealer" and for "non-dealer", but takes one solve rather than two.
+
+    The linear program is the "non-dealer" program described in calc_optimal_strategy_combo, i.e., the non-dealer chooses row percentages to minimize the maximum dealer gain over the columns.
+    Its solution gives the non-dealer percentages and the dealer best-case gain.
+    Each inequality constraint corresponds to a dealer strategy (column), and the dual values (marginals) HiGHS reports for these constraints are the dealer's optimal column percentages, i.e., the solution of the "dealer" program, whose value is the same gain with the sign reversed.
+
+    args: 
+    - results_matrix (np array): The results matrix as described in calc_optimal_strategy_combo.
+
+    Returns:
+        OptimalStrategies: The percentages for each dealer and non-dealer strategy, and the best-case gains with the same signs as returned by calc_optimal_strategy_combo.
+    """
+
+    num_rows, num_cols = results_matrix.shape
+
+    # Objective function: Minimize the maximum sum variable
+    obj_fn = np.zeros(num_rows + 1)
+    obj_fn[-1] = 1
+    # Constraints: The non-dealer percentages sum to 1
+    sum_of_prob_fn = np.ones((1, num_rows + 1))
+    sum_of_prob_fn[0, -1] = 0
+    sum_of_prob_eq = np.array([1])
+    # Constraints: For each dealer strategy (column), the sum of the column results multiplied by the percentages is less than the maximum
+    strategy_sum_matrix = _build_strategy_sum_matrix(results_matrix.T, 1)
+    strategy_sum_result_matrix = np.zeros(num_cols)
+    bounds = [(0, 1) for _ in range(num_rows)] + [(None, None)]
+
+    result = linprog(obj_fn, A_ub=strategy_sum_matrix, b_ub=strategy_sum_result_matrix, A_eq=sum_of_prob_fn, b_eq=sum_of_prob_eq, bounds=bounds, method='highs')
+
+    if not result.success:
+        raise ValueError("Optimization failed")
+    dealer_best_gain = float(result.x[-1])
+    # The marginals are the (non-positive) changes in the objective per unit increase in each constraint bound, so the dealer percentages are their negatives
+    return {
+        "Dealer_Percentages": -result.ineqlin.marginals,
+        "Non_Dealer_Percentages": result.x[:-1],
+        "Dealer_Best_Gain": dealer_best_gain,
+        "Non_Dealer_Best_Gain": -dealer_best_gain,
+    }
+
+def _row_gains(results_matrix: np.ndarray, dealer_percentages: np.ndarray, block_rows: int) -> np.ndarray:
+    """
+    Returns results_matrix @ dealer_percentages, reading the matrix in blocks of rows so a memory-mapped matrix is never read into memory in full.
+    """
+    row_gains = np.empty(results_matrix.shape[0])
+    for start in range(0, results_matrix.shape[0], block_rows):
+        row_gains[start:start + block_rows] = np.asarray(results_matrix[start:start + block_rows], dtype=np.float64) @ dealer_percentages
+    return row_gains
+
+def _col_gains(results_matrix: np.ndarray, non_dealer_percentages: np.ndarray, block_rows: int) -> np.ndarray:
+    """
+    Returns non_dealer_percentages @ results_matrix, reading the matrix in blocks of rows.
+    """
+    col_gains = np.zeros(results_matrix.shape[1])
+    for start in range(0, results_matrix.shape[0], block_rows):
+        col_gains += non_dealer_percentages[start:start + block_rows] @ np.asarray(results_matrix[start:start + block_rows], dtype=np.float64)
+    return col_gains
+
+def calc_approximate_strategy_combos(
+    results_matrix: np.ndarray,
+    epsilon: float = 1e-4,
+    max_iterations: int = 100_000,
+    max_block_cells: int = 2 ** 22,
+) -> ApproximateStrategies:
+    
+    """
+    Calculates approximately optimal percentages for both players by regret matching, for matrices too big for the linear program in calc_optimal_strategy_combos.
+    Each iteration calculates the gain of every strategy against the other player's current percentages, which is a pass over the results matrix per player, so the matrix can be memory-mapped, e.g. from the matrix cache, and no linear program is built.
+    The players take turns to move their percentages towards the strategies they regret not having played (alternating regret matching+), and the reported percentages are the averages over the iterations, weighted towards later iterations.
+
+    The average percentages have a known quality: the dealer's percentages guarantee a dealer gain of at least the lowest row gain, and the non-dealer's percentages guarantee a dealer gain of at most the highest column gain.
+    The value of the game is between the two, and the iterations stop when the difference between them, i.e. the exploitability, is no more than epsilon.
+
+    args:
+    - results_matrix (np array): The results matrix as described in calc_optimal_strategy_combo.
+    - epsilon (float): The exploitability at which to stop.
+    - max_iterations (int): The maximum number of iterations, after which the percentages are returned with their exploitability even if it is above epsilon.
+    - max_block_cells (int): The maximum number of matrix cells read at once.
+
+    Returns:
+        ApproximateStrategies: The percentages and best-case gains as returned by calc_optimal_strategy_combos, plus the exploitability and the number of iterations.
+    """
+
+    num_rows, num_cols = results_matrix.shape
+    block_rows = max(1, max_block_cells // num_cols)
+    dealer_regrets = np.zeros(num_cols)
+    non_dealer_regrets = np.zeros(num_rows)
+    dealer_percentages = np.full(num_cols, 1 / num_cols)
+    non_dealer_percentages = np.full(num_rows, 1 / num_rows)
+    # Weighted sums over the iterations of each player's percentages, and of the gains against them
+    # The gains are linear in the percentages, so the gains against the average percentages are the averages of the gains
+    dealer_percentage_sum = np.zeros(num_cols)
+    row_gain_sum = np.zeros(num_rows)
+    dealer_weight_sum = 0.0
+    non_dealer_percentage_sum = np.zeros(num_rows)
+    col_gain_sum = np.zeros(num_cols)
+    non_dealer_weight_sum = 0.0
+    average_non_dealer_percentages = non_dealer_percentages
+    # The best-case gains against the average percentages, which are calculated from the second iteration on
+    dealer_best_gain = non_dealer_best_gain = exploitability = np.inf
+    iteration = 0
+
+    # At least two iterations are run as the non-dealer average starts on the second
+    for iteration in range(1, max(2, max_iterations) + 1):
+        # The dealer gain of each dealer strategy (column) against the non-dealer percentages of the previous iteration
+        col_gains = _col_gains(results_matrix, non_dealer_percentages, block_rows)
+        if iteration > 1:
+            non_dealer_weight_sum += iteration - 1
+            non_dealer_percentage_sum += (iteration - 1) * non_dealer_percentages
+            col_gain_sum += (iteration - 1) * col_gains
+            average_non_dealer_percentages = non_dealer_percentage_sum / non_dealer_weight_sum
+        # The dealer regrets not playing columns with a higher dealer gain
+        dealer_regrets = np.maximum(dealer_regrets + col_gains - col_gains @ dealer_percentages, 0)
+        if dealer_regrets.sum() > 0:
+            dealer_percentages = dealer_regrets / dealer_regrets.sum()
+
+        # The dealer gain of each non-dealer strategy (row) against the new dealer percentages
+        row_gains = _row_gains(results_matrix, dealer_percentages, block_rows)
+        dealer_weight_sum += iteration
+        dealer_percentage_sum += iteration * dealer_percentages
+        row_gain_sum += iteration * row_gains
+        # The non-dealer regrets not playing rows with a lower dealer gain
+        non_dealer_regrets = np.maximum(non_dealer_regrets + row_gains @ non_dealer_percentages - row_gains, 0)
+        if non_dealer_regrets.sum() > 0:
+            non_dealer_percentages = non_dealer_regrets / non_dealer_regrets.sum()
+
+        if iteration > 1:
+            dealer_best_gain = col_gain_sum.max() / non_dealer_weight_sum
+            non_dealer_best_gain = -row_gain_sum.min() / dealer_weight_sum
+            exploitability = dealer_best_gain + non_dealer_best_gain
+            if exploitability <= epsilon:
+                break
+
+    return {
+        "Dealer_Percentages": dealer_percentage_sum / dealer_weight_sum,
+        "Non_Dealer_Percentages": average_non_dealer_percentages,
+        "Dealer_Best_Gain": float(dealer_best_gain),
+        "Non_Dealer_Best_Gain": float(non_dealer_best_gain),
+        "Exploitability": float(exploitability),
+        "Iterations": iteration,
+    }
+
+def calc_double_oracle_strategy_combos(
+    num_rows: int,
+    num_cols: int,
+    calc_rows: Callable[[np.ndarray], np.ndarray],
+    calc_cols: Callable[[np.ndarray], np.ndarray],
+    epsilon: float = 1e-6,
+    max_iterations: int = 1000,
+) -> DoubleOracleStrategies:
+    
+    """
+    Calculates optimal percentages for both players without calculating the whole results matrix, using the double oracle method.
+    The game is restricted to a few strategies for each player, starting with the first row and column, and solved with calc_optimal_strategy_combos.
+    Each player's best response to the other player's percentages is then found from every strategy in the full game, and added to the restricted game, until neither best response improves on the restricted game's solution by more than epsilon.
+    Only the rows and columns of the results matrix for the strategies in the restricted game are calculated, which is usually a small part of the matrix.
+
+    args:
+    - num_rows (int): The number of non-dealer strategies (rows) in the full results matrix.
+    - num_cols (int): The number of dealer strategies (columns) in the full results matrix.
+    - calc_rows (Callable): Returns the full rows of the results matrix for an array of row indices.
+    - calc_cols (Callable): Returns the full columns of the results matrix for an array of column indices, as a matrix with one column per index.
+    - epsilon (float): The exploitability at which to stop.
+    - max_iterations (int): The maximum number of restricted games solved.
+
+    Returns:
+        DoubleOracleStrategies: The restricted game with its percentages, and the best-case gains and exploitability of the percentages in the full game.
+    """
+
+    rows = [0]
+    cols = [0]
+    full_rows = calc_rows(np.array(rows))
+    full_cols = calc_cols(np.array(cols))
+    # At least one restricted game is solved
+    iteration = 0
+    while True:
+        iteration += 1
+        optimal_strategies = calc_optimal_strategy_combos(full_rows[:, cols])
+        # The dealer gain of every dealer strategy against the non-dealer percentages, and of every non-dealer strategy against the dealer percentages
+        col_gains = optimal_strategies["Non_Dealer_Percentages"] @ full_rows
+        row_gains = full_cols @ optimal_strategies["Dealer_Percentages"]
+        best_col = int(np.argmax(col_gains))
+        best_row = int(np.argmin(row_gains))
+        dealer_best_gain = float(col_gains[best_col])
+        non_dealer_best_gain = float(-row_gains[best_row])
+        exploitability = dealer_best_gain + non_dealer_best_gain
+        is_new_col = best_col not in cols
+        is_new_row = best_row not in rows
+        if exploitability <= epsilon or not (is_new_col or is_new_row) or iteration >= max_iterations:
+            break
+        # Add the best responses to the restricted game
+        if is_new_col:
+            cols.append(best_col)
+            full_cols = np.hstack([full_cols, calc_cols(np.array([best_col]))])
+        if is_new_row:
+            rows.append(best_row)
+            full_rows = np.vstack([full_rows, calc_rows(np.array([best_row]))])
+
+    return {
+        "Dealer_Percentages": optimal_strategies["Dealer_Percentages"],
+        "Non_Dealer_Percentages": optimal_strategies["Non_Dealer_Percentages"],
+        "Dealer_Best_Gain": dealer_best_gain,
+        "Non_Dealer_Best_Gain": non_dealer_best_gain,
+        "Exploitability": exploitability,
+        "Iterations": iteration,
+        "Rows": np.array(rows),
+        "Cols": np.array(cols),
+        "Results_Matrix": full_rows[:, cols],
+    }
+
+def _read_block(results_matrix: np.ndarray, rows: np.ndarray, cols: np.ndarray, is_transposed: bool) -> np.ndarray:
+    """
+    Returns the block of the matrix at the given rows and columns as float64.
+    If is_transposed, rows and cols index the columns and rows of the matrix, and the block is transposed and negated, so the columns are compared as rows by a player who wants to minimize the value.
+    """
+    if is_transposed:
+        # Fancy indexing copies the block, so it is negated in place
+        block = np.asarray(results_matrix[np.ix_(cols, rows)], dtype=np.float64)
+        return np.negative(block, out=block).T
+    return np.asarray(results_matrix[np.ix_(rows, cols)], dtype=np.float64)
+
+def _find_dominated_rows(
+    results_matrix: np.ndarray,
+    rows: np.ndarray,
+    cols: np.ndarray,
+    is_transposed: bool,
+    max_dominators: int,
+    sample_size: int,
+    max_block_cells: int,
+) -> np.ndarray:
+    """
+    Finds the rows of the block of a matrix at rows and cols (see _read_block) that are dominated for a player who wants to minimize the value, i.e., rows where another row is no greater in every column.
+    A row equal to another row is dominated by the first of the two, so only one copy of duplicate rows is kept.
+    Only the max_dominators rows with the lowest sums are tried as dominating rows, since a dominating row has a lower sum than the rows it dominates.
+    Each of these is first compared with every row on a sample of sample_size columns, and only the rows that pass are compared on every column.
+    The block is read in blocks of at most max_block_cells cells, so a memory-mapped matrix is never read into memory in full.
+
+    Returns:
+        np.ndarray: A boolean mask of the dominated rows, indexed as rows.
+    """
+    num_rows, num_cols = len(rows), len(cols)
+    block_rows = max(1, max_block_cells // max(1, num_cols))
+    row_sums = np.empty(num_rows)
+    for start in range(0, num_rows, block_rows):
+        row_sums[start:start + block_rows] = _read_block(results_matrix, rows[start:start + block_rows], cols, is_transposed).sum(axis=1)
+    dominators = np.argsort(row_sums, kind="stable")[:max_dominators]
+    sampled_cols = cols[np.linspace(0, num_cols - 1, min(num_cols, sample_size)).astype(np.intp)]
+    sampled_matrix = _read_block(results_matrix, rows, sampled_cols, is_transposed)
+    is_dominated = np.zeros(num_rows, dtype=bool)
+    for dominator in dominators:
+        if is_dominated[dominator]:
+            continue
+        candidates = np.flatnonzero(~is_dominated & (sampled_matrix >= sampled_matrix[dominator]).all(axis=1))
+        candidates = candidates[candidates != dominator]
+        if len(candidates) == 0:
+            continue
+        dominator_row = _read_block(results_matrix, rows[dominator:dominator + 1], cols, is_transposed)[0]
+        for start in range(0, len(candidates), block_rows):
+            block = candidates[start:start + block_rows]
+            candidate_rows = _read_block(results_matrix, rows[block], cols, is_transposed)
+            is_no_better = (candidate_rows >= dominator_row).all(axis=1)
+            is_worse = (candidate_rows > dominator_row).any(axis=1)
+            is_dominated[block[is_no_better & (is_worse | (block > dominator))]] = True
+    return is_dominated
+
+def eliminate_dominated_strategies(
+    results_matrix: np.ndarray,
+    max_dominators: int = 256,
+    sample_size: int = 64,
+    max_block_cells: int = 2 ** 20,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Removes dominated non-dealer strategies (rows) and dominated dealer strategies (columns) until none are left, so the linear programs in calc_optimal_strategy_combo solve a smaller game.
+    A non-dealer strategy is dominated if another non-dealer strategy gives a dealer gain no greater against every dealer strategy, and a dealer strategy is dominated if another dealer strategy gives a dealer gain no less against every non-dealer strategy.
+    Removing a weakly dominated strategy does not change the value of the game, and optimal percentages for the smaller game, with 0% for the removed strategies, are optimal for the full game.
+    The matrix is only read in blocks through the indices of the strategies kept, and is never copied, so it can be memory-mapped and bigger than memory.
+
+    args:
+    - results_matrix (np array): The results matrix as described in calc_optimal_strategy_combo.
+    - max_dominators (int): The number of strategies tried as dominating strategies on each pass, see _find_dominated_rows. Set this to the number of rows or columns to find every dominated strategy.
+    - sample_size (int): The number of columns (or rows) compared before a strategy is compared in full.
+    - max_block_cells (int): The maximum number of cells of the matrix read into memory at a time.
+
+    Returns:
+        kept_rows (np array): The indices of the rows that are not dominated, in order.
+        kept_cols (np array): The indices of the columns that are not dominated, in order.
+        The reduced matrix is results_matrix[np.ix_(kept_rows, kept_cols)].
+    """
+    num_rows, num_cols = results_matrix.shape
+    kept_rows = np.arange(num_rows)
+    kept_cols = np.arange(num_cols)
+    while True:
+        # The non-dealer (rows) wants to minimize the dealer gain
+        is_row_dominated = _find_dominated_rows(results_matrix, kept_rows, kept_cols, False, max_dominators, sample_size, max_block_cells)
+        kept_rows = kept_rows[~is_row_dominated]
+        # The dealer (columns) wants to maximize the dealer gain
+        is_col_dominated = _find_dominated_rows(results_matrix, kept_cols, kept_rows, True, max_dominators, sample_size, max_block_cells)
+        kept_cols = kept_cols[~is_col_dominated]
+        if not is_row_dominated.any() and not is_col_dominated.any():
+            return kept_rows, kept_cols
+
 # Example usage
 if __name__ == "__main__":
     M = np.array([
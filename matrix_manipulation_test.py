@@ -0,0 +1,111 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+
+from matrix_manipulation import calc_optimal_strategy_combo, calc_optimal_strategy_combos, calc_approximate_strategy_combos, calc_double_oracle_strategy_combos, eliminate_dominated_strategies
+
+
+class TestEliminateDominatedStrategies(unittest.TestCase):
+
+    def test_dominated_strategies_are_removed(self):
+        results_matrix = np.array([
+            [1.0, -2.0, -3.0],
+            [-1.0, 1.0, 2.0],
+            # Dominated by row 0
+            [2.0, -1.0, -1.0],
+            # Dominated by row 1 for the non-dealer who minimizes the dealer gain
+            [-1.0, 2.0, 2.0],
+            # A duplicate of row 0
+            [1.0, -2.0, -3.0],
+        ])
+        kept_rows, kept_cols = eliminate_dominated_strategies(results_matrix)
+        self.assertEqual(kept_rows.tolist(), [0, 1])
+        self.assertEqual(kept_cols.tolist(), [0, 1, 2])
+
+    def test_game_value_is_unchanged(self):
+        rng = np.random.default_rng(0)
+        # A random game with some dominated strategies added
+        results_matrix = rng.integers(-5, 6, size=(12, 10)).astype(np.float64)
+        results_matrix = np.vstack([results_matrix, results_matrix[:4] + 1])
+        results_matrix = np.hstack([results_matrix, results_matrix[:, :3] - 1])
+        kept_rows, kept_cols = eliminate_dominated_strategies(results_matrix)
+        reduced_matrix = results_matrix[np.ix_(kept_rows, kept_cols)]
+        self.assertLess(len(kept_rows), results_matrix.shape[0])
+        self.assertLess(len(kept_cols), results_matrix.shape[1])
+        for player in ("dealer", "non-dealer"):
+            _, full_value = calc_optimal_strategy_combo(results_matrix, player)
+            _, reduced_value = calc_optimal_strategy_combo(reduced_matrix, player)
+            self.assertAlmostEqual(full_value, reduced_value)
+
+    def test_memmap_read_in_blocks(self):
+        rng = np.random.default_rng(2)
+        results_matrix = rng.integers(-3, 4, size=(30, 25)).astype(np.float32)
+        results_matrix[5] = results_matrix[2]
+        expected = eliminate_dominated_strategies(results_matrix)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "matrix.npy")
+            np.save(file_path, results_matrix)
+            memmap_matrix = np.load(file_path, mmap_mode="r")
+            # Blocks smaller than one row or column are read a row or column at a time
+            for max_block_cells in (1, 40, 2 ** 20):
+                kept_rows, kept_cols = eliminate_dominated_strategies(memmap_matrix, max_block_cells=max_block_cells)
+                self.assertEqual((kept_rows.tolist(), kept_cols.tolist()), (expected[0].tolist(), expected[1].tolist()))
+            del memmap_matrix
+
+class TestCalcOptimalStrategyCombos(unittest.TestCase):
+
+    def test_matches_separate_programs(self):
+        rng = np.random.default_rng(1)
+        for shape in ((3, 3), (8, 5), (5, 9)):
+            results_matrix = rng.normal(size=shape)
+            optimal_strategies = calc_optimal_strategy_combos(results_matrix)
+            _, non_dealer_best_gain = calc_optimal_strategy_combo(results_matrix, "dealer")
+            _, dealer_best_gain = calc_optimal_strategy_combo(results_matrix, "non-dealer")
+            self.assertAlmostEqual(optimal_strategies["Dealer_Best_Gain"], dealer_best_gain)
+            self.assertAlmostEqual(optimal_strategies["Non_Dealer_Best_Gain"], non_dealer_best_gain)
+            # Each player's percentages guarantee the value of the game against every strategy of the other player
+            dealer_percentages = optimal_strategies["Dealer_Percentages"]
+            non_dealer_percentages = optimal_strategies["Non_Dealer_Percentages"]
+            self.assertAlmostEqual(dealer_percentages.sum(), 1)
+            self.assertAlmostEqual(non_dealer_percentages.sum(), 1)
+            self.assertGreaterEqual((results_matrix @ dealer_percentages).min(), dealer_best_gain - 1e-9)
+            self.assertLessEqual((non_dealer_percentages @ results_matrix).max(), dealer_best_gain + 1e-9)
+
+class TestCalcApproximateStrategyCombos(unittest.TestCase):
+
+    def test_within_epsilon_of_linear_program(self):
+        results_matrix = np.random.default_rng(2).normal(size=(30, 20))
+        dealer_best_gain = calc_optimal_strategy_combos(results_matrix)["Dealer_Best_Gain"]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # The solver only needs matrix-vector products so it can read a memory-mapped matrix in blocks
+            file_path = os.path.join(temp_dir, "matrix.npy")
+            np.save(file_path, results_matrix)
+            mapped_matrix = np.load(file_path, mmap_mode="r")
+            approximate_strategies = calc_approximate_strategy_combos(mapped_matrix, epsilon=1e-3, max_block_cells=100)
+            del mapped_matrix
+        self.assertLessEqual(approximate_strategies["Exploitability"], 1e-3)
+        # The value of the game is between the gains each player's percentages guarantee
+        self.assertGreaterEqual(approximate_strategies["Dealer_Best_Gain"], dealer_best_gain - 1e-9)
+        self.assertGreaterEqual(approximate_strategies["Non_Dealer_Best_Gain"], -dealer_best_gain - 1e-9)
+        self.assertGreaterEqual((results_matrix @ approximate_strategies["Dealer_Percentages"]).min(), -approximate_strategies["Non_Dealer_Best_Gain"] - 1e-9)
+        self.assertLessEqual((approximate_strategies["Non_Dealer_Percentages"] @ results_matrix).max(), approximate_strategies["Dealer_Best_Gain"] + 1e-9)
+
+class TestCalcDoubleOracleStrategyCombos(unittest.TestCase):
+
+    def test_matches_linear_program(self):
+        results_matrix = np.random.default_rng(3).normal(size=(40, 30))
+        dealer_best_gain = calc_optimal_strategy_combos(results_matrix)["Dealer_Best_Gain"]
+        double_oracle_strategies = calc_double_oracle_strategy_combos(
+            num_rows=40,
+            num_cols=30,
+            calc_rows=lambda rows: results_matrix[rows],
+            calc_cols=lambda cols: results_matrix[:, cols],
+        )
+        self.assertAlmostEqual(double_oracle_strategies["Dealer_Best_Gain"], dealer_best_gain)
+        self.assertAlmostEqual(double_oracle_strategies["Non_Dealer_Best_Gain"], -dealer_best_gain)
+        rows, cols = double_oracle_strategies["Rows"], double_oracle_strategies["Cols"]
+        self.assertEqual(double_oracle_strategies["Results_Matrix"].tolist(), results_matrix[np.ix_(rows, cols)].tolist())
+
+if __name__ == '__main__':
+    unittest.main()
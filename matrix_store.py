@@ -0,0 +1,204 @@
+"""
+An in-memory store of the dealer vs. non-dealer strategies matrix, indexed by strategy set.
+
+The store is built once, from the simulator's results, a binary export (see matrix_export) or a downloaded CSV, and holds hash indexes from each dealer and non-dealer strategy set to its column and row.
+A strategy set is keyed by its open, see or raise, and see after a raise strategies, each packed into an integer by strategy_encoding.pack_strategy, so looking up the value for a pair of strategy sets never scans the headers.
+"""
+
+import ast
+import csv
+from typing import Mapping, Sequence
+import numpy as np
+
+from configuration import OPEN_BET_OPTIONS, SEE_BET_OPTIONS
+from matrix_export import StrategiesMatrix, decode_strategy_triple, load_strategies_matrix
+from strategy_encoding import encode_strategy, pack_strategy
+
+StrategyTriple = tuple[dict[int, str], dict[int, str], dict[int, str]]
+StrategyKey = tuple[int, int, int]
+
+_BET_OPTIONS = (OPEN_BET_OPTIONS, SEE_BET_OPTIONS, SEE_BET_OPTIONS)
+
+def get_strategy_key(strategy_triple: Sequence[Mapping[int, str]]) -> StrategyKey:
+    """
+    Returns the key of a strategy set, i.e., its open, see or raise, and see after a raise strategies each packed into an integer.
+    """
+    open_key, see_key, raise_key = (
+        pack_strategy(encode_strategy(strategy, bet_options), bet_options)
+        for strategy, bet_options in zip(strategy_triple, _BET_OPTIONS)
+    )
+    return open_key, see_key, raise_key
+
+def _pack_strategy_codes(codes: np.ndarray, bet_options: Mapping[str, float]) -> np.ndarray:
+    # Packs each row of codes as pack_strategy does, with card 1 as the least significant digit
+    weights = (len(bet_options) + 1) ** np.arange(codes.shape[1] - 1, dtype=np.int64)
+    return codes[:, 1:].astype(np.int64) @ weights
+
+class _DecodedStrategySets(Sequence[StrategyTriple]):
+    """
+    The strategy sets of the rows or columns of an exported matrix, decoded only when read.
+    """
+    def __init__(self, strategy_codes: Mapping[str, np.ndarray], role: str, indices: np.ndarray):
+        self._strategy_codes = strategy_codes
+        self._role = role
+        self._indices = indices
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __getitem__(self, position):  # type: ignore[override]
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(len(self)))]
+        return decode_strategy_triple(self._strategy_codes, self._role, int(self._indices[position]))
+
+class MatrixStore:
+    """
+    The results matrix, strategy sets and percentages of a dealer vs. non-dealer simulation, with the rows indexed by non-dealer strategy set and the columns by dealer strategy set.
+    """
+
+    def __init__(
+        self,
+        results_matrix: np.ndarray,
+        non_dealer_strategy_sets: Sequence[StrategyTriple],
+        dealer_strategy_sets: Sequence[StrategyTriple],
+        non_dealer_keys: np.ndarray,
+        dealer_keys: np.ndarray,
+        non_dealer_percentages: np.ndarray,
+        dealer_percentages: np.ndarray,
+        non_dealer_best_gain: float,
+        dealer_best_gain: float,
+    ):
+        """
+        Args:
+            results_matrix (np.ndarray): The dealer gain per round, with one row per non-dealer strategy set and one column per dealer strategy set.
+            non_dealer_strategy_sets, dealer_strategy_sets (Sequence[StrategyTriple]): The strategy set of each row and column.
+            non_dealer_keys, dealer_keys (np.ndarray): The key of each row and column, as returned by get_strategy_key, one per row of the array.
+            non_dealer_percentages, dealer_percentages (np.ndarray): The optimal percentage of each row and column.
+            non_dealer_best_gain, dealer_best_gain (float): The best gain per round of each player.
+        """
+        self.results_matrix = results_matrix
+        self.non_dealer_strategy_sets = non_dealer_strategy_sets
+        self.dealer_strategy_sets = dealer_strategy_sets
+        self.non_dealer_percentages = non_dealer_percentages
+        self.dealer_percentages = dealer_percentages
+        self.non_dealer_best_gain = non_dealer_best_gain
+        self.dealer_best_gain = dealer_best_gain
+        self._row_index: dict[StrategyKey, int] = {tuple(key): row for row, key in enumerate(non_dealer_keys.tolist())}  # type: ignore[misc]
+        self._col_index: dict[StrategyKey, int] = {tuple(key): col for col, key in enumerate(dealer_keys.tolist())}  # type: ignore[misc]
+
+    @classmethod
+    def from_strategies_matrix(cls, strategies_matrix: StrategiesMatrix) -> "MatrixStore":
+        """
+        Builds the store from the simulator's results, or from a binary export loaded by matrix_export.load_strategies_matrix.
+        The results matrix is used as is, so a memory-mapped matrix is not read into memory.
+        """
+        strategy_codes = strategies_matrix["Strategy_Codes"]
+
+        def role_keys(role: str, indices: np.ndarray) -> np.ndarray:
+            packed = [
+                _pack_strategy_codes(strategy_codes[f"{role}_{strategy_type}"], bet_options)
+                for strategy_type, bet_options in zip(("open", "see", "raise"), _BET_OPTIONS)
+            ]
+            list_indices = np.unravel_index(np.asarray(indices), tuple(len(codes) for codes in packed))
+            return np.stack([codes[index] for codes, index in zip(packed, list_indices)], axis=1)
+
+        rows, cols = strategies_matrix["Rows"], strategies_matrix["Cols"]
+        return cls(
+            results_matrix=strategies_matrix["Results_Matrix"],
+            non_dealer_strategy_sets=_DecodedStrategySets(strategy_codes, "non_dealer", rows),
+            dealer_strategy_sets=_DecodedStrategySets(strategy_codes, "dealer", cols),
+            non_dealer_keys=role_keys("non_dealer", rows),
+            dealer_keys=role_keys("dealer", cols),
+            non_dealer_percentages=strategies_matrix["Non_Dealer_Percentages"],
+            dealer_percentages=strategies_matrix["Dealer_Percentages"],
+            non_dealer_best_gain=strategies_matrix["Non_Dealer_Best_Gain"],
+            dealer_best_gain=strategies_matrix["Dealer_Best_Gain"],
+        )
+
+    @classmethod
+    def load(cls, dir_path: str, mmap: bool = True) -> "MatrixStore":
+        """
+        Builds the store from a binary export saved by matrix_export.save_strategies_matrix, memory-mapping the results matrix by default.
+        """
+        return cls.from_strategies_matrix(load_strategies_matrix(dir_path, mmap=mmap))
+
+    @classmethod
+    def from_csv(cls, file_path: str) -> "MatrixStore":
+        """
+        Builds the store from a strategies matrix downloaded by utilities.download_matrix, reading the file once.
+        The dealer strategies are in the first three rows and the non-dealer strategies in the first three columns, from the fifth row or column on, with the percentages in the fourth row and column.
+        """
+        with open(file_path, mode='r', newline='') as file:
+            matrix = list(csv.reader(file))
+        # The matrix is read in from a csv so the strategies are strings, e.g. "{9: 'H'}", which are converted to dictionaries with ast.literal_eval
+        dealer_strategy_sets: list[StrategyTriple] = [
+            tuple(ast.literal_eval(matrix[i][col]) for i in range(3)) for col in range(4, len(matrix[0]))  # type: ignore[misc]
+        ]
+        non_dealer_strategy_sets: list[StrategyTriple] = [
+            tuple(ast.literal_eval(matrix[row][i]) for i in range(3)) for row in range(4, len(matrix))  # type: ignore[misc]
+        ]
+        return cls(
+            results_matrix=np.array([row[4:] for row in matrix[4:]], dtype=np.float64).reshape(len(non_dealer_strategy_sets), len(dealer_strategy_sets)),
+            non_dealer_strategy_sets=non_dealer_strategy_sets,
+            dealer_strategy_sets=dealer_strategy_sets,
+            non_dealer_keys=np.array([get_strategy_key(triple) for triple in non_dealer_strategy_sets], dtype=np.int64).reshape(-1, 3),
+            dealer_keys=np.array([get_strategy_key(triple) for triple in dealer_strategy_sets], dtype=np.int64).reshape(-1, 3),
+            non_dealer_percentages=np.array([row[3] for row in matrix[4:]], dtype=np.float64),
+            dealer_percentages=np.array(matrix[3][4:], dtype=np.float64),
+            non_dealer_best_gain=float(matrix[2][0]),
+            dealer_best_gain=float(matrix[0][2]),
+        )
+
+    def get_row(self, non_dealer_strategy_set: Sequence[Mapping[int, str]]) -> int:
+        """
+        Returns the row of a non-dealer strategy set, or raises a ValueError if it is not in the matrix.
+        """
+        try:
+            return self._row_index[get_strategy_key(non_dealer_strategy_set)]
+        except KeyError:
+            raise ValueError(f"The non-dealer strategy set {tuple(non_dealer_strategy_set)} is not in the matrix") from None
+
+    def get_col(self, dealer_strategy_set: Sequence[Mapping[int, str]]) -> int:
+        """
+        Returns the column of a dealer strategy set, or raises a ValueError if it is not in the matrix.
+        """
+        try:
+            return self._col_index[get_strategy_key(dealer_strategy_set)]
+        except KeyError:
+            raise ValueError(f"The dealer strategy set {tuple(dealer_strategy_set)} is not in the matrix") from None
+
+    def get_intersection_value(
+        self,
+        dealer_strategy_set: Sequence[Mapping[int, str]],
+        non_dealer_strategy_set: Sequence[Mapping[int, str]],
+    ) -> float:
+        """
+        Returns the dealer gain per round when the dealer plays dealer_strategy_set against non_dealer_strategy_set.
+        """
+        return float(self.results_matrix[self.get_row(non_dealer_strategy_set), self.get_col(dealer_strategy_set)])
+
+    def get_best_position(self) -> tuple[int, int]:
+        """
+        Returns the row of the first non-dealer strategy set and the column of the first dealer strategy set with a percentage greater than zero.
+        """
+        non_dealer_rows = np.flatnonzero(np.asarray(self.non_dealer_percentages) > 0)
+        dealer_cols = np.flatnonzero(np.asarray(self.dealer_percentages) > 0)
+        return int(non_dealer_rows[0]), int(dealer_cols[0])
+
+    def get_key_data(self) -> dict[str, tuple[dict[int, str], ...]]:
+        """
+        Prints and returns the first dealer and non-dealer strategy sets with a percentage greater than zero, and prints the value at their intersection, as utilities.get_key_data does for a CSV file.
+        """
+        row, col = self.get_best_position()
+        col_headers = self.dealer_strategy_sets[col]
+        row_headers = self.non_dealer_strategy_sets[row]
+        intersection = round(float(self.results_matrix[row, col]), 4)
+
+        print(f"Dealer best strategy: {col_headers}")
+        print(f"Non-Dealer best strategy: {row_headers}")
+        print(f"Value at intersection: {intersection}")
+
+        return {
+            "Dealer best strategy": col_headers,
+            "Non-dealer best strategy": row_headers,
+        }
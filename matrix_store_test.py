@@ -0,0 +1,72 @@
+from typing import Any
+import os
+import tempfile
+import unittest
+from itertools import product
+import numpy as np
+
+from matrix_cache import encode_strategy_lists
+from matrix_store import MatrixStore
+from utilities import download_matrix, generate_possible_lists, get_intersection_value
+
+class TestMatrixStore(unittest.TestCase):
+
+    def setUp(self):
+        open_list = generate_possible_lists(2, "HL", "22")
+        see_list = generate_possible_lists(2, "HS", "22")
+        raise_list = generate_possible_lists(1, "S")
+        self.strategy_sets = list(product(open_list, see_list, raise_list))
+        num_triples = len(self.strategy_sets)
+        rng = np.random.default_rng(0)
+        # A restricted game, with only some of the rows and columns
+        self.rows, self.cols = np.array([5, 1, 7]), np.array([0, 3])
+        self.strategies_matrix = {
+            "Results_Matrix": rng.normal(size=(len(self.rows), len(self.cols))).round(4),
+            "Rows": self.rows,
+            "Cols": self.cols,
+            "Non_Dealer_Percentages": np.array([0, 0.5, 0.5]),
+            "Dealer_Percentages": np.array([0, 1.0]),
+            "Non_Dealer_Best_Gain": -0.25,
+            "Dealer_Best_Gain": 0.25,
+            "Strategy_Codes": encode_strategy_lists([open_list, see_list, raise_list] * 2),
+        }
+        self.assertLess(max(self.rows), num_triples)
+
+    def check_store(self, store: MatrixStore):
+        results_matrix = self.strategies_matrix["Results_Matrix"]
+        for i, row in enumerate(self.rows):
+            for j, col in enumerate(self.cols):
+                value = store.get_intersection_value(self.strategy_sets[col], self.strategy_sets[row])
+                self.assertAlmostEqual(value, results_matrix[i, j])
+        with self.assertRaises(ValueError):
+            store.get_row(self.strategy_sets[0])
+        self.assertEqual(store.get_best_position(), (1, 1))
+        key_data = store.get_key_data()
+        self.assertEqual(key_data["Dealer best strategy"], self.strategy_sets[3])
+        self.assertEqual(key_data["Non-dealer best strategy"], self.strategy_sets[1])
+
+    def test_from_strategies_matrix(self):
+        self.check_store(MatrixStore.from_strategies_matrix(self.strategies_matrix))  # type: ignore
+
+    def test_from_csv(self):
+        # Lay out the matrix as the simulator downloads it
+        num_rows, num_cols = self.strategies_matrix["Results_Matrix"].shape
+        strategies_matrix: list[list[Any]] = [["" for _ in range(num_cols + 4)] for _ in range(num_rows + 4)]
+        for j, col in enumerate(self.cols):
+            strategies_matrix[0][j + 4], strategies_matrix[1][j + 4], strategies_matrix[2][j + 4] = self.strategy_sets[col]
+            strategies_matrix[3][j + 4] = self.strategies_matrix["Dealer_Percentages"][j]
+        for i, row in enumerate(self.rows):
+            strategies_matrix[i + 4][0], strategies_matrix[i + 4][1], strategies_matrix[i + 4][2] = self.strategy_sets[row]
+            strategies_matrix[i + 4][3] = self.strategies_matrix["Non_Dealer_Percentages"][i]
+            strategies_matrix[i + 4][4:] = self.strategies_matrix["Results_Matrix"][i].tolist()
+        strategies_matrix[2][0] = self.strategies_matrix["Non_Dealer_Best_Gain"]
+        strategies_matrix[0][2] = self.strategies_matrix["Dealer_Best_Gain"]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "matrix.csv")
+            download_matrix(strategies_matrix, file_path)
+            self.check_store(MatrixStore.from_csv(file_path))
+            value = get_intersection_value(file_path, self.strategy_sets[3], self.strategy_sets[7])
+            self.assertEqual(float(value), self.strategies_matrix["Results_Matrix"][2, 1])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,12 +5,13 @@ This module holds the definition of the player class for the pokerlite program.
 Author: Seán Young
 """
 import logging
-import logging.config
 import random
+from typing import Sequence
 
 from components import Card
 from abc import ABC, abstractmethod
-from configuration import GameConfig, GAME_CONFIG, game_records, PlayerList, RoundRecord, GameRecord, TypeForPlayState, Strategy
+from configuration import GameConfig, GAME_CONFIG, PlayerList, RoundRecord, GameRecord, TypeForPlayState, Strategy, StrategyCodes, configure_logging
+from strategy_encoding import encode_player_strategy
 
 class Player(ABC):
     """
@@ -25,12 +26,6 @@ class Player(ABC):
     def get_CONFIG(cls) -> GameConfig:
         return cls._CONFIG
 
-    # A list of dictionaries with game betting rounds data
-    _game_stats: list[GameRecord] = game_records
-    @classmethod
-    def get_game_stats(cls) -> list[GameRecord]:
-        return cls._game_stats
-    
     def __init__(
         self,
         cash_balance: int = 0,
@@ -51,12 +46,24 @@ class Player(ABC):
     ) -> None:    
         self._cash_balance = cash_balance
         self._strategy: Strategy = strategy
+        self._strategy_codes: StrategyCodes = encode_player_strategy(strategy)
         self._card: Card = Card(0)
         self._bet_running_total: int = 0
-        self._game_stats: list[GameRecord] = []
-        #Set up application logging configuration and local logger
-        logging.config.fileConfig('logging.conf')
+        # The records of the game being played, set by the game, which hold whole betting rounds with the current round last
+        self._game_stats: Sequence[GameRecord] = []
+        #Set up application logging configuration (once per process) and local logger
+        configure_logging()
         self.logger = logging.getLogger('player')
+        self.check_log_level()
+
+    def check_log_level(self) -> None:
+        """
+        Sets is_debug from the logger. take_bet tests is_debug rather than asking the logger for its level on every bet, and the game calls this once per round.
+        """
+        self.is_debug: bool = self.logger.isEnabledFor(logging.DEBUG)
+
+    def get_game_stats(self) -> Sequence[GameRecord]:
+        return self._game_stats
 
     @property
     @abstractmethod
@@ -97,6 +104,15 @@ class Player(ABC):
     @strategy.setter
     def strategy(self, strategy: Strategy) -> None:
         self._strategy = strategy
+        self._strategy_codes = encode_player_strategy(strategy)
+
+    @property
+    def strategy_codes(self) -> StrategyCodes:
+        """
+        The player's strategies encoded by card number, see strategy_encoding.encode_player_strategy.
+        This is kept in step with strategy and is used by take_bet to look up the bet for a card.
+        """
+        return self._strategy_codes
 
     @abstractmethod
     def take_bet(
@@ -3,12 +3,11 @@ This player strategy is variable
 Author: Seán Young
 """
 
-import logging
-
 from configuration import PlayerList, Strategy, OpenBetValues, SeeBetValues, TypeForPlayState
 # from simulator_config import FILE_PATH
 
 from player import Player, RoundRecord
+from strategy_encoding import OPEN_BET_AMOUNTS, SEE_BET_FACTORS, SEE_CODE
 from utilities import validate_bet, get_key_data, print_records
 
 # strategies = get_percentages_and_values(FILE_PATH)
@@ -65,9 +64,8 @@ class PlayerCode(Player):
             is_raise_allowed: bool = True,
         ) -> int:
 
-            self.logger.debug(f"{self.name} has been asked for a bet")
-            
-            if self.logger.getEffectiveLevel() == logging.DEBUG:
+            if self.is_debug:
+                self.logger.debug("%s has been asked for a bet", self.name)
                 print(f"{self.name} round data:")
                 print_records(round_data)
                 print(f"{self.name} bet state: {betting_state}")
@@ -81,70 +79,94 @@ class PlayerCode(Player):
             match(betting_state):
                 case("Dealer Opens"):
                     player_open_strategy = self.strategy["Dealer_Opens"]
-                    self.logger.debug(f"The playing strategy is: {player_open_strategy}")
-                    if self.card.value in player_open_strategy:
-                        bet = Player.get_CONFIG()["OPEN_BET_OPTIONS"][player_open_strategy[self.card.value]] # Bet
-                        self.logger.debug(f"{self.name} bets: {bet}")
+                    if self.is_debug:
+                        self.logger.debug("The playing strategy is: %s", player_open_strategy)
+                    code = self.strategy_codes["Dealer_Opens"][self.card.value]
+                    if code:
+                        bet = OPEN_BET_AMOUNTS[code] # Bet
+                        if self.is_debug:
+                            self.logger.debug("%s bets: %s", self.name, bet)
                     else:
                         bet = 0 # Check
-                        self.logger.debug(f"{self.name} checks instead of opening")
+                        if self.is_debug:
+                            self.logger.debug("%s checks instead of opening", self.name)
                 case("Dealer Sees after Non-Dealer Opens after Dealer Checks"):
                     player_see_strategy = self.strategy["Dealer_Sees_after_Non_Dealer_Opens_after_Dealer_Checks"]
-                    self.logger.debug(f"The playing strategy is: {player_see_strategy}")
-                    if self.card.value in player_see_strategy:
-                        bet_type = player_see_strategy[self.card.value]    
-                        if bet_type == "S":
+                    if self.is_debug:
+                        self.logger.debug("The playing strategy is: %s", player_see_strategy)
+                    code = self.strategy_codes["Dealer_Sees_after_Non_Dealer_Opens_after_Dealer_Checks"][self.card.value]
+                    if code:
+                        if code == SEE_CODE:
                             bet = required_bet # See
-                            self.logger.debug(f"{self.name} sees with bet: {bet}")
+                            if self.is_debug:
+                                self.logger.debug("%s sees with bet: %s", self.name, bet)
                         else:
-                            raise_amount = round(required_bet * Player.get_CONFIG()["SEE_BET_OPTIONS"][bet_type])
+                            raise_amount = round(required_bet * SEE_BET_FACTORS[code])
                             bet = required_bet + raise_amount # Raise
-                            self.logger.debug(f"{self.name} raises with bet: {bet}")       
+                            if self.is_debug:
+                                self.logger.debug("%s raises with bet: %s", self.name, bet)
                     else:
                         bet = 0 # Fold
-                        self.logger.debug(f"{self.name} folds")
+                        if self.is_debug:
+                            self.logger.debug("%s folds", self.name)
                 case("Dealer Sees after Non-Dealer Raises after Dealer Opens"):
                     player_see_strategy = self.strategy["Dealer_Sees_after_Non_Dealer_Raises_after_Dealer_Opens"]
-                    self.logger.debug(f"The playing strategy is: {player_see_strategy}")
-                    if self.card.value in player_see_strategy:
+                    if self.is_debug:
+                        self.logger.debug("The playing strategy is: %s", player_see_strategy)
+                    code = self.strategy_codes["Dealer_Sees_after_Non_Dealer_Raises_after_Dealer_Opens"][self.card.value]
+                    if code:
                         bet = required_bet # See
-                        self.logger.debug(f"{self.name} sees with bet: {bet}")
+                        if self.is_debug:
+                            self.logger.debug("%s sees with bet: %s", self.name, bet)
                     else:
                         bet = 0 # Fold
-                        self.logger.debug(f"{self.name} folds")
+                        if self.is_debug:
+                            self.logger.debug("%s folds", self.name)
                 case("Non-Dealer Opens after Dealer Checks"):
                     player_open_strategy = self.strategy["Non_Dealer_Opens_after_Dealer_Checks"]
-                    self.logger.debug(f"The playing strategy is: {player_open_strategy}")
-                    if self.card.value in player_open_strategy:
-                        bet = Player.get_CONFIG()["OPEN_BET_OPTIONS"][player_open_strategy[self.card.value]] # Bet
-                        self.logger.debug(f"{self.name} bets: {bet}")
+                    if self.is_debug:
+                        self.logger.debug("The playing strategy is: %s", player_open_strategy)
+                    code = self.strategy_codes["Non_Dealer_Opens_after_Dealer_Checks"][self.card.value]
+                    if code:
+                        bet = OPEN_BET_AMOUNTS[code] # Bet
+                        if self.is_debug:
+                            self.logger.debug("%s bets: %s", self.name, bet)
                     else:
                         bet = 0 # Check
-                        self.logger.debug(f"{self.name} also checks so round ends")
+                        if self.is_debug:
+                            self.logger.debug("%s also checks so round ends", self.name)
                 case("Non-Dealer Sees after Dealer Opens"):
                     player_see_strategy = self.strategy["Non_Dealer_Sees_after_Dealer_Opens"]
-                    self.logger.debug(f"The playing strategy is: {player_see_strategy}")
-                    if self.card.value in player_see_strategy:
-                        bet_type = player_see_strategy[self.card.value]    
-                        if bet_type == "S":
+                    if self.is_debug:
+                        self.logger.debug("The playing strategy is: %s", player_see_strategy)
+                    code = self.strategy_codes["Non_Dealer_Sees_after_Dealer_Opens"][self.card.value]
+                    if code:
+                        if code == SEE_CODE:
                             bet = required_bet # See
-                            self.logger.debug(f"{self.name} sees with bet: {bet}")
+                            if self.is_debug:
+                                self.logger.debug("%s sees with bet: %s", self.name, bet)
                         else:
-                            raise_amount = round(required_bet * Player.get_CONFIG()["SEE_BET_OPTIONS"][bet_type])
+                            raise_amount = round(required_bet * SEE_BET_FACTORS[code])
                             bet = required_bet + raise_amount # Raise
-                            self.logger.debug(f"{self.name} raises with bet: {bet}")       
+                            if self.is_debug:
+                                self.logger.debug("%s raises with bet: %s", self.name, bet)
                     else:
                         bet = 0 # Fold
-                        self.logger.debug(f"{self.name} folds")
+                        if self.is_debug:
+                            self.logger.debug("%s folds", self.name)
                 case("Non-Dealer Sees after Dealer Raises after Non-Dealer Opens after Dealer Checks"):
                     player_see_strategy = self.strategy["Non_Dealer_Sees_after_Dealer_Raises_after_Non_Dealer_Opens_after_Dealer_Checks"]
-                    self.logger.debug(f"The playing strategy is: {player_see_strategy}")
-                    if self.card.value in player_see_strategy:
+                    if self.is_debug:
+                        self.logger.debug("The playing strategy is: %s", player_see_strategy)
+                    code = self.strategy_codes["Non_Dealer_Sees_after_Dealer_Raises_after_Non_Dealer_Opens_after_Dealer_Checks"][self.card.value]
+                    if code:
                         bet = required_bet # See
-                        self.logger.debug(f"{self.name} sees with bet: {bet}")
+                        if self.is_debug:
+                            self.logger.debug("%s sees with bet: %s", self.name, bet)
                     else:
                         bet = 0 # Fold
-                        self.logger.debug(f"{self.name} folds")
+                        if self.is_debug:
+                            self.logger.debug("%s folds", self.name)
                 case _:
                     pass
 
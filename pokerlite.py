@@ -9,15 +9,14 @@ Version: 1.0
 
 from typing import Optional, TypedDict
 from datetime import datetime
-import random
 import logging
-import logging.config
 from importlib import import_module
 
 # Import pokerlite elements
-from configuration import GameConfig, GAME_CONFIG, game_records, RoundRecord, GameRecord, TypeForPlayState
-from components import Deck
+from configuration import GameConfig, GAME_CONFIG, RoundRecord, GameRecord, TypeForPlayState, configure_logging
+from components import RNG, Card, DealSource, Deck, rng_choice, rng_sample, rng_shuffle
 from player import Player
+from records import GameRecords
 from utilities import download_game_records, print_records
 
 # Custom type
@@ -26,6 +25,34 @@ TypeForRoundReturn = TypedDict("TypeForRoundReturn", {
     "Game Checked": bool,
     "Remaining Players": list[Player]
 })
+# The state of a betting round that is updated as each bet is taken, see Game.apply_bet
+TypeForBettingState = TypedDict("TypeForBettingState", {
+    "Pot": int,
+    "Highest Cumulative Bet": int,
+    "Number Raises": int,
+    "Is Raise Allowed": bool,
+    "Closing Player": Player
+})
+
+# The fast path (Game.play_fast) tracks the last bet of a betting round as a small integer rather than a bet type string
+# A bet type is BET_ROLES.index(role) * len(BET_ACTIONS) + BET_ACTIONS.index(action), e.g. "Non_Dealer_Open" is 1 * 6 + 4
+BET_ROLES = ("Dealer_", "Non_Dealer_")
+BET_ACTIONS = ("Ante", "Check", "Fold", "See", "Open", "Raise")
+BET_TYPE_NAMES: tuple[str, ...] = tuple(role + action for role in BET_ROLES for action in BET_ACTIONS)
+_ANTE, _CHECK, _FOLD, _SEE, _OPEN, _RAISE = range(len(BET_ACTIONS))
+_NON_DEALER = len(BET_ACTIONS)
+# The round state passed to the betting player for each bet type of the previous bet, as returned by Game.round_state
+BET_TYPE_STATES: tuple[TypeForPlayState, ...] = tuple(
+    {
+        "Non_Dealer_Ante": "Dealer Opens",
+        "Dealer_Check": "Non-Dealer Opens after Dealer Checks",
+        "Dealer_Open": "Non-Dealer Sees after Dealer Opens",
+        "Non_Dealer_Open": "Dealer Sees after Non-Dealer Opens after Dealer Checks",
+        "Dealer_Raise": "Non-Dealer Sees after Dealer Raises after Non-Dealer Opens after Dealer Checks",
+        "Non_Dealer_Raise": "Dealer Sees after Non-Dealer Raises after Dealer Opens",
+    }.get(bet_type, "End Game") # type: ignore
+    for bet_type in BET_TYPE_NAMES
+)
 
 class Game:
     """
@@ -33,17 +60,23 @@ class Game:
         See configuration.py for game rules.
     Args:
         game_id: str: A string attached to the game record data to identify the game.
-        game_records: list[GameRecord]: A list to which dictionary records with game betting round data are appended.
+        game_records: list[GameRecord] | GameRecords: A list to which dictionary records with game betting round data are appended. Defaults to GameRecords with the record policy of GAME_CONFIG.
         GAME_CONFIG: GameConfig: A list of game parameter values. 
+        rng: Optional[RNG]: The generator the cards are shuffled and dealt with, e.g. components.derive_rng(seed, game_index), so a game replays bit-for-bit whatever else uses the random module. Defaults to the random module.
+        deal_source: Optional[DealSource]: Pre-generated deals, round n being dealt row n - 1, in place of shuffling and dealing a deck with rng every round.
     """
     
     def __init__(
         self,
         game_id: str,
-        game_records: list[GameRecord] = game_records,
-        GAME_CONFIG: GameConfig = GAME_CONFIG
+        game_records: Optional[list[GameRecord] | GameRecords] = None,
+        GAME_CONFIG: GameConfig = GAME_CONFIG,
+        rng: Optional[RNG] = None,
+        deal_source: Optional[DealSource] = None
     ) -> None:
         self.game_id = game_id
+        self.rng = rng
+        self.deal_source = deal_source
         # Set up player list
         player_class_name = GAME_CONFIG["PLAYER_CLASS"]
         self.players: list[Player] = []
@@ -60,17 +93,31 @@ class Game:
         self.CARD_HIGH_NUMBER = GAME_CONFIG["CARD_HIGH_NUMBER"]
         self.MAX_RAISES = GAME_CONFIG["MAX_RAISES"]
         self.IS_CARRY_POT = GAME_CONFIG["IS_CARRY_POT"]
-        # A list of dictionary elements storing betting data from each betting round
-        self.game_records: list[GameRecord] = game_records
+        if deal_source is not None and (deal_source.count != self.CARD_HIGH_NUMBER or deal_source.num_players != len(self.players)):
+            raise ValueError(f"The deal source deals {deal_source.num_players} of {deal_source.count} cards but the game deals {len(self.players)} of {self.CARD_HIGH_NUMBER} cards")
+        # A list of dictionary elements storing betting data from each betting round, which each player of the game reads with get_game_stats
+        self.game_records: list[GameRecord] | GameRecords = GameRecords.from_config(GAME_CONFIG) if game_records is None else game_records
+        for player in self.players:
+            player._game_stats = self.game_records
 
-        #Set up application logging configuration and local logger
-        logging.config.fileConfig('logging.conf')
+        #Set up application logging configuration (once per process) and local logger
+        configure_logging()
         self.logger = logging.getLogger('pokerlite')
+        self.check_log_level()
+
+    def check_log_level(self) -> None:
+        """
+        Sets is_debug for the game and its players from their loggers.
+        The hot paths test is_debug before logging, so no log message is built, and the logger is not asked for its level, when debug logging is off.
+        """
+        self.is_debug = self.logger.isEnabledFor(logging.DEBUG)
+        for player in self.players:
+            player.check_log_level()
 
     def player_order(self, start_player: Optional[Player] = None) -> list[Player]:
         """Rotate player order so that start_player goes first"""
         if start_player is None:
-            start_player = random.choice(self.players)
+            start_player = rng_choice(self.players, self.rng)
         start_idx = self.players.index(start_player)
         return self.players[start_idx:] + self.players[:start_idx]
     
@@ -140,17 +187,15 @@ class Game:
         # Reverses the player order as we later take bets from the end so players can be removed if they fold            
         player_order.reverse()
 
-        # Tracks the number of raises so the number can be limited
-        number_raises: int = 0
-        # Flags whether raises are allowed in the bet being taken
-        if self.MAX_RAISES > 0:
-            is_raise_allowed: bool = True
-        else:
-            is_raise_allowed = False
-        # Tracks the highest cumulative bet of the players in one betting round to calculate required bets
-        highest_cumulative_bet: int = 0
-        # Tracks the player whose turn ends the betting round, initialized to the first player (as we're starting from the end)
-        closing_player: Player = player_order[0]
+        # Tracks the pot, the highest cumulative bet of the players in one betting round to calculate required bets, the number of raises so the number can be limited,
+        # whether raises are allowed in the bet being taken, and the player whose turn ends the betting round, initialized to the first player (as we're starting from the end)
+        betting_state: TypeForBettingState = {
+            "Pot": pot,
+            "Highest Cumulative Bet": 0,
+            "Number Raises": 0,
+            "Is Raise Allowed": self.MAX_RAISES > 0,
+            "Closing Player": player_order[0]
+        }
         # Tracks the dealer, who will be the last player (as we're starting from the end)
         dealing_player: Player = player_order[-1]
         # The bet type for the round record, initialized to 'Ante'
@@ -175,104 +220,122 @@ class Game:
                     bet_type_prefix = "Non_Dealer_"
                 # The required bet for the current betting player is the highest cumulative bet placed so far
                 # less the amount the betting player has already bet
-                required_bet = highest_cumulative_bet - betting_player.bet_running_total
+                required_bet = betting_state["Highest Cumulative Bet"] - betting_player.bet_running_total
                 # Determine the betting state, i.e. whether this is an opening bet and so on
-                betting_state: TypeForPlayState = self.round_state(round_data=round_data)
+                play_state: TypeForPlayState = self.round_state(round_data=round_data)
                 # Ask the player for a bet         
                 bet = betting_player.take_bet(
                     required_bet=required_bet, 
-                    pot=pot,
-                    betting_state=betting_state,
+                    pot=betting_state["Pot"],
+                    betting_state=play_state,
                     round_data=round_data,
-                    is_raise_allowed=is_raise_allowed
+                    is_raise_allowed=betting_state["Is Raise Allowed"]
                 )
                 # Deduct the bet from the player"s cash balance
                 betting_player.place_bet(bet)
                 # Take action depending on the bet value returned
-                match(bet):
-                    case n if n < 0:
-                        # Invalid bet
-                        raise ValueError(f"Invalid bet of {n} - a negative amount")
-                    case n if n == 0:
-                        # No bet
-                        if required_bet == 0:
-                            # Opening bet and player checked - no action
-                            bet_type = bet_type_prefix + "Check"
-                            self.logger.debug(f"{betting_player.name} has checked")
-                        else:
-                            # Folds - no bet
-                            # Remove the player from the list of players so they are not included in the round or when the winner is determined
-                            bet_type = bet_type_prefix + "Fold"
-                            player_order.pop(i)
-                            self.logger.debug(f"Player {betting_player.name} has folded")
-                        self.logger.debug(f"{betting_player.name} balance is: {betting_player.cash_balance} coins")
-                    case n if n > 0 and n < required_bet:
-                        # Invalid bet - the player must see the current required bet as a minimum
-                        raise ValueError(f"Invalid bet of {n} - less than the minimum required")
-                    case n if n == required_bet:
-                        # Sees - the player bets the required bet
-                        bet_type = bet_type_prefix + "See"
-                        self.logger.debug(f"{betting_player.name} has seen the bet by betting {bet}")
-                        # Update the player bet running total so future required bets can be determined
-                        betting_player.bet_running_total += bet
-                        # Update the total bet amount so the pot can be updated later 
-                        pot += bet
-                        self.logger.debug(f"{betting_player.name} balance is: {betting_player.cash_balance} coins")
-                    case n if n > required_bet:
-                        # Player either opens or raises
-                        if required_bet == 0:
-                            # Opening bet and player opened
-                            bet_type = bet_type_prefix + "Open"
-                            self.logger.debug(f"{betting_player.name} has opened with a bet of {n}")
-                        else:
-                            # Raises - the player sees the required bet but also raises above that amount
-                            bet_type = bet_type_prefix + "Raise"
-                            self.logger.debug(f"{betting_player.name} has raised above the required bet of {required_bet} with a bet of {n}")
-                            # Increment the count of raises and test if the limit has been reached
-                            number_raises += 1
-                            if number_raises == self.MAX_RAISES:
-                                self.logger.debug(f"Maximum number of raises reached: {number_raises}")
-                                is_raise_allowed = False
-                        # Since the player has opened or raised, reset the closing player to the player who bet just before the betting player
-                        closing_player = player_order[(i + 1) % len(player_order)]
-                        self.logger.debug(f"The closing player is {closing_player.name}")
-                        self.logger.debug(f"{betting_player.name} balance is: {betting_player.cash_balance} coins")
-                        # Update the player bet running total so future required bets can be determined
-                        betting_player.bet_running_total += n
-                        # Update the total bet amount so the pot can be updated later 
-                        pot += n
-                        # Increment the highest bet by the raise amount
-                        highest_cumulative_bet += (n - required_bet)
-                    case _:
-                        raise ValueError("Unreachable code path")
+                action = self.apply_bet(bet, required_bet, i, player_order, betting_state)
+                bet_type = bet_type_prefix + BET_ACTIONS[action]
+                if self.is_debug:
+                    if action == _CHECK:
+                        self.logger.debug("%s has checked", betting_player.name)
+                    elif action == _FOLD:
+                        self.logger.debug("Player %s has folded", betting_player.name)
+                    elif action == _SEE:
+                        self.logger.debug("%s has seen the bet by betting %s", betting_player.name, bet)
+                    elif action == _OPEN:
+                        self.logger.debug("%s has opened with a bet of %s", betting_player.name, bet)
+                    else:
+                        self.logger.debug("%s has raised above the required bet of %s with a bet of %s", betting_player.name, required_bet, bet)
+                        if betting_state["Number Raises"] == self.MAX_RAISES:
+                            self.logger.debug("Maximum number of raises reached: %s", betting_state["Number Raises"])
+                    if action in (_OPEN, _RAISE):
+                        self.logger.debug("The closing player is %s", betting_state["Closing Player"].name)
+                    self.logger.debug("%s balance is: %s coins", betting_player.name, betting_player.cash_balance)
                 # Append bet data to the round records list
                 round_data.append({
                     "Round_Number": round_number,
-                    "Pot": pot,
+                    "Pot": betting_state["Pot"],
                     "Bet_Type": bet_type,
                     "Player": betting_player.name,
                     "Bet": bet
                 })                     
                 # Check is the betting player the closing player, or the only player left, to exit the betting round
-                if betting_player.name == closing_player.name or len(player_order) == 1:
-                    self.logger.debug(f"Round closed on {closing_player.name}")
+                if betting_player.name == betting_state["Closing Player"].name or len(player_order) == 1:
+                    if self.is_debug:
+                        self.logger.debug("Round closed on %s", betting_state["Closing Player"].name)
                     # If the closing player checked then every player must have checked
-                    if bet_type[-5:] == "Check":
+                    if action == _CHECK:
                         isRoundChecked = True
                     stop = True
                     break
         # Print round data
-        if self.logger.getEffectiveLevel() == logging.DEBUG:
+        if self.is_debug:
             print_records(round_data)
         
         # Return a dictionary with the updated pot, whether all players checked in the round, and the list of players who have not folded
         # Note: It is not strictly necessary to return the player list since Lists are passed by reference
         return {
-            "Pot": pot,
+            "Pot": betting_state["Pot"],
             "Game Checked": isRoundChecked,
             "Remaining Players": player_order
         }
 
+    def apply_bet(self, bet: int, required_bet: int, player_index: int, player_order: list[Player], betting_state: TypeForBettingState) -> int:
+        """
+        Classifies a bet as a check, fold, see, open or raise and applies it to the betting round, i.e., removes a folding player from the player order,
+        adds a bet to the betting player's running total and the pot, and, for an open or raise, updates the highest cumulative bet, the closing player and the raise count.
+        Both run_round and play_round_fast take each bet with this so the two engines apply the same rules.
+
+        Args:
+            bet (int): The bet returned by the betting player.
+            required_bet (int): The bet the betting player was required to make to see the highest cumulative bet.
+            player_index (int): The index of the betting player in player_order, which is in reverse betting order.
+            player_order (list[Player]): The players who have not folded.
+            betting_state (TypeForBettingState): The state of the betting round, which is updated in place.
+
+        Raises:
+            ValueError: Invalid bet value returned
+
+        Returns:
+            int: The action taken, as an index into BET_ACTIONS.
+        """
+        if bet < 0:
+            # Invalid bet
+            raise ValueError(f"Invalid bet of {bet} - a negative amount")
+        if bet == 0:
+            # No bet
+            if required_bet == 0:
+                # Opening bet and player checked - no action
+                return _CHECK
+            # Folds - no bet
+            # Remove the player from the list of players so they are not included in the round or when the winner is determined
+            player_order.pop(player_index)
+            return _FOLD
+        if bet < required_bet:
+            # Invalid bet - the player must see the current required bet as a minimum
+            raise ValueError(f"Invalid bet of {bet} - less than the minimum required")
+        # Update the player bet running total so future required bets can be determined, and the pot
+        player_order[player_index].bet_running_total += bet
+        betting_state["Pot"] += bet
+        if bet == required_bet:
+            # Sees - the player bets the required bet
+            return _SEE
+        # Player either opens or raises
+        # Increment the highest bet by the raise amount
+        betting_state["Highest Cumulative Bet"] += bet - required_bet
+        # Since the player has opened or raised, reset the closing player to the player who bet just before the betting player
+        betting_state["Closing Player"] = player_order[(player_index + 1) % len(player_order)]
+        if required_bet == 0:
+            # Opening bet and player opened
+            return _OPEN
+        # Raises - the player sees the required bet but also raises above that amount
+        # Increment the count of raises and test if the limit has been reached
+        betting_state["Number Raises"] += 1
+        if betting_state["Number Raises"] == self.MAX_RAISES:
+            betting_state["Is Raise Allowed"] = False
+        return _RAISE
+
     def play_round(self, round_number: int, pot: int) -> int:
         """
         Plays one betting round of the game.
@@ -280,7 +343,10 @@ class Game:
             round_number (int): The number of this round.
             pot (int): The value of the pot passed in.
         """
-        self.logger.debug(f"Round number: {round_number}")
+        # The log level is checked once per round rather than on every log call
+        self.check_log_level()
+        if self.is_debug:
+            self.logger.debug("Round number: %s", round_number)
         
         # Record the round start
         self.game_records.append({
@@ -296,28 +362,32 @@ class Game:
         # The carried in pot will equal the number of checked games by number of players multiplied by the ante
         num_checked_games: int = pot // (len(self.players) * self.ANTE_BET)
 
-        # Create a deck of cards from 1 to card_high_number
-        deck = Deck.create(self.CARD_HIGH_NUMBER, shuffle=True)
-        
         # Rotate the dealer player each round
         first_player_index = (round_number) % len(self.players) - 1
         # first_player_index = 0
         player_order = self.player_order(self.players[first_player_index])
 
-        # The deal is a set of random numbers, one for each player
-        deal = deck.deal(len(player_order))
+        # The deal is a set of random numbers, one for each player, from a deck of cards from 1 to card_high_number, unless the deals are pre-generated
+        # The dealer is set by the round number, so creating the deck after rotating the players takes the same random numbers
+        if self.deal_source is None:
+            deck = Deck.create(self.CARD_HIGH_NUMBER, shuffle=True, rng=self.rng)
+            deal = deck.deal(len(player_order))
+        else:
+            deal = [Card(number) for number in self.deal_source.deal(round_number - 1)]
 
         # Set up a holder for a record of the round activity
         round_data: list[RoundRecord] = []
         
-        self.logger.debug("Taking the ante bets...")
+        if self.is_debug:
+            self.logger.debug("Taking the ante bets...")
         for i in range(0, len(player_order)):
             
             # Deduct the ante from each player
             player_order[i].place_bet(self.ANTE_BET)
             pot += self.ANTE_BET
-            self.logger.debug(f"{player_order[i].name} balance is: {player_order[i].cash_balance} coins")
-            self.logger.debug(f"The pot is: {pot} coins")
+            if self.is_debug:
+                self.logger.debug("%s balance is: %s coins", player_order[i].name, player_order[i].cash_balance)
+                self.logger.debug("The pot is: %s coins", pot)
             
             # Record the ante bets
             if i == 0:
@@ -333,13 +403,16 @@ class Game:
             })
 
         # Deal the cards
-        self.logger.debug("Dealing the cards...")
+        if self.is_debug:
+            self.logger.debug("Dealing the cards...")
         for i in range(0, len(player_order)):
             player_order[i].card = deal[i]
-            self.logger.debug(f"{player_order[i].name} card number is {player_order[i].card.value}.")
+            if self.is_debug:
+                self.logger.debug("%s card number is %s.", player_order[i].name, player_order[i].card.value)
 
         # Take the bets 
-        self.logger.debug("Taking the bets...")
+        if self.is_debug:
+            self.logger.debug("Taking the bets...")
         betting_round_return = self.run_round(
             pot=pot,
             round_number=round_number,
@@ -373,13 +446,15 @@ class Game:
                 
         # Set the pot equal to the returned pot
         pot = betting_round_return["Pot"]
-        self.logger.debug(f"The pot is: {pot} coins")
+        if self.is_debug:
+            self.logger.debug("The pot is: %s coins", pot)
 
         # If it was not a checked game give the pot to the winner
         if not betting_round_return["Game Checked"]:
             remaining_players = betting_round_return["Remaining Players"]
             winner: Player = max(remaining_players, key=lambda player: player.card)
-            self.logger.debug(f"The winner is Player {winner.name}")
+            if self.is_debug:
+                self.logger.debug("The winner is Player %s", winner.name)
             winner.collect_winnings(pot)
             
             self.game_records.append({
@@ -413,14 +488,196 @@ class Game:
 
 
         # Print the round closing balances
-        self.logger.debug(f"The round closing pot is: {pot} coins")
-        for i in range(0, len(self.players)):
-            self.logger.debug(f"{self.players[i].name} round closing balance is: {self.players[i].cash_balance} coins")
-
-        self.logger.debug("Round over")
+        if self.is_debug:
+            self.logger.debug("The round closing pot is: %s coins", pot)
+            for i in range(0, len(self.players)):
+                self.logger.debug("%s round closing balance is: %s coins", self.players[i].name, self.players[i].cash_balance)
+            self.logger.debug("Round over")
         
         return pot
 
+    def play_round_fast(self, round_number: int, pot: int, cards: list[int], card_objects: list[Card], keep_records: bool) -> int:
+        """
+        Plays one betting round as play_round does, with the same calls to the game's generator and the players, so the outcome is identical.
+        The deck is a list of card numbers reused every round, the cards are dealt as Card objects created once per game, and the state of the round is held as the integer bet type of the last bet (see BET_TYPE_NAMES).
+        Nothing is logged, and the round records are only built if keep_records is True. Otherwise players are passed an empty round_data list.
+
+        Args:
+            round_number (int): The number of this round.
+            pot (int): The value of the pot passed in.
+            cards (list[int]): The deck, which is reset to 1 to CARD_HIGH_NUMBER in order and shuffled, as Deck.create does.
+            card_objects (list[Card]): The Card for each card number, indexed by number.
+            keep_records (bool): True to add the same records to game_records as play_round does.
+
+        Returns:
+            int: The pot carried to the next round.
+        """
+        players = self.players
+        num_players = len(players)
+        ante_bet = self.ANTE_BET
+        round_data: list[RoundRecord] = []
+        if keep_records:
+            self.game_records.append({
+                "Game_Id": self.game_id,
+                "Round_Number": round_number,
+                "Pot": pot,
+                "Description": "Round Start",
+                "Player": "None",
+                "Value": round_number
+            })
+        num_checked_games: int = pot // (num_players * ante_bet)
+
+        # Shuffle and deal as Deck.create(shuffle=True) and Deck.deal do, or read the pre-generated deal
+        if self.deal_source is None:
+            cards[:] = range(1, len(cards) + 1)
+            rng_shuffle(cards, self.rng)
+            deal = rng_sample(cards, num_players, self.rng)
+        else:
+            deal = self.deal_source.deal(round_number - 1)
+
+        # Rotate the dealer player each round
+        start_idx = (round_number) % num_players - 1
+        player_order = players[start_idx:] + players[:start_idx]
+
+        for i, player in enumerate(player_order):
+            player.place_bet(ante_bet)
+            pot += ante_bet
+            if keep_records:
+                round_data.append({
+                    "Round_Number": round_number,
+                    "Pot": pot,
+                    "Bet_Type": "Dealer_Ante" if i == 0 else "Non_Dealer_Ante",
+                    "Player": player.name,
+                    "Bet": ante_bet
+                })
+            player.card = card_objects[deal[i]]
+        # Get the pot value before the ante bets were added, for the card records
+        start_pot = pot - (2 * ante_bet)
+        # The dealer bets first
+        last_bet_type = _ANTE if num_players == 1 else _NON_DEALER + _ANTE
+
+        # Take the bets as run_round does
+        for player in player_order:
+            player.bet_running_total = 0
+        dealing_player = player_order[0]
+        player_order.reverse()
+        betting_state: TypeForBettingState = {
+            "Pot": pot,
+            "Highest Cumulative Bet": 0,
+            "Number Raises": 0,
+            "Is Raise Allowed": self.MAX_RAISES > 0,
+            "Closing Player": player_order[0]
+        }
+        is_round_checked = False
+        stop = False
+        while not stop:
+            for i in range(len(player_order) - 1, -1, -1):
+                betting_player = player_order[i]
+                role = 0 if betting_player is dealing_player else _NON_DEALER
+                required_bet = betting_state["Highest Cumulative Bet"] - betting_player.bet_running_total
+                bet = betting_player.take_bet(
+                    required_bet=required_bet,
+                    pot=betting_state["Pot"],
+                    betting_state=BET_TYPE_STATES[last_bet_type],
+                    round_data=round_data,
+                    is_raise_allowed=betting_state["Is Raise Allowed"]
+                )
+                betting_player.place_bet(bet)
+                action = self.apply_bet(bet, required_bet, i, player_order, betting_state)
+                last_bet_type = role + action
+                if keep_records:
+                    round_data.append({
+                        "Round_Number": round_number,
+                        "Pot": betting_state["Pot"],
+                        "Bet_Type": BET_TYPE_NAMES[last_bet_type],
+                        "Player": betting_player.name,
+                        "Bet": bet
+                    })
+                if betting_player.name == betting_state["Closing Player"].name or len(player_order) == 1:
+                    is_round_checked = action == _CHECK
+                    stop = True
+                    break
+        pot = betting_state["Pot"]
+
+        if keep_records:
+            for player in players:
+                self.game_records.append({
+                    "Game_Id": self.game_id,
+                    "Round_Number": round_number,
+                    "Pot": start_pot,
+                    "Description": "Card",
+                    "Player": player.name,
+                    "Value": player.card.value
+                })
+            for record in round_data:
+                self.game_records.append({
+                    "Game_Id": self.game_id,
+                    "Round_Number": record["Round_Number"],
+                    "Pot": record["Pot"],
+                    "Description": record["Bet_Type"],
+                    "Player": record["Player"],
+                    "Value": record["Bet"]
+                })
+
+        if not is_round_checked:
+            winner: Player = max(player_order, key=lambda player: player.card)
+            winner.collect_winnings(pot)
+            if keep_records:
+                self.game_records.append({
+                    "Game_Id": self.game_id,
+                    "Round_Number": round_number,
+                    "Pot": pot,
+                    "Description": "Win",
+                    "Player": winner.name,
+                    "Value": pot - winner.bet_running_total - (ante_bet * (num_checked_games + 1))
+                })
+            pot = 0
+        else:
+            if not self.IS_CARRY_POT:
+                for player in player_order:
+                    player.cash_balance += ante_bet
+                pot = 0
+            if keep_records:
+                self.game_records.append({
+                    "Game_Id": self.game_id,
+                    "Round_Number": round_number,
+                    "Pot": pot,
+                    "Description": "Checked",
+                    "Player": "None",
+                    "Value": pot
+                })
+        return pot
+
+    def play_fast(self, keep_records: bool = False) -> None:
+        """
+        Plays the game with play_round_fast, with the same outcome as play for the same random seed or generator, but without building a deck and cards every round, logging or, unless keep_records is True, adding to game_records.
+        If debug logging is enabled for the game or any player the game is played with play so every bet is logged and the players are passed the round data they log.
+
+        Args:
+            keep_records (bool): True to add the same records to game_records as play does.
+        """
+        self.check_log_level()
+        if self.is_debug or any(player.is_debug for player in self.players):
+            self.play()
+            return
+        self.game_records[0]["Game_Id"] = self.game_id
+        # The deck validation in Deck.create and Deck.deal, done once for the game
+        if not self.CARD_HIGH_NUMBER > 3:
+            raise ValueError("The deck must have three cards minimum")
+        if not len(self.players) < self.CARD_HIGH_NUMBER:
+            raise ValueError("The deal must be less than the deck size")
+        cards = list(range(1, self.CARD_HIGH_NUMBER + 1))
+        card_objects = [Card(number) for number in range(self.CARD_HIGH_NUMBER + 1)]
+
+        pot = 0
+        num_carries: int = 0
+        for round_number in range(1, self.NUMBER_ROUNDS + 1):
+            pot = self.play_round_fast(round_number, pot, cards, card_objects, keep_records)
+            if pot > 0:
+                num_carries += 1
+        self.close_records()
+        self.print_game_results(pot, num_carries)
+
     def play(self) -> None:
         """
         Plays the game.
@@ -437,20 +694,34 @@ class Game:
             round_number += 1
             if pot > 0:
                 num_carries += 1
+        self.close_records()
+        self.print_game_results(pot, num_carries)
 
-        # Print the game closing balances
+    def close_records(self) -> None:
+        """
+        Closes the file the game records are written to, if any.
+        """
+        if isinstance(self.game_records, GameRecords):
+            self.game_records.close()
+
+    def print_game_results(self, pot: int, num_carries: int) -> None:
+        """
+        Prints the game closing balances.
+        """
         for player in self.players:
             print(f"{player.name} game final gain per round is: {round(player.cash_balance / self.NUMBER_ROUNDS, 2)} coins")
         print(f"The game final pot per round is: {round(pot/self.NUMBER_ROUNDS,2)} coins")
-        self.logger.debug(f"Game over after {self.NUMBER_ROUNDS} rounds")
-        self.logger.debug(f"The number of carries was {num_carries}")
+        if self.is_debug:
+            self.logger.debug("Game over after %s rounds", self.NUMBER_ROUNDS)
+            self.logger.debug("The number of carries was %s", num_carries)
 
     def __repr__(self) -> str:
         return "PokerLite with " + " ".join(player.name for player in self.players)
 
 if __name__ == "__main__":
     game_id: str = datetime.now().strftime("%d-%b-%Y %H:%M:%S")
-    game = Game(game_id)
+    # Keep every round so that the debug dump below prints the whole game
+    game = Game(game_id, GAME_CONFIG={**GAME_CONFIG, "RECORD_POLICY": "All"})
     game.play()
     if game.logger.getEffectiveLevel() == logging.DEBUG: 
         print_records(game.game_records)
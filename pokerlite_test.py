@@ -0,0 +1,67 @@
+import contextlib
+import io
+import random
+from typing import Optional
+import unittest
+
+from components import RNG, DealSource, derive_rng
+from configuration import GAME_CONFIG, GameConfig, GameRecord
+from pokerlite import Game
+
+def new_game_records() -> list[GameRecord]:
+    return [{"Game_Id": "", "Round_Number": 0, "Pot": 0, "Description": "Game Start", "Player": "None", "Value": 0}]
+
+class TestPlayFast(unittest.TestCase):
+
+    def play(
+        self, fast: bool, game_config: GameConfig, keep_records: bool = True, rng: Optional[RNG] = None, deal_source: Optional[DealSource] = None
+    ) -> tuple[str, list[int], list[GameRecord]]:
+        random.seed(5)
+        game = Game("test", game_records=new_game_records(), GAME_CONFIG=game_config, rng=rng, deal_source=deal_source)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            if fast:
+                game.play_fast(keep_records=keep_records)
+            else:
+                game.play()
+        return output.getvalue(), [player.cash_balance for player in game.players], list(game.game_records)
+
+    def test_matches_play(self):
+        for is_carry_pot in (True, False):
+            game_config: GameConfig = {**GAME_CONFIG, "NUMBER_ROUNDS": 2000, "IS_CARRY_POT": is_carry_pot}
+            self.assertEqual(self.play(True, game_config), self.play(False, game_config))
+
+    def test_matches_play_with_rng(self):
+        game_config: GameConfig = {**GAME_CONFIG, "NUMBER_ROUNDS": 500}
+        for numpy in (False, True):
+            expected = self.play(False, game_config, rng=derive_rng(11, 2, numpy=numpy))
+            self.assertEqual(self.play(True, game_config, rng=derive_rng(11, 2, numpy=numpy)), expected)
+            # The game does not use the random module, so it is the same whatever its state
+            random.seed(6)
+            self.assertEqual(self.play(False, game_config, rng=derive_rng(11, 2, numpy=numpy))[1], expected[1])
+
+    def test_matches_play_with_deal_source(self):
+        game_config: GameConfig = {**GAME_CONFIG, "NUMBER_ROUNDS": 500}
+        output, cash_balances, game_records = self.play(False, game_config, deal_source=DealSource(9, seed=3, chunk_size=200))
+        self.assertEqual(self.play(True, game_config, deal_source=DealSource(9, seed=3, chunk_size=200)), (output, cash_balances, game_records))
+        deal_source = DealSource(9, seed=3, chunk_size=200)
+        cards = [[record["Value"] for record in game_records if record["Description"] == "Card" and record["Round_Number"] == round_number] for round_number in (1, 500)]
+        self.assertEqual([sorted(cards[0]), sorted(cards[1])], [sorted(deal_source.deal(0)), sorted(deal_source.deal(499))])
+        with self.assertRaises(ValueError):
+            Game("test", game_records=new_game_records(), GAME_CONFIG=game_config, deal_source=DealSource(8))
+
+    def test_records_only_kept_on_request(self):
+        game_config: GameConfig = {**GAME_CONFIG, "NUMBER_ROUNDS": 100}
+        output, cash_balances, game_records = self.play(True, game_config, keep_records=False)
+        self.assertEqual(len(game_records), 1)
+        self.assertEqual((output, cash_balances), self.play(False, game_config)[:2])
+
+    def test_player_debug_plays_with_play(self):
+        # The players log the round data they are passed, so the game is played with play, which keeps the records
+        game_config: GameConfig = {**GAME_CONFIG, "NUMBER_ROUNDS": 10}
+        with self.assertLogs("player", level="DEBUG"):
+            game_records = self.play(True, game_config, keep_records=False)[2]
+        self.assertGreater(len(game_records), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+
+"""
+This module holds the store of game records, which keeps the records of a game according to the record policy in the game configuration.
+Author: Seán Young
+"""
+
+from __future__ import annotations
+import csv
+from collections import deque
+from typing import IO, Any, Iterator, Optional, Sequence, overload
+
+from configuration import GameConfig, GameRecord, RecordPolicy
+
+class GameRecords(Sequence[GameRecord]):
+    """
+        The records of a game, i.e., the "Game Start" record followed by the records of each betting round.
+        A round starts with its "Round Start" record and the records are kept according to the record policy:
+        - "All": Every round is kept.
+        - "Off": No round is kept.
+        - "Last": Only the last last_rounds rounds are kept, so memory stays flat however many rounds are played.
+        - "Sample": Every sample_rounds-th round, starting with round 1, is kept, and only the last last_rounds of those.
+        - "File": Every record is written to the CSV file at file_path as it is added, and the last last_rounds rounds are kept.
+        Rounds are kept or dropped as a whole, so reading the records always gives whole rounds, with the current round last.
+    Args:
+        policy (RecordPolicy): The record policy.
+        last_rounds (int): The number of rounds kept by the "Last", "Sample" and "File" policies.
+        sample_rounds (int): The interval in rounds between the rounds kept by the "Sample" policy.
+        file_path (str): The CSV file written by the "File" policy.
+    """
+
+    def __init__(self, policy: RecordPolicy = "All", last_rounds: int = 1000, sample_rounds: int = 1000, file_path: str = "game_records.csv") -> None:
+        if policy not in ("All", "Off", "Last", "Sample", "File"):
+            raise ValueError(f"Invalid record policy {policy}")
+        if last_rounds < 1 or sample_rounds < 1:
+            raise ValueError("The number of rounds kept and the sample interval must be at least 1")
+        self.policy = policy
+        self.sample_rounds = sample_rounds
+        self.file_path = file_path
+        self.start_record: GameRecord = {
+            "Game_Id": "",
+            "Round_Number": 0,
+            "Pot": 0,
+            "Description": "Game Start",
+            "Player": "None",
+            "Value": 0
+        }
+        # The maximum number of rounds kept, or None for no maximum
+        self.last_rounds: Optional[int] = None if policy == "All" else last_rounds
+        # The records kept, as one list that is added to as records are added and from which the oldest round is deleted when it is dropped, so reading the records never rebuilds the list
+        self._records: list[GameRecord] = [self.start_record]
+        # The number of records of each round kept, oldest first
+        self._round_sizes: deque[int] = deque()
+        # True if the current round is kept
+        self._is_round_kept = False
+        self._file: Optional[IO[str]] = None
+        self._writer: Optional[csv.DictWriter[str]] = None
+
+    @classmethod
+    def from_config(cls, game_config: GameConfig) -> GameRecords:
+        """Creates the game records with the record policy of a game configuration"""
+        return cls(
+            policy=game_config["RECORD_POLICY"],
+            last_rounds=game_config["RECORD_LAST_ROUNDS"],
+            sample_rounds=game_config["RECORD_SAMPLE_ROUNDS"],
+            file_path=game_config["RECORD_FILE_PATH"]
+        )
+
+    def append(self, record: GameRecord) -> None:
+        """Adds a record to the current round, or starts a new round if it is a "Round Start" record"""
+        if self.policy == "File":
+            self._write(record)
+        if record["Description"] == "Round Start":
+            if self.policy == "Off" or (self.policy == "Sample" and (record["Round_Number"] - 1) % self.sample_rounds != 0):
+                self._is_round_kept = False
+                return
+            if len(self._round_sizes) == self.last_rounds:
+                # Drop the oldest round, whose records follow the "Game Start" record
+                del self._records[1:1 + self._round_sizes.popleft()]
+            self._round_sizes.append(0)
+            self._is_round_kept = True
+        elif not self._is_round_kept:
+            return
+        self._records.append(record)
+        self._round_sizes[-1] += 1
+
+    def _write(self, record: GameRecord) -> None:
+        if self._writer is None:
+            # The file is opened with the first round so the game id is set in the "Game Start" record
+            self._file = open(self.file_path, 'w', newline='')
+            self._writer = csv.DictWriter(self._file, fieldnames=list(self.start_record.keys()))
+            self._writer.writeheader()
+            self._writer.writerow(self.start_record)
+        self._writer.writerow(record)
+
+    def close(self) -> None:
+        """Closes the file written by the "File" policy"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
+
+    def get_records(self) -> list[GameRecord]:
+        """Returns a copy of the records kept as a list, which is not changed as further records are added"""
+        return list(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @overload
+    def __getitem__(self, index: int) -> GameRecord: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[GameRecord]: ...
+    def __getitem__(self, index: Any) -> Any:
+        return self._records[index]
+
+    def __iter__(self) -> Iterator[GameRecord]:
+        return iter(self._records)
+
+    def __repr__(self) -> str:
+        return f"GameRecords({self.policy}, {len(self._round_sizes)} rounds)"
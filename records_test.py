@@ -0,0 +1,78 @@
+import contextlib
+import csv
+import io
+import os
+import random
+import tempfile
+import unittest
+
+from configuration import GAME_CONFIG, GameConfig, GameRecord
+from pokerlite import Game
+from records import GameRecords
+
+def play(game_config: GameConfig) -> Game:
+    random.seed(3)
+    game = Game("test", GAME_CONFIG=game_config)
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.play()
+    return game
+
+def round_numbers(records: list[GameRecord]) -> list[int]:
+    return sorted({record["Round_Number"] for record in records[1:]})
+
+class TestGameRecords(unittest.TestCase):
+
+    def setUp(self):
+        self.game_config: GameConfig = {**GAME_CONFIG, "NUMBER_ROUNDS": 200, "RECORD_POLICY": "All", "RECORD_LAST_ROUNDS": 10, "RECORD_SAMPLE_ROUNDS": 50}
+        self.all_records = list(play(self.game_config).game_records)
+
+    def test_all(self):
+        self.assertEqual(self.all_records[0]["Game_Id"], "test")
+        self.assertEqual(round_numbers(self.all_records), list(range(1, 201)))
+
+    def test_off(self):
+        game = play({**self.game_config, "RECORD_POLICY": "Off"})
+        self.assertEqual(list(game.game_records), self.all_records[:1])
+
+    def test_last(self):
+        game = play({**self.game_config, "RECORD_POLICY": "Last"})
+        expected = self.all_records[:1] + [record for record in self.all_records[1:] if record["Round_Number"] > 190]
+        self.assertEqual(list(game.game_records), expected)
+        for player in game.players:
+            self.assertIs(player.get_game_stats(), game.game_records)
+
+    def test_sample(self):
+        game = play({**self.game_config, "RECORD_POLICY": "Sample"})
+        self.assertEqual(round_numbers(list(game.game_records)), [1, 51, 101, 151])
+
+    def test_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "game_records.csv")
+            game = play({**self.game_config, "RECORD_POLICY": "File", "RECORD_FILE_PATH": file_path})
+            with open(file_path, newline='') as file:
+                rows = list(csv.DictReader(file))
+        self.assertEqual(rows, [{key: str(value) for key, value in record.items()} for record in self.all_records])
+        self.assertEqual(round_numbers(list(game.game_records)), list(range(191, 201)))
+
+    def test_whole_rounds(self):
+        game_records = GameRecords("Last", last_rounds=1)
+        game_records.append({"Game_Id": "", "Round_Number": 1, "Pot": 0, "Description": "Round Start", "Player": "None", "Value": 1})
+        game_records.append({"Game_Id": "", "Round_Number": 1, "Pot": 0, "Description": "Checked", "Player": "None", "Value": 0})
+        game_records.append({"Game_Id": "", "Round_Number": 2, "Pot": 0, "Description": "Round Start", "Player": "None", "Value": 2})
+        self.assertEqual([record["Description"] for record in game_records], ["Game Start", "Round Start"])
+        self.assertEqual(game_records[-1]["Round_Number"], 2)
+
+    def test_read_after_every_append(self):
+        # A player reads the records while the game adds to them, so each read must see the record just added
+        for policy in ("All", "Last", "Sample"):
+            game_records = GameRecords(policy, last_rounds=10, sample_rounds=50)
+            for record in self.all_records[1:]:
+                game_records.append(record)
+                if policy != "Sample" or (record["Round_Number"] - 1) % 50 == 0:
+                    self.assertIs(game_records[-1], record)
+                self.assertEqual(len(game_records), len(game_records.get_records()))
+            expected = list(play({**self.game_config, "RECORD_POLICY": policy}).game_records)
+            self.assertEqual(list(game_records)[1:], expected[1:])
+
+if __name__ == '__main__':
+    unittest.main()
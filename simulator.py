@@ -3,13 +3,12 @@ Runs a simulation of the pokerlite game.
 Author: Seán Young
 """
 
-from typing import Any, cast
+from typing import Optional, cast
 import logging
-import logging.config
-logging.config.fileConfig('logging.conf')
-logger = logging.getLogger('simulator')
 import numpy as np
 import time
+from itertools import islice, product
+from concurrent.futures import ProcessPoolExecutor
 
 from configuration import \
     CARD_HIGH_NUMBER, \
@@ -21,26 +20,35 @@ from configuration import \
     SeeBetValues, \
     BOLD, \
     UNDERLINE, \
-    RESET
+    RESET, \
+    configure_logging
 from simulator_config import \
     mode, \
     FILE_PATH, \
+    EXPORT_DIR, \
     INNER_DEBUG, \
     TIME_DEBUG, \
-    player1_dealer_open_strategy_list, \
-    player1_dealer_see_or_raise_after_non_dealer_opens_strategy_list, \
-    player1_dealer_see_after_non_dealer_raises_strategy_list, \
-    player1_non_dealer_open_after_dealer_checks_strategy_list, \
-    player1_non_dealer_see_or_raise_after_dealer_opens_strategy_list, \
-    player1_non_dealer_see_after_dealer_raises_strategy_list, \
-    player2_dealer_open_strategy_list, \
-    player2_dealer_see_or_raise_after_non_dealer_opens_strategy_list, \
-    player2_dealer_see_after_non_dealer_raises_strategy_list, \
-    player2_non_dealer_open_after_dealer_checks_strategy_list, \
-    player2_non_dealer_see_or_raise_after_dealer_opens_strategy_list,\
-    player2_non_dealer_see_after_dealer_raises_strategy_list
-from matrix_manipulation import calc_optimal_strategy_combo
-from utilities import download_matrix, get_key_data
+    BATCH_MODE, \
+    CACHE_DIR, \
+    CACHE_MAX_BYTES, \
+    EXTEND_PRIOR_MATRIX, \
+    RESULTS_MATRIX_DTYPE, \
+    RESULTS_MATRIX_MEMMAP_PATH, \
+    PRUNE_DOMINATED_STRATEGIES, \
+    SOLVER, \
+    SOLVER_EPSILON, \
+    SOLVER_MAX_ITERATIONS, \
+    max_len_strategies, \
+    limits, \
+    parse_arguments
+from matrix_cache import get_cache_parameters, encode_strategy_lists, get_cache_key, load_results_matrix, load_strategy_codes, find_prior_entries, match_strategy_triples, save_results_matrix
+from matrix_export import download_strategies_matrix, save_strategies_matrix, StrategiesMatrix
+from matrix_manipulation import calc_optimal_strategy_combos, calc_approximate_strategy_combos, calc_double_oracle_strategy_combos, eliminate_dominated_strategies, OptimalStrategies
+from matrix_store import MatrixStore
+from vectorized_simulator import batched_dealer_gain_matrix, dealer_gain_matrix_from_actions, encode_strategy_triples, score_strategy_combo
+
+configure_logging()
+logger = logging.getLogger('simulator')
 
 # Runs the betting round loop for every possible card combination between dealer and non-dealer, all equally likely, and sums winnings over all
 def inner_betting_round_loop(
@@ -318,6 +326,320 @@ def inner_betting_round_loop(
         "num_pot_returns": num_pot_returns,
     }
 
+# Calculates a slice of rows of the dealer vs. non-dealer results matrix so the rows can be shared between worker processes
+def calc_results_rows(
+    start: int,
+    stop: int,
+    batch_mode: bool,
+    dealer_open_strategy_list: list[dict[int, OpenBetValues]],
+    dealer_see_strategy_list: list[dict[int, SeeBetValues]],
+    dealer_raise_strategy_list: list[dict[int, SeeBetValues]],
+    non_dealer_open_strategy_list: list[dict[int, OpenBetValues]],
+    non_dealer_see_strategy_list: list[dict[int, SeeBetValues]],
+    non_dealer_raise_strategy_list: list[dict[int, SeeBetValues]],
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+
+    """
+    Calculates rows start to stop (exclusive) of the results matrix, where each row is a non-dealer strategy set and each column is a dealer strategy set, ordered as in outer_strategies_to_be_tested_loop.
+
+    Args:
+        start (int): The first row to calculate.
+        stop (int): The row after the last row to calculate.
+        batch_mode (bool): True to calculate the rows with batched matrix operations, False to score each cell separately from the payoff tables (or with the inner loop if INNER_DEBUG is set).
+        dealer_open_strategy_list ... non_dealer_raise_strategy_list: The lists of dealer and non-dealer strategies.
+        out (Optional[np.ndarray]): A preallocated array for the rows, e.g. a slice of the results matrix, which is filled in place. Defaults to a new float64 array.
+
+    Returns:
+        np.ndarray: The dealer gain per round for each cell in the rows, rounded to 4 decimal places.
+    """
+
+    if batch_mode:
+        return batched_dealer_gain_matrix(
+            dealer_open_strategy_list=dealer_open_strategy_list,
+            dealer_see_strategy_list=dealer_see_strategy_list,
+            dealer_raise_strategy_list=dealer_raise_strategy_list,
+            non_dealer_open_strategy_list=non_dealer_open_strategy_list,
+            non_dealer_see_strategy_list=non_dealer_see_strategy_list,
+            non_dealer_raise_strategy_list=non_dealer_raise_strategy_list,
+            row_slice=slice(start, stop),
+            out=out,
+            decimals=4,
+        )
+
+    dealer_strategy_sets = list(product(dealer_open_strategy_list, dealer_see_strategy_list, dealer_raise_strategy_list))
+    non_dealer_strategy_sets = islice(
+        product(non_dealer_open_strategy_list, non_dealer_see_strategy_list, non_dealer_raise_strategy_list), start, stop
+    )
+    # Encode each strategy set once so each cell can be scored from the per-card-pair payoff tables
+    dealer_actions = encode_strategy_triples(dealer_open_strategy_list, dealer_see_strategy_list, dealer_raise_strategy_list)
+    non_dealer_actions = encode_strategy_triples(
+        non_dealer_open_strategy_list, non_dealer_see_strategy_list, non_dealer_raise_strategy_list
+    )[start:stop]
+    results_rows = np.empty((len(non_dealer_actions), len(dealer_actions)), dtype=np.float64) if out is None else out
+    for row, (non_dealer_open_strategy, non_dealer_see_strategy, non_dealer_raise_strategy) in enumerate(non_dealer_strategy_sets):
+        for col, (dealer_open_strategy, dealer_see_strategy, dealer_raise_strategy) in enumerate(dealer_strategy_sets):
+            if INNER_DEBUG:
+                # Run the betting round so the debug statements for each card pair are printed
+                betting_round_loop_results = inner_betting_round_loop(
+                    dealer_open_strategy=dealer_open_strategy,
+                    dealer_see_strategy=dealer_see_strategy,
+                    dealer_raise_strategy=dealer_raise_strategy,
+                    non_dealer_open_strategy=non_dealer_open_strategy,
+                    non_dealer_see_strategy=non_dealer_see_strategy,
+                    non_dealer_raise_strategy=non_dealer_raise_strategy,
+                )
+            else:
+                betting_round_loop_results = score_strategy_combo(dealer_actions[col], non_dealer_actions[row])
+            results_rows[row, col] = round(cast(float,
+                betting_round_loop_results["dealer_cash_with_carries"]
+            ) / cast(int, betting_round_loop_results["num_deals"]), 4)
+    return results_rows
+
+# Preallocates the dealer vs. non-dealer results matrix so it can be filled in place
+def allocate_results_matrix(num_rows: int, num_columns: int) -> np.ndarray:
+
+    """
+    Returns an uninitialized results matrix of RESULTS_MATRIX_DTYPE, backed by a memory map of RESULTS_MATRIX_MEMMAP_PATH (in .npy format) if it is set.
+
+    Args:
+        num_rows (int): The number of non-dealer strategy sets.
+        num_columns (int): The number of dealer strategy sets.
+
+    Returns:
+        np.ndarray: The results matrix to fill.
+    """
+
+    if RESULTS_MATRIX_MEMMAP_PATH is not None:
+        return np.lib.format.open_memmap(RESULTS_MATRIX_MEMMAP_PATH, mode="w+", dtype=RESULTS_MATRIX_DTYPE, shape=(num_rows, num_columns))
+    return np.empty((num_rows, num_columns), dtype=RESULTS_MATRIX_DTYPE)
+
+# Calculates the dealer vs. non-dealer results matrix, optionally sharing the rows between a pool of worker processes
+def calc_results_matrix(
+    workers: int,
+    batch_mode: bool,
+    dealer_open_strategy_list: list[dict[int, OpenBetValues]],
+    dealer_see_strategy_list: list[dict[int, SeeBetValues]],
+    dealer_raise_strategy_list: list[dict[int, SeeBetValues]],
+    non_dealer_open_strategy_list: list[dict[int, OpenBetValues]],
+    non_dealer_see_strategy_list: list[dict[int, SeeBetValues]],
+    non_dealer_raise_strategy_list: list[dict[int, SeeBetValues]],
+) -> np.ndarray:
+
+    """
+    Calculates the full results matrix with calc_results_rows, filling a matrix preallocated by allocate_results_matrix.
+    If workers is greater than 1 the rows are split into contiguous slices which are calculated in a process pool, and each slice is copied into its place in the matrix so the matrix is identical to a serial run.
+
+    Args:
+        workers (int): The number of worker processes. 1 runs in this process.
+        batch_mode (bool): See calc_results_rows.
+        dealer_open_strategy_list ... non_dealer_raise_strategy_list: The lists of dealer and non-dealer strategies.
+
+    Returns:
+        np.ndarray: The results matrix with one row per non-dealer strategy set and one column per dealer strategy set.
+    """
+
+    strategy_lists = (
+        dealer_open_strategy_list,
+        dealer_see_strategy_list,
+        dealer_raise_strategy_list,
+        non_dealer_open_strategy_list,
+        non_dealer_see_strategy_list,
+        non_dealer_raise_strategy_list,
+    )
+    num_rows = len(non_dealer_open_strategy_list) * len(non_dealer_see_strategy_list) * len(non_dealer_raise_strategy_list)
+    num_columns = len(dealer_open_strategy_list) * len(dealer_see_strategy_list) * len(dealer_raise_strategy_list)
+    results_matrix = allocate_results_matrix(num_rows, num_columns)
+    if workers <= 1:
+        return calc_results_rows(0, num_rows, batch_mode, *strategy_lists, out=results_matrix)
+
+    # Share the rows out in a few slices per worker so a worker that finishes early picks up another slice
+    slice_size = max(1, -(-num_rows // (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            start: executor.submit(calc_results_rows, start, min(start + slice_size, num_rows), batch_mode, *strategy_lists)
+            for start in range(0, num_rows, slice_size)
+        }
+        # Copy each slice into its rows of the matrix
+        for start, future in futures.items():
+            results_rows = future.result()
+            results_matrix[start:start + len(results_rows)] = results_rows
+            if TIME_DEBUG:
+                print(f"Progress: {start + len(results_rows)} of {num_rows} results matrix rows")
+    return results_matrix
+
+# Builds the dealer vs. non-dealer results matrix from a prior results matrix, calculating only the cells not in the prior matrix
+def extend_results_matrix(
+    prior_matrix: np.ndarray,
+    prior_rows: np.ndarray,
+    prior_columns: np.ndarray,
+    dealer_open_strategy_list: list[dict[int, OpenBetValues]],
+    dealer_see_strategy_list: list[dict[int, SeeBetValues]],
+    dealer_raise_strategy_list: list[dict[int, SeeBetValues]],
+    non_dealer_open_strategy_list: list[dict[int, OpenBetValues]],
+    non_dealer_see_strategy_list: list[dict[int, SeeBetValues]],
+    non_dealer_raise_strategy_list: list[dict[int, SeeBetValues]],
+) -> np.ndarray:
+
+    """
+    Merges the cells of a prior results matrix into the results matrix for the given strategy lists and calculates the remaining cells with batched matrix operations.
+
+    Args:
+        prior_matrix (np.ndarray): The prior results matrix, e.g. memory-mapped from the cache.
+        prior_rows (np.ndarray): For each non-dealer strategy triple, the row of the prior matrix for the same triple, or -1 if it is new. See match_strategy_triples.
+        prior_columns (np.ndarray): For each dealer strategy triple, the column of the prior matrix for the same triple, or -1 if it is new.
+        dealer_open_strategy_list ... non_dealer_raise_strategy_list: The lists of dealer and non-dealer strategies.
+
+    Returns:
+        np.ndarray: The results matrix with one row per non-dealer strategy set and one column per dealer strategy set, rounded to 4 decimal places.
+    """
+
+    dealer_actions = encode_strategy_triples(dealer_open_strategy_list, dealer_see_strategy_list, dealer_raise_strategy_list)
+    non_dealer_actions = encode_strategy_triples(non_dealer_open_strategy_list, non_dealer_see_strategy_list, non_dealer_raise_strategy_list)
+    old_rows, new_rows = np.flatnonzero(prior_rows >= 0), np.flatnonzero(prior_rows < 0)
+    old_columns, new_columns = np.flatnonzero(prior_columns >= 0), np.flatnonzero(prior_columns < 0)
+
+    results_matrix = allocate_results_matrix(len(non_dealer_actions), len(dealer_actions))
+    results_matrix[np.ix_(old_rows, old_columns)] = prior_matrix[np.ix_(prior_rows[old_rows], prior_columns[old_columns])]
+    # New non-dealer strategy sets against every dealer strategy set
+    if len(new_rows) > 0:
+        results_matrix[new_rows] = np.round(dealer_gain_matrix_from_actions(dealer_actions, non_dealer_actions[new_rows]), 4)
+    # Existing non-dealer strategy sets against new dealer strategy sets
+    if len(old_rows) > 0 and len(new_columns) > 0:
+        results_matrix[np.ix_(old_rows, new_columns)] = np.round(
+            dealer_gain_matrix_from_actions(dealer_actions[new_columns], non_dealer_actions[old_rows]), 4
+        )
+    if TIME_DEBUG:
+        print(f"Reused {len(old_rows) * len(old_columns)} of {results_matrix.size} results matrix cells from a prior matrix")
+    return results_matrix
+
+# Loads the dealer vs. non-dealer results matrix from the disk cache, or calculates it and saves it to the cache
+def load_or_calc_results_matrix(
+    workers: int,
+    batch_mode: bool,
+    dealer_open_strategy_list: list[dict[int, OpenBetValues]],
+    dealer_see_strategy_list: list[dict[int, SeeBetValues]],
+    dealer_raise_strategy_list: list[dict[int, SeeBetValues]],
+    non_dealer_open_strategy_list: list[dict[int, OpenBetValues]],
+    non_dealer_see_strategy_list: list[dict[int, SeeBetValues]],
+    non_dealer_raise_strategy_list: list[dict[int, SeeBetValues]],
+) -> np.ndarray:
+
+    """
+    Returns the results matrix calculated by calc_results_matrix, using the cache in CACHE_DIR (see matrix_cache.py) unless CACHE_DIR is None.
+    The cache entry is keyed by the game configuration, max_len_strategies, limits and the strategy lists, so the matrix is only recalculated when one of them changes.
+    If there is no entry for the strategy lists and EXTEND_PRIOR_MATRIX is set, the matrix is built from the cached matrix with the most strategies in common, e.g. from the run before max_len_strategies or limits was increased, and only the cells for new strategies are calculated.
+
+    Args:
+        workers (int): See calc_results_matrix.
+        batch_mode (bool): See calc_results_rows.
+        dealer_open_strategy_list ... non_dealer_raise_strategy_list: The lists of dealer and non-dealer strategies.
+
+    Returns:
+        np.ndarray: The results matrix with one row per non-dealer strategy set and one column per dealer strategy set. A matrix loaded from the cache is memory-mapped read-only.
+    """
+
+    strategy_lists = (
+        dealer_open_strategy_list,
+        dealer_see_strategy_list,
+        dealer_raise_strategy_list,
+        non_dealer_open_strategy_list,
+        non_dealer_see_strategy_list,
+        non_dealer_raise_strategy_list,
+    )
+    if CACHE_DIR is None:
+        return calc_results_matrix(workers, batch_mode, *strategy_lists)
+
+    parameters = get_cache_parameters(max_len_strategies, limits)
+    strategy_codes = encode_strategy_lists(strategy_lists)
+    key = get_cache_key(parameters, strategy_codes)
+    cached_matrix = load_results_matrix(CACHE_DIR, key)
+    if cached_matrix is not None:
+        if TIME_DEBUG:
+            print(f"Loaded the results matrix from the cache entry {key}")
+        return cached_matrix
+
+    results_matrix: Optional[np.ndarray] = None
+    if EXTEND_PRIOR_MATRIX:
+        # Use the prior matrix with the most cells in common with the new matrix
+        best_num_cells, best_key, best_rows, best_columns = 0, "", np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+        for prior_key in find_prior_entries(CACHE_DIR, parameters):
+            prior_strategy_codes = load_strategy_codes(CACHE_DIR, prior_key)
+            prior_rows = match_strategy_triples(prior_strategy_codes, strategy_codes, "non_dealer")
+            prior_columns = match_strategy_triples(prior_strategy_codes, strategy_codes, "dealer")
+            num_cells = np.count_nonzero(prior_rows >= 0) * np.count_nonzero(prior_columns >= 0)
+            if num_cells > best_num_cells:
+                best_num_cells, best_key, best_rows, best_columns = num_cells, prior_key, prior_rows, prior_columns
+        if best_num_cells > 0:
+            prior_matrix = load_results_matrix(CACHE_DIR, best_key)
+            if prior_matrix is not None:
+                if TIME_DEBUG:
+                    print(f"Extending the results matrix from the cache entry {best_key}")
+                results_matrix = extend_results_matrix(prior_matrix, best_rows, best_columns, *strategy_lists)
+    if results_matrix is None:
+        results_matrix = calc_results_matrix(workers, batch_mode, *strategy_lists)
+    save_results_matrix(CACHE_DIR, key, parameters, strategy_codes, results_matrix, CACHE_MAX_BYTES)
+    if TIME_DEBUG:
+        print(f"Saved the results matrix to the cache entry {key}")
+    return results_matrix
+
+# Solves the dealer vs. non-dealer game by the double oracle method and downloads the restricted game
+def run_double_oracle(
+    dealer_open_strategy_list: list[dict[int, OpenBetValues]],
+    dealer_see_strategy_list: list[dict[int, SeeBetValues]],
+    dealer_raise_strategy_list: list[dict[int, SeeBetValues]],
+    non_dealer_open_strategy_list: list[dict[int, OpenBetValues]],
+    non_dealer_see_strategy_list: list[dict[int, SeeBetValues]],
+    non_dealer_raise_strategy_list: list[dict[int, SeeBetValues]],
+) -> None:
+
+    """
+    Finds the optimal dealer and non-dealer strategy percentages with calc_double_oracle_strategy_combos, so only the results matrix rows and columns for the strategies in the restricted game are calculated.
+    Each row or column is the dealer gain per round that inner_betting_round_loop gives for each strategy combination, calculated in batched matrix operations.
+    The strategies matrix of the restricted game is downloaded to FILE_PATH in the same layout as the full game.
+
+    Args:
+        dealer_open_strategy_list ... non_dealer_raise_strategy_list: The lists of dealer and non-dealer strategies.
+    """
+
+    if TIME_DEBUG:
+        start_time = time.time()
+        print("Starting double oracle")
+    dealer_actions = encode_strategy_triples(dealer_open_strategy_list, dealer_see_strategy_list, dealer_raise_strategy_list)
+    non_dealer_actions = encode_strategy_triples(non_dealer_open_strategy_list, non_dealer_see_strategy_list, non_dealer_raise_strategy_list)
+
+    double_oracle_strategies = calc_double_oracle_strategy_combos(
+        num_rows=len(non_dealer_actions),
+        num_cols=len(dealer_actions),
+        calc_rows=lambda rows: np.round(dealer_gain_matrix_from_actions(dealer_actions, non_dealer_actions[rows]), 4),
+        calc_cols=lambda cols: np.round(dealer_gain_matrix_from_actions(dealer_actions[cols], non_dealer_actions), 4),
+        epsilon=SOLVER_EPSILON,
+        max_iterations=SOLVER_MAX_ITERATIONS,
+    )
+    rows, cols = double_oracle_strategies["Rows"], double_oracle_strategies["Cols"]
+    print(f"Double oracle stopped after {double_oracle_strategies['Iterations']} iterations with {len(rows)} non-dealer and {len(cols)} dealer strategies and exploitability {double_oracle_strategies['Exploitability']:.6f}")
+    if TIME_DEBUG:
+        end_time = time.time()
+        print(f"Time elapsed: {end_time - start_time:.4f} seconds")
+
+    exported_matrix: StrategiesMatrix = {
+        "Results_Matrix": double_oracle_strategies["Results_Matrix"],
+        "Rows": rows,
+        "Cols": cols,
+        "Non_Dealer_Percentages": double_oracle_strategies["Non_Dealer_Percentages"],
+        "Dealer_Percentages": double_oracle_strategies["Dealer_Percentages"],
+        "Non_Dealer_Best_Gain": double_oracle_strategies["Non_Dealer_Best_Gain"],
+        "Dealer_Best_Gain": double_oracle_strategies["Dealer_Best_Gain"],
+        "Strategy_Codes": encode_strategy_lists([
+            dealer_open_strategy_list, dealer_see_strategy_list, dealer_raise_strategy_list,
+            non_dealer_open_strategy_list, non_dealer_see_strategy_list, non_dealer_raise_strategy_list,
+        ]),
+    }
+    download_strategies_matrix(FILE_PATH, exported_matrix)
+    if EXPORT_DIR is not None:
+        save_strategies_matrix(EXPORT_DIR, exported_matrix)
+    MatrixStore.from_strategies_matrix(exported_matrix).get_key_data()
+
 # Calls the betting round loop with a set of dealer and non-dealer strategies
 def outer_strategies_to_be_tested_loop(
     set_up: dict[str, str],
@@ -327,6 +649,7 @@ def outer_strategies_to_be_tested_loop(
     innermost1_strategy_list: list[dict[int, OpenBetValues]],
     innermost2_strategy_list: list[dict[int, SeeBetValues]],
     innermost3_strategy_list: list[dict[int, SeeBetValues]],
+    workers: int = 1,
 ) -> dict[str, int | float]:
 
     """
@@ -348,6 +671,7 @@ def outer_strategies_to_be_tested_loop(
         innermost1_strategy_list (list[dict[int, str]], optional): List of strategies for the outer strategy of the inner loop.
         innermost2_strategy_list (list[list[int]], optional): List of strategies for the mid strategy of the inner loop.
         innermost3_strategy_list (list[list[int]], optional): List of strategies for the inner strategy of the inner loop.
+        workers (int, optional): In dealer vs. non-dealer mode, the number of worker processes the rows of the results matrix are shared between. Defaults to 1, i.e., no worker processes.
 
     Returns:
         dict[str, int | float]: A dictionary containing the simulation results.
@@ -387,15 +711,32 @@ def outer_strategies_to_be_tested_loop(
         player1_role = "non_dealer"
         player2_role = "dealer"               
 
+    # The double oracle solver never builds the full results and strategies matrices
+    if mode == "compare_dealer_vs_non_dealer_strategies" and set_up["inner_loop"] == "dealer" and SOLVER == "double_oracle":
+        run_double_oracle(
+            dealer_open_strategy_list=innermost1_strategy_list,
+            dealer_see_strategy_list=innermost2_strategy_list,
+            dealer_raise_strategy_list=innermost3_strategy_list,
+            non_dealer_open_strategy_list=outermost1_strategy_list,
+            non_dealer_see_strategy_list=outermost2_strategy_list,
+            non_dealer_raise_strategy_list=outermost3_strategy_list,
+        )
+        return {    
+            "tot_player1_wins": tot_player1_wins,
+            "tot_player2_wins": tot_player2_wins,
+            "tot_player1_win_or_loss": tot_player1_win_or_loss,
+            "tot_player2_win_or_loss": tot_player2_win_or_loss,
+            "tot_pot_carries": tot_pot_carries,
+            "tot_pot_returns": tot_pot_returns,
+        }
+
     # In dealer vs. non-dealer mode, set up to store all strategies and gains in a matrix
     col_iteration: int = -1
     row_iteration: int = -1
-    num_columns = len(outermost1_strategy_list) * len(outermost2_strategy_list) * len(outermost3_strategy_list)
-    num_rows = len(innermost2_strategy_list) * len(innermost1_strategy_list) * len(innermost3_strategy_list)
-    # Create an empty matrix for the results
-    results_matrix: list[list[float]] = [[0 for _ in range(num_columns)] for _ in range(num_rows)]
-    # Create a wider matrix with an 4 extra rows and columns for the 3 dealer/non-dealer strategies and the calculated percentage row
-    strategies_matrix: list[list[Any]] = [["" for _ in range(num_columns + 4)] for _ in range(num_rows + 4)]
+    # Each row is an outer loop strategy set and each column is an inner loop strategy set
+    num_rows = len(outermost1_strategy_list) * len(outermost2_strategy_list) * len(outermost3_strategy_list)
+    num_columns = len(innermost1_strategy_list) * len(innermost2_strategy_list) * len(innermost3_strategy_list)
+    results_matrix: np.ndarray
 
     # Set up to allow progress tracking
     if TIME_DEBUG:
@@ -403,99 +744,111 @@ def outer_strategies_to_be_tested_loop(
         call_counter = 0    
         start_time = time.time()
 
-    # Loop through the lists of strategy sets testing each combination in the inner round betting loop
-    for outermost1_strategy in outermost1_strategy_list:
-        for outermost2_strategy in outermost2_strategy_list:
-            for outermost3_strategy in outermost3_strategy_list:
+    # In dealer vs. non-dealer mode the results matrix can be calculated at once, in batched matrix operations and/or in worker processes, rather than one cell at a time
+    if mode == "compare_dealer_vs_non_dealer_strategies" and set_up["inner_loop"] == "dealer" and (BATCH_MODE or workers > 1):
+        if TIME_DEBUG:
+            start_time = time.time()
+            print(f"Starting results matrix calculation with {workers} worker(s)")
+        results_matrix = load_or_calc_results_matrix(
+            workers=workers,
+            batch_mode=BATCH_MODE,
+            dealer_open_strategy_list=innermost1_strategy_list,
+            dealer_see_strategy_list=innermost2_strategy_list,
+            dealer_raise_strategy_list=innermost3_strategy_list,
+            non_dealer_open_strategy_list=outermost1_strategy_list,
+            non_dealer_see_strategy_list=outermost2_strategy_list,
+            non_dealer_raise_strategy_list=outermost3_strategy_list,
+        )
+        if TIME_DEBUG:
+            end_time = time.time()
+            print(f"Time elapsed: {end_time - start_time:.4f} seconds")
+    else:
+        # Create an empty matrix for the results, to be filled in place, which is only filled in dealer vs. non-dealer mode
+        results_matrix = allocate_results_matrix(num_rows, num_columns) if mode == "compare_dealer_vs_non_dealer_strategies" else np.empty((0, 0))
+        # Loop through the lists of strategy sets testing each combination in the inner round betting loop
+        for outermost1_strategy in outermost1_strategy_list:
+            for outermost2_strategy in outermost2_strategy_list:
+                for outermost3_strategy in outermost3_strategy_list:
 
-                if TIME_DEBUG:
-                    call_counter += 1
-                    if call_counter % 100 == 0:
-                        print(f"Progress: {call_counter} of {num_calls_to_inner_loop} calls to inner loop")
-                        end_time = time.time()
-                        elapsed_time = end_time - start_time
-                        logger.debug(f"Time taken for section: {elapsed_time:.4f} seconds")
-                        start_time = time.time()
+                    if TIME_DEBUG:
+                        call_counter += 1
+                        if call_counter % 100 == 0:
+                            print(f"Progress: {call_counter} of {num_calls_to_inner_loop} calls to inner loop")
+                            end_time = time.time()
+                            elapsed_time = end_time - start_time
+                            logger.debug(f"Time taken for section: {elapsed_time:.4f} seconds")
+                            start_time = time.time()
     
-                # Dealer vs. non-dealer mode   
-                # The loop is run once and the outer loop set has the non-dealer strategy and the inner loop has the dealer strategy
-                # A results matrix is created with the dealer strategies across the top three rows and the non-dealer strategies in the first three columns
-                 # => Increment the row iteration for each new set of non-dealer strategies
-                row_iteration += 1
-                 # => Reset the column iteration before each new call to the inner loop, i.e. set of dealer strategies
-                col_iteration = -1
+                    # Dealer vs. non-dealer mode   
+                    # The loop is run once and the outer loop set has the non-dealer strategy and the inner loop has the dealer strategy
+                    # A results matrix is created with the dealer strategies across the top three rows and the non-dealer strategies in the first three columns
+                     # => Increment the row iteration for each new set of non-dealer strategies
+                    row_iteration += 1
+                     # => Reset the column iteration before each new call to the inner loop, i.e. set of dealer strategies
+                    col_iteration = -1
          
-                for innermost1_strategy in innermost1_strategy_list:
-                    for innermost2_strategy in innermost2_strategy_list:
-                        for innermost3_strategy in innermost3_strategy_list:
+                    for innermost1_strategy in innermost1_strategy_list:
+                        for innermost2_strategy in innermost2_strategy_list:
+                            for innermost3_strategy in innermost3_strategy_list:
 
-                             # Increment the column iteration for each new set of dealer strategies
-                            col_iteration += 1
+                                 # Increment the column iteration for each new set of dealer strategies
+                                col_iteration += 1
                             
-                            if set_up["inner_loop"] == "dealer":
-                                # Set the dealer as the inner loop
-                                non_dealer_open_strategy = outermost1_strategy
-                                non_dealer_see_strategy = outermost2_strategy
-                                non_dealer_raise_strategy = outermost3_strategy
-                                dealer_open_strategy = innermost1_strategy
-                                dealer_see_strategy = innermost2_strategy
-                                dealer_raise_strategy = innermost3_strategy
-                            elif set_up["inner_loop"] == "non_dealer":
-                                # Set the non-dealer as the inner loop
-                                dealer_open_strategy = outermost1_strategy
-                                dealer_see_strategy = outermost2_strategy
-                                dealer_raise_strategy = outermost3_strategy
-                                non_dealer_open_strategy = innermost1_strategy
-                                non_dealer_see_strategy = innermost2_strategy
-                                non_dealer_raise_strategy = innermost3_strategy
+                                if set_up["inner_loop"] == "dealer":
+                                    # Set the dealer as the inner loop
+                                    non_dealer_open_strategy = outermost1_strategy
+                                    non_dealer_see_strategy = outermost2_strategy
+                                    non_dealer_raise_strategy = outermost3_strategy
+                                    dealer_open_strategy = innermost1_strategy
+                                    dealer_see_strategy = innermost2_strategy
+                                    dealer_raise_strategy = innermost3_strategy
+                                elif set_up["inner_loop"] == "non_dealer":
+                                    # Set the non-dealer as the inner loop
+                                    dealer_open_strategy = outermost1_strategy
+                                    dealer_see_strategy = outermost2_strategy
+                                    dealer_raise_strategy = outermost3_strategy
+                                    non_dealer_open_strategy = innermost1_strategy
+                                    non_dealer_see_strategy = innermost2_strategy
+                                    non_dealer_raise_strategy = innermost3_strategy
                             
-                            # Run the betting round
-                            betting_round_loop_results = inner_betting_round_loop(
-                                dealer_open_strategy=dealer_open_strategy,
-                                dealer_see_strategy=dealer_see_strategy,
-                                dealer_raise_strategy=dealer_raise_strategy,
-                                non_dealer_open_strategy=non_dealer_open_strategy,
-                                non_dealer_see_strategy=non_dealer_see_strategy,
-                                non_dealer_raise_strategy=non_dealer_raise_strategy,
-                            )
-
-                            # If in player vs. player mode, store results                            
-                            if mode == "compare_player1_vs_player2_strategies":
-                                # Add results to overall totals
-                                one_run_num_deals = cast(int, betting_round_loop_results["num_deals"])
-                                num_deals += one_run_num_deals
-                                one_run_pot_carries = cast(int, betting_round_loop_results["num_pot_carries"])
-                                tot_pot_carries += one_run_pot_carries
-                                one_run_pot_returns = cast(int, betting_round_loop_results["num_pot_returns"])
-                                tot_pot_returns += one_run_pot_returns
-                                one_run_player1_wins = \
-                                    cast(int, betting_round_loop_results["num_" + player1_role + "_wins"])
-                                tot_player1_wins += one_run_player1_wins
-                                one_run_player2_wins = \
-                                    cast(int, betting_round_loop_results["num_" + player2_role + "_wins"])
-                                tot_player2_wins += one_run_player2_wins
-                                one_run_player1_win_or_loss = \
-                                    cast(float, betting_round_loop_results[player1_role + "_cash_with_carries"])
-                                tot_player1_win_or_loss += one_run_player1_win_or_loss
-                                one_run_player2_win_or_loss = \
-                                    cast(float, betting_round_loop_results[player2_role + "_cash_with_carries"])
-                                tot_player2_win_or_loss += one_run_player2_win_or_loss
-
-                            # For mode 1, add the strategies to the first three rows and columns of the matrix
-                            if mode == "compare_dealer_vs_non_dealer_strategies":
-                                # Dealer strategies go in the first three rows
-                                strategies_matrix[0][col_iteration + 4] = dealer_open_strategy
-                                strategies_matrix[1][col_iteration + 4] = dealer_see_strategy
-                                strategies_matrix[2][col_iteration + 4] = dealer_raise_strategy            
-                                # Non-dealer strategies go in the first three columns
-                                strategies_matrix[row_iteration + 4][0] = non_dealer_open_strategy
-                                strategies_matrix[row_iteration + 4][1] = non_dealer_see_strategy
-                                strategies_matrix[row_iteration + 4][2] = non_dealer_raise_strategy
-                                # Add the dealer cash as the result to the matrix
-                                one_run_num_deals = cast(int, betting_round_loop_results["num_deals"])
-                                results_matrix[row_iteration][col_iteration] = round(cast(float,
-                                    betting_round_loop_results["dealer_cash_with_carries"]
-                                ) / one_run_num_deals, 4)
+                                # Run the betting round
+                                betting_round_loop_results = inner_betting_round_loop(
+                                    dealer_open_strategy=dealer_open_strategy,
+                                    dealer_see_strategy=dealer_see_strategy,
+                                    dealer_raise_strategy=dealer_raise_strategy,
+                                    non_dealer_open_strategy=non_dealer_open_strategy,
+                                    non_dealer_see_strategy=non_dealer_see_strategy,
+                                    non_dealer_raise_strategy=non_dealer_raise_strategy,
+                                )
+
+                                # If in player vs. player mode, store results                            
+                                if mode == "compare_player1_vs_player2_strategies":
+                                    # Add results to overall totals
+                                    one_run_num_deals = cast(int, betting_round_loop_results["num_deals"])
+                                    num_deals += one_run_num_deals
+                                    one_run_pot_carries = cast(int, betting_round_loop_results["num_pot_carries"])
+                                    tot_pot_carries += one_run_pot_carries
+                                    one_run_pot_returns = cast(int, betting_round_loop_results["num_pot_returns"])
+                                    tot_pot_returns += one_run_pot_returns
+                                    one_run_player1_wins = \
+                                        cast(int, betting_round_loop_results["num_" + player1_role + "_wins"])
+                                    tot_player1_wins += one_run_player1_wins
+                                    one_run_player2_wins = \
+                                        cast(int, betting_round_loop_results["num_" + player2_role + "_wins"])
+                                    tot_player2_wins += one_run_player2_wins
+                                    one_run_player1_win_or_loss = \
+                                        cast(float, betting_round_loop_results[player1_role + "_cash_with_carries"])
+                                    tot_player1_win_or_loss += one_run_player1_win_or_loss
+                                    one_run_player2_win_or_loss = \
+                                        cast(float, betting_round_loop_results[player2_role + "_cash_with_carries"])
+                                    tot_player2_win_or_loss += one_run_player2_win_or_loss
+
+                                # For mode 1, add the dealer cash as the result to the matrix
+                                if mode == "compare_dealer_vs_non_dealer_strategies":
+                                    one_run_num_deals = cast(int, betting_round_loop_results["num_deals"])
+                                    results_matrix[row_iteration, col_iteration] = round(cast(float,
+                                        betting_round_loop_results["dealer_cash_with_carries"]
+                                    ) / one_run_num_deals, 4)
 
     # Only prepare a strategy/results matrix if required                    
     if mode == "compare_dealer_vs_non_dealer_strategies":
@@ -504,51 +857,75 @@ def outer_strategies_to_be_tested_loop(
             start_time = time.time()
             print("Starting matrix calculations")
         
-        # Calculate the percentage applied by the dealer to each strategy to minimize non-dealer gain and the non-dealer best-case gain (where a positive number represents a gain for the non-dealer)
-        dealer_percentage_list, non_dealer_best_gain = calc_optimal_strategy_combo(np.array(results_matrix), "dealer")
-        # Calculate the percentage applied by the non-dealer to each strategy to minimize dealer gain and the dealer best-case gain (where a positive number represents a gain for the dealer)
-        non_dealer_percentage_list, dealer_best_gain = calc_optimal_strategy_combo(np.array(results_matrix), "non-dealer")
+        # The solvers read the results matrix as it is, without copying it
+        results_array = results_matrix
+        num_non_dealer_strategies, num_dealer_strategies = results_array.shape
+        # Remove dominated strategies so the linear programs solve a smaller game, keeping the indices of the remaining strategies
+        # The reduced game is copied into memory, so a memory-mapped matrix is not pruned for regret matching, which reads the full matrix in blocks
+        if PRUNE_DOMINATED_STRATEGIES and not (SOLVER == "regret_matching" and isinstance(results_array, np.memmap)):
+            kept_rows, kept_cols = eliminate_dominated_strategies(results_array)
+            if TIME_DEBUG:
+                print(f"Kept {len(kept_rows)} of {num_non_dealer_strategies} non-dealer and {len(kept_cols)} of {num_dealer_strategies} dealer strategies after removing dominated strategies")
+        else:
+            kept_rows, kept_cols = np.arange(num_non_dealer_strategies), np.arange(num_dealer_strategies)
+        if len(kept_rows) == num_non_dealer_strategies and len(kept_cols) == num_dealer_strategies:
+            reduced_results_array = results_array
+        else:
+            reduced_results_array = results_array[np.ix_(kept_rows, kept_cols)]
+        # Calculate, in one linear program, the percentage applied by the dealer to each strategy to minimize non-dealer gain and the non-dealer best-case gain (where a positive number represents a gain for the non-dealer),
+        # and the percentage applied by the non-dealer to each strategy to minimize dealer gain and the dealer best-case gain (where a positive number represents a gain for the dealer)
+        optimal_strategies: OptimalStrategies
+        if SOLVER == "regret_matching":
+            approximate_strategies = calc_approximate_strategy_combos(reduced_results_array, SOLVER_EPSILON, SOLVER_MAX_ITERATIONS)
+            print(f"Regret matching stopped after {approximate_strategies['Iterations']} iterations with exploitability {approximate_strategies['Exploitability']:.6f}")
+            optimal_strategies = approximate_strategies
+        else:
+            optimal_strategies = calc_optimal_strategy_combos(reduced_results_array)
+        kept_dealer_percentage_list = optimal_strategies["Dealer_Percentages"]
+        kept_non_dealer_percentage_list = optimal_strategies["Non_Dealer_Percentages"]
+        non_dealer_best_gain = optimal_strategies["Non_Dealer_Best_Gain"]
+        dealer_best_gain = optimal_strategies["Dealer_Best_Gain"]
+        # Dominated strategies are never played
+        dealer_percentage_list = np.zeros(num_dealer_strategies)
+        dealer_percentage_list[kept_cols] = kept_dealer_percentage_list
+        non_dealer_percentage_list = np.zeros(num_non_dealer_strategies)
+        non_dealer_percentage_list[kept_rows] = kept_non_dealer_percentage_list
         
         if TIME_DEBUG:
             end_time = time.time()
             print(f"Time elapsed: {end_time - start_time:.4f} seconds")        
         
-        # Add the percentages to the strategies matrix
-        for i, percentage in enumerate(non_dealer_percentage_list):
-            strategies_matrix[i + 4][3] = percentage
-        for i, percentage in enumerate(dealer_percentage_list):
-            strategies_matrix[3][i + 4] = percentage
-        # Add other detail to the strategies matrix
-        strategies_matrix[1][0] = "Non-Dealer Best Gain per Round"
-        strategies_matrix[2][0] = non_dealer_best_gain
-        strategies_matrix[0][1] = "Dealer Best Gain per Round "
-        strategies_matrix[0][2] = dealer_best_gain
-        strategies_matrix[0][3] = "Dealer Open"
-        strategies_matrix[1][3] = "Dealer See"
-        strategies_matrix[2][3] = "Dealer Raise"
-        strategies_matrix[3][0] = "Non-Dealer Open"
-        strategies_matrix[3][1] = "Non-Dealer See"
-        strategies_matrix[3][2] = "Non-Dealer Raise"
-        strategies_matrix[3][3] = "Percentages"
-        # Copy results matrix into the strategies matrix
-        for i, row in enumerate(results_matrix):
-            for j, value in enumerate(row):            
-                strategies_matrix[i + 4][j + 4] = value
-    
+        # The strategies, percentages and results, for the CSV, the binary export and the key data report
+        exported_matrix: StrategiesMatrix = {
+            "Results_Matrix": results_array,
+            "Rows": np.arange(num_non_dealer_strategies),
+            "Cols": np.arange(num_dealer_strategies),
+            "Non_Dealer_Percentages": non_dealer_percentage_list,
+            "Dealer_Percentages": dealer_percentage_list,
+            "Non_Dealer_Best_Gain": non_dealer_best_gain,
+            "Dealer_Best_Gain": dealer_best_gain,
+            "Strategy_Codes": encode_strategy_lists([
+                innermost1_strategy_list, innermost2_strategy_list, innermost3_strategy_list,
+                outermost1_strategy_list, outermost2_strategy_list, outermost3_strategy_list,
+            ]),
+        }
+
         if TIME_DEBUG:
             start_time = time.time()
             print("Starting download")
         
-        # Download the matrix of strategies and results 
-        download_matrix(strategies_matrix, file_path=FILE_PATH)
+        # Download the matrix of strategies and results, one row at a time
+        download_strategies_matrix(FILE_PATH, exported_matrix)
+        if EXPORT_DIR is not None:
+            save_strategies_matrix(EXPORT_DIR, exported_matrix)
         
         if TIME_DEBUG:
             end_time = time.time()
             print(f"Time elapsed: {end_time - start_time:.4f} seconds")
 
          
-        # Interrogate the matrix to get and print key data
-        get_key_data(FILE_PATH)
+        # Interrogate the matrix to get and print key data, from memory rather than rereading the CSV
+        MatrixStore.from_strategies_matrix(exported_matrix).get_key_data()
     
     # Print the outer round results for player vs. player mode
     if mode == "compare_player1_vs_player2_strategies":
@@ -580,10 +957,13 @@ def outer_strategies_to_be_tested_loop(
     }
 
 # Main program
-def run_simulation() -> None:
+def run_simulation(workers: int = 1) -> None:
     """
     Runs the poker game simulation.
 
+    Args:
+        workers (int, optional): The number of worker processes used to calculate the dealer vs. non-dealer results matrix. Defaults to 1.
+
     The simulator calls a function that runs a set of loops to calculate the outcome of different strategy combinations.
     
     There are two modes of operation set in the simulator configuration file:
@@ -612,6 +992,21 @@ def run_simulation() -> None:
     tot_pot_carries: int = 0
     tot_pot_returns: int = 0
 
+    # The strategy lists are generated by the simulator configuration when first imported here, so importing the simulator module stays fast
+    from simulator_config import \
+        player1_dealer_open_strategy_list, \
+        player1_dealer_see_or_raise_after_non_dealer_opens_strategy_list, \
+        player1_dealer_see_after_non_dealer_raises_strategy_list, \
+        player1_non_dealer_open_after_dealer_checks_strategy_list, \
+        player1_non_dealer_see_or_raise_after_dealer_opens_strategy_list, \
+        player1_non_dealer_see_after_dealer_raises_strategy_list, \
+        player2_dealer_open_strategy_list, \
+        player2_dealer_see_or_raise_after_non_dealer_opens_strategy_list, \
+        player2_dealer_see_after_non_dealer_raises_strategy_list, \
+        player2_non_dealer_open_after_dealer_checks_strategy_list, \
+        player2_non_dealer_see_or_raise_after_dealer_opens_strategy_list,\
+        player2_non_dealer_see_after_dealer_raises_strategy_list
+
     results = outer_strategies_to_be_tested_loop(
         set_up={
             "inner_loop": "dealer", 
@@ -625,6 +1020,7 @@ def run_simulation() -> None:
         innermost1_strategy_list=player1_dealer_open_strategy_list,
         innermost2_strategy_list=player1_dealer_see_or_raise_after_non_dealer_opens_strategy_list,
         innermost3_strategy_list=player1_dealer_see_after_non_dealer_raises_strategy_list,        
+        workers=workers,
     )
     tot_player1_wins += cast(int, results["tot_player1_wins"])
     tot_player2_wins += cast(int, results["tot_player2_wins"])
@@ -701,4 +1097,4 @@ def run_simulation() -> None:
 
 # Run the simulation
 if __name__ == "__main__":
-    run_simulation()
+    run_simulation(workers=parse_arguments().workers)
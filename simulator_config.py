@@ -1,5 +1,8 @@
+from functools import cache
+import argparse
 from importlib import import_module
-from typing import cast
+from typing import Any, Optional, cast
+import os
 
 from utilities import generate_possible_lists
 from configuration import GAME_CONFIG, OpenBetValues, SeeBetValues
@@ -26,92 +29,145 @@ max_len_strategies = 5
 limits = "888"
 # File path tp save the results of the simulation   
 FILE_PATH = "C:/Users/syoung/Downloads/simulator-results.csv"
+# Directory to save a binary export of the strategies matrix to as well as the CSV (see matrix_export), which loads instantly even for very large matrices, or None for no binary export
+EXPORT_DIR: Optional[str] = None
 # True to print debug statements in the inner loop
 INNER_DEBUG = False
 # True to print time tracking statements
 TIME_DEBUG = True
+# True to calculate the whole dealer vs non-dealer results matrix in batched matrix operations rather than one call to the inner loop per cell (INNER_DEBUG statements are not printed in batch mode)
+BATCH_MODE = True
+# Directory of the disk cache of dealer vs non-dealer results matrices, so a rerun with the same configuration loads the matrix instead of recalculating it, or None to disable the cache
+CACHE_DIR: Optional[str] = os.path.join(os.path.dirname(os.path.abspath(__file__)), "simulator_cache")
+# Size cap on the cache directory - the least recently used matrices are deleted when it is exceeded
+CACHE_MAX_BYTES = 8 * 2**30
+# True to build a new results matrix from a cached matrix calculated with other max_len_strategies or limits, calculating only the rows and columns for strategies that are not in the cached matrix
+EXTEND_PRIOR_MATRIX = True
+# The data type of the dealer vs non-dealer results matrix, "float64" or "float32" to halve its memory (the results are rounded to 4 decimal places either way)
+RESULTS_MATRIX_DTYPE = "float64"
+# File to back a calculated results matrix with a memory map, so sweeps with matrices bigger than memory can run, or None to hold the matrix in memory
+RESULTS_MATRIX_MEMMAP_PATH: Optional[str] = None
+# True to remove dominated dealer and non-dealer strategies from the results matrix before calculating the optimal strategy percentages, which are then 0% for the removed strategies
+# (the remaining game is copied into memory, so a memory-mapped matrix is not pruned when the solver is "regret_matching")
+PRUNE_DOMINATED_STRATEGIES = True
+# The solver for the optimal dealer and non-dealer strategy percentages: "lp" for an exact linear program, "regret_matching" for an iterative approximation for matrices too big for the linear program,
+# or "double_oracle" to solve a growing restricted game without calculating the whole results matrix (only the restricted game is downloaded)
+SOLVER = "lp"
+# For the "regret_matching" and "double_oracle" solvers, the exploitability (the most the players could gain in total by changing strategy) at which to stop, and the maximum number of iterations
+SOLVER_EPSILON = 1e-4
+SOLVER_MAX_ITERATIONS = 100_000
 
 """
-Strategies for dealer vs non-dealer strategies are defined here in lists
+Strategies for dealer vs non-dealer strategies are defined here in lists.
+The lists are only generated when first used, e.g. when the simulator reads dealer_open_strategy_list from this module, so that importing this module is fast.
 """ 
-# Possible strategies for the dealer when the game opens - open high, medium or low, (or check)
-dealer_open_strategy_list: list[dict[int, OpenBetValues]] = cast(list[dict[int, OpenBetValues]], generate_possible_lists(max_len_strategies, "HML", limits))
-
-# Possible strategies for the dealer when they have checked instead of opening and the non_dealer has opened - raise high or low, see, (or fold)
-dealer_see_or_raise_after_non_dealer_opens_strategy_list: list[dict[int, SeeBetValues]] = cast(list[dict[int, SeeBetValues]], generate_possible_lists(max_len_strategies, "HMS", limits))
-
-# Possible strategies for the dealer when the non-dealer raises following a dealer open - see (or fold)
-dealer_see_after_non_dealer_raises_strategy_list: list[dict[int, SeeBetValues]] = cast(list[dict[int, SeeBetValues]], generate_possible_lists(max_len_strategies, "S"))
-
-# Possible strategies for non-dealer when the dealer checks instead of opening - open high, medium or low, (or check)
-non_dealer_open_after_dealer_checks_strategy_list: list[dict[int, OpenBetValues]] = cast(list[dict[int, OpenBetValues]], generate_possible_lists(max_len_strategies, "HML", limits))
-
-# Possible strategies for the non-dealer when the dealer opens - raise high or low, see, (or fold)
-non_dealer_see_or_raise_after_dealer_opens_strategy_list: list[dict[int, SeeBetValues]] = cast(list[dict[int, SeeBetValues]], generate_possible_lists(max_len_strategies, "HMS", limits))
-
-# Possible strategies for the non-dealer when the dealer raises following a non-dealer open (after dealer check) - see (or fold)
-non_dealer_see_after_dealer_raises_strategy_list: list[dict[int, SeeBetValues]] = cast(list[dict[int, SeeBetValues]], generate_possible_lists(max_len_strategies, "S"))
+@cache
+def get_strategy_lists() -> dict[str, list[dict[int, Any]]]:
+    """
+    Generates the lists of dealer and non-dealer strategies to be tested, once per process.
+    """
+    return {
+        # Possible strategies for the dealer when the game opens - open high, medium or low, (or check)
+        "dealer_open_strategy_list": cast(list[dict[int, OpenBetValues]], generate_possible_lists(max_len_strategies, "HML", limits)),
+        # Possible strategies for the dealer when they have checked instead of opening and the non_dealer has opened - raise high or low, see, (or fold)
+        "dealer_see_or_raise_after_non_dealer_opens_strategy_list": cast(list[dict[int, SeeBetValues]], generate_possible_lists(max_len_strategies, "HMS", limits)),
+        # Possible strategies for the dealer when the non-dealer raises following a dealer open - see (or fold)
+        "dealer_see_after_non_dealer_raises_strategy_list": cast(list[dict[int, SeeBetValues]], generate_possible_lists(max_len_strategies, "S")),
+        # Possible strategies for non-dealer when the dealer checks instead of opening - open high, medium or low, (or check)
+        "non_dealer_open_after_dealer_checks_strategy_list": cast(list[dict[int, OpenBetValues]], generate_possible_lists(max_len_strategies, "HML", limits)),
+        # Possible strategies for the non-dealer when the dealer opens - raise high or low, see, (or fold)
+        "non_dealer_see_or_raise_after_dealer_opens_strategy_list": cast(list[dict[int, SeeBetValues]], generate_possible_lists(max_len_strategies, "HMS", limits)),
+        # Possible strategies for the non-dealer when the dealer raises following a non-dealer open (after dealer check) - see (or fold)
+        "non_dealer_see_after_dealer_raises_strategy_list": cast(list[dict[int, SeeBetValues]], generate_possible_lists(max_len_strategies, "S")),
+    }
 
 """
 Strategies for a player Vs player comparison are defined here.
 You should only define one strategy for each strategy type.
 """
 
-# Import the strategies from the player files
-player_class_name = GAME_CONFIG["PLAYER_CLASS"]
-players: list[Player] = []
-for file_name in GAME_CONFIG["PLAYER_FILES"]:
-    # Import the player module, get the Player class and create an instance of it  
-    player: Player = getattr(import_module(file_name), player_class_name)()
-    players.append(player)
-
-# The strategy list for player 1 when player 1 as dealer starts the game
-player1_dealer_open_strategy_list = [players[0].strategy["Dealer_Opens"]]
-
-# The strategy list for player 1 as dealer when they have checked instead of opening and player 2 has opened.
-player1_dealer_see_or_raise_after_non_dealer_opens_strategy_list = [players[0].strategy["Dealer_Sees_after_Non_Dealer_Opens_after_Dealer_Checks"]]
-
-# The strategy list for player 1 as dealer when player 1 has opened and player 2 has raised
-player1_dealer_see_after_non_dealer_raises_strategy_list = [players[0].strategy["Dealer_Sees_after_Non_Dealer_Raises_after_Dealer_Opens"]]
-
-# The strategy list for player 1 as non-dealer when player 2 as dealer checks instead of opening
-player1_non_dealer_open_after_dealer_checks_strategy_list = [players[0].strategy["Non_Dealer_Opens_after_Dealer_Checks"]]
-
-# The strategy for player 1 as non-dealer when player 2 as dealer opens    
-player1_non_dealer_see_or_raise_after_dealer_opens_strategy_list = [players[0].strategy["Non_Dealer_Sees_after_Dealer_Opens"]]
-
-# The strategy for player 1 as non-dealer after player 2 raises following player 1's open (after player 2 checks)
-player1_non_dealer_see_after_dealer_raises_strategy_list = [
-    players[0].strategy["Non_Dealer_Sees_after_Dealer_Raises_after_Non_Dealer_Opens_after_Dealer_Checks"]
-]
-# The strategy list for player 2 when player 2 as dealer starts the game
-player2_dealer_open_strategy_list = [players[1].strategy["Dealer_Opens"]]
-
-# The strategy list for player 2 as dealer when they have checked instead of opening and player 1 has opened.
-player2_dealer_see_or_raise_after_non_dealer_opens_strategy_list = [players[1].strategy["Dealer_Sees_after_Non_Dealer_Opens_after_Dealer_Checks"]]
-
-# The strategy list for player 2 as dealer when player 2 has opened and player 1 has raised
-player2_dealer_see_after_non_dealer_raises_strategy_list = [players[1].strategy["Dealer_Sees_after_Non_Dealer_Raises_after_Dealer_Opens"]]
-
-# The strategy list for player 2 as non-dealer when player 1 as dealer checks instead of opening
-player2_non_dealer_open_after_dealer_checks_strategy_list = [players[1].strategy["Non_Dealer_Opens_after_Dealer_Checks"]]
-
-# The strategy for player 2 as non-dealer when player 1 as dealer opens    
-player2_non_dealer_see_or_raise_after_dealer_opens_strategy_list = [players[1].strategy["Non_Dealer_Sees_after_Dealer_Opens"]]
-
-# The strategy for player 2 as non-dealer after player 1 raises following player 2's open (after player 2 checks)
-player2_non_dealer_see_after_dealer_raises_strategy_list = [players[1].strategy["Non_Dealer_Sees_after_Dealer_Raises_after_Non_Dealer_Opens_after_Dealer_Checks"]]
-
-# In mode one replace the player1 dealer and non-dealer strategies with  dealer/non-dealer strategies to be tested
-if mode == "compare_dealer_vs_non_dealer_strategies":
-    player1_dealer_open_strategy_list = dealer_open_strategy_list
-    player1_dealer_see_or_raise_after_non_dealer_opens_strategy_list = dealer_see_or_raise_after_non_dealer_opens_strategy_list
-    player1_dealer_see_after_non_dealer_raises_strategy_list = dealer_see_after_non_dealer_raises_strategy_list
-    player2_non_dealer_open_after_dealer_checks_strategy_list = non_dealer_open_after_dealer_checks_strategy_list
-    player2_non_dealer_see_or_raise_after_dealer_opens_strategy_list = non_dealer_see_or_raise_after_dealer_opens_strategy_list
-    player2_non_dealer_see_after_dealer_raises_strategy_list = non_dealer_see_after_dealer_raises_strategy_list
+@cache
+def get_players() -> list[Player]:
+    """
+    Imports the player files and creates an instance of each player, once per process.
+    """
+    player_class_name = GAME_CONFIG["PLAYER_CLASS"]
+    players: list[Player] = []
+    for file_name in GAME_CONFIG["PLAYER_FILES"]:
+        # Import the player module, get the Player class and create an instance of it  
+        player: Player = getattr(import_module(file_name), player_class_name)()
+        players.append(player)
+    return players
+
+@cache
+def get_player_strategy_lists() -> dict[str, list[dict[int, Any]]]:
+    """
+    Returns the player 1 and player 2 strategy lists, once per process.
+    Each list holds the single strategy from the player file, except that in mode one the player1 dealer and player2 non-dealer strategies are replaced with the dealer and non-dealer strategies to be tested.
+    """
+    players = get_players()
+    player_strategy_lists: dict[str, list[dict[int, Any]]] = {
+        # The strategy list for player 1 when player 1 as dealer starts the game
+        "player1_dealer_open_strategy_list": [players[0].strategy["Dealer_Opens"]],
+        # The strategy list for player 1 as dealer when they have checked instead of opening and player 2 has opened.
+        "player1_dealer_see_or_raise_after_non_dealer_opens_strategy_list": [players[0].strategy["Dealer_Sees_after_Non_Dealer_Opens_after_Dealer_Checks"]],
+        # The strategy list for player 1 as dealer when player 1 has opened and player 2 has raised
+        "player1_dealer_see_after_non_dealer_raises_strategy_list": [players[0].strategy["Dealer_Sees_after_Non_Dealer_Raises_after_Dealer_Opens"]],
+        # The strategy list for player 1 as non-dealer when player 2 as dealer checks instead of opening
+        "player1_non_dealer_open_after_dealer_checks_strategy_list": [players[0].strategy["Non_Dealer_Opens_after_Dealer_Checks"]],
+        # The strategy for player 1 as non-dealer when player 2 as dealer opens    
+        "player1_non_dealer_see_or_raise_after_dealer_opens_strategy_list": [players[0].strategy["Non_Dealer_Sees_after_Dealer_Opens"]],
+        # The strategy for player 1 as non-dealer after player 2 raises following player 1's open (after player 2 checks)
+        "player1_non_dealer_see_after_dealer_raises_strategy_list": [
+            players[0].strategy["Non_Dealer_Sees_after_Dealer_Raises_after_Non_Dealer_Opens_after_Dealer_Checks"]
+        ],
+        # The strategy list for player 2 when player 2 as dealer starts the game
+        "player2_dealer_open_strategy_list": [players[1].strategy["Dealer_Opens"]],
+        # The strategy list for player 2 as dealer when they have checked instead of opening and player 1 has opened.
+        "player2_dealer_see_or_raise_after_non_dealer_opens_strategy_list": [players[1].strategy["Dealer_Sees_after_Non_Dealer_Opens_after_Dealer_Checks"]],
+        # The strategy list for player 2 as dealer when player 2 has opened and player 1 has raised
+        "player2_dealer_see_after_non_dealer_raises_strategy_list": [players[1].strategy["Dealer_Sees_after_Non_Dealer_Raises_after_Dealer_Opens"]],
+        # The strategy list for player 2 as non-dealer when player 1 as dealer checks instead of opening
+        "player2_non_dealer_open_after_dealer_checks_strategy_list": [players[1].strategy["Non_Dealer_Opens_after_Dealer_Checks"]],
+        # The strategy for player 2 as non-dealer when player 1 as dealer opens    
+        "player2_non_dealer_see_or_raise_after_dealer_opens_strategy_list": [players[1].strategy["Non_Dealer_Sees_after_Dealer_Opens"]],
+        # The strategy for player 2 as non-dealer after player 1 raises following player 2's open (after player 2 checks)
+        "player2_non_dealer_see_after_dealer_raises_strategy_list": [players[1].strategy["Non_Dealer_Sees_after_Dealer_Raises_after_Non_Dealer_Opens_after_Dealer_Checks"]],
+    }
+
+    # In mode one replace the player1 dealer and non-dealer strategies with  dealer/non-dealer strategies to be tested
+    if mode == "compare_dealer_vs_non_dealer_strategies":
+        strategy_lists = get_strategy_lists()
+        player_strategy_lists["player1_dealer_open_strategy_list"] = strategy_lists["dealer_open_strategy_list"]
+        player_strategy_lists["player1_dealer_see_or_raise_after_non_dealer_opens_strategy_list"] = strategy_lists["dealer_see_or_raise_after_non_dealer_opens_strategy_list"]
+        player_strategy_lists["player1_dealer_see_after_non_dealer_raises_strategy_list"] = strategy_lists["dealer_see_after_non_dealer_raises_strategy_list"]
+        player_strategy_lists["player2_non_dealer_open_after_dealer_checks_strategy_list"] = strategy_lists["non_dealer_open_after_dealer_checks_strategy_list"]
+        player_strategy_lists["player2_non_dealer_see_or_raise_after_dealer_opens_strategy_list"] = strategy_lists["non_dealer_see_or_raise_after_dealer_opens_strategy_list"]
+        player_strategy_lists["player2_non_dealer_see_after_dealer_raises_strategy_list"] = strategy_lists["non_dealer_see_after_dealer_raises_strategy_list"]
+
+    return player_strategy_lists
+
+def __getattr__(name: str) -> Any:
+    """
+    Provides the strategy lists and players as lazily generated module attributes, e.g. `from simulator_config import dealer_open_strategy_list`.
+    """
+    if name == "players":
+        return get_players()
+    if name.startswith(("dealer_", "non_dealer_")) and name.endswith("_strategy_list"):
+        return get_strategy_lists()[name]
+    if name.startswith(("player1_", "player2_")) and name.endswith("_strategy_list"):
+        return get_player_strategy_lists()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parses the simulator command line, which is the same whether the simulation is run from this file or from simulator.py.
+    """
+    parser = argparse.ArgumentParser(description="Run the pokerlite simulator")
+    parser.add_argument("--workers", type=int, default=1, help="The number of worker processes used to calculate the dealer vs. non-dealer results matrix")
+    return parser.parse_args()
 
 # Run the simulation
 if __name__ == "__main__":
     from simulator  import run_simulation
-    run_simulation()
\ No newline at end of file
+    run_simulation(workers=parse_arguments().workers)
\ No newline at end of file
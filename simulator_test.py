@@ -0,0 +1,47 @@
+from typing import cast
+import unittest
+
+import numpy as np
+
+from configuration import OpenBetValues, SeeBetValues
+from matrix_cache import encode_strategy_lists, match_strategy_triples
+from simulator import calc_results_matrix, extend_results_matrix
+from utilities import generate_possible_lists
+
+def create_strategy_lists(open_length: int, see_length: int, raise_length: int) -> tuple[
+    list[dict[int, OpenBetValues]], list[dict[int, SeeBetValues]], list[dict[int, SeeBetValues]],
+    list[dict[int, OpenBetValues]], list[dict[int, SeeBetValues]], list[dict[int, SeeBetValues]],
+]:
+    """Returns the same open, see or raise, and see after a raise strategy lists, with strategies up to the given lengths, for the dealer and the non-dealer"""
+    open_list = cast(list[dict[int, OpenBetValues]], generate_possible_lists(open_length, "HML", "345"))
+    see_list = cast(list[dict[int, SeeBetValues]], generate_possible_lists(see_length, "HMS", "345"))
+    raise_list = cast(list[dict[int, SeeBetValues]], generate_possible_lists(raise_length, "S"))
+    return (open_list, see_list, raise_list, open_list, see_list, raise_list)
+
+
+class TestCalcResultsMatrix(unittest.TestCase):
+
+    def setUp(self):
+        self.strategy_lists = create_strategy_lists(2, 2, 2)
+
+    def test_workers_match_serial_run(self):
+        serial = calc_results_matrix(1, False, *self.strategy_lists)
+        np.testing.assert_array_equal(calc_results_matrix(3, False, *self.strategy_lists), serial)
+        np.testing.assert_array_equal(calc_results_matrix(2, True, *self.strategy_lists), serial)
+
+class TestExtendResultsMatrix(unittest.TestCase):
+
+    def test_extended_matrix_matches_full_calculation(self):
+        prior_lists = create_strategy_lists(1, 2, 1)
+        strategy_lists = create_strategy_lists(2, 2, 2)
+        prior_matrix = calc_results_matrix(1, True, *prior_lists)
+        prior_strategy_codes = encode_strategy_lists(prior_lists)
+        strategy_codes = encode_strategy_lists(strategy_lists)
+        prior_rows = match_strategy_triples(prior_strategy_codes, strategy_codes, "non_dealer")
+        prior_columns = match_strategy_triples(prior_strategy_codes, strategy_codes, "dealer")
+        self.assertEqual(np.count_nonzero(prior_rows >= 0), prior_matrix.shape[0])
+        extended_matrix = extend_results_matrix(prior_matrix, prior_rows, prior_columns, *strategy_lists)
+        np.testing.assert_array_equal(extended_matrix, calc_results_matrix(1, True, *strategy_lists))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+"""
+Compact integer encoding of player strategies.
+
+A strategy such as {9: 'H', 8: 'M'} is stored as a fixed-length int8 vector indexed by card number (index 0 is unused as cards start at 1).
+Each element is 0 if the card is not in the strategy, i.e. the player checks or folds, and otherwise 1 plus the index of the strategy value in the bet options, i.e. OPEN_BET_OPTIONS for open strategies and SEE_BET_OPTIONS for see or raise strategies.
+A vector can also be packed into a single integer, e.g. to use as a hash key.
+"""
+
+from __future__ import annotations
+from array import array
+from typing import TYPE_CHECKING, Iterable, Mapping, cast
+
+from configuration import CARD_HIGH_NUMBER, OPEN_BET_OPTIONS, SEE_BET_OPTIONS, Strategy, StrategyCodes
+
+# NumPy is imported by the functions that use it, so importing the game, which encodes the player strategies, does not load it
+if TYPE_CHECKING:
+    import numpy as np
+
+# The data type of an encoded strategy
+STRATEGY_CODE_TYPE = "int8"
+
+def _encode_strategy_row(
+    strategy: Mapping[int, str],
+    option_codes: Mapping[str, int],
+    card_high_number: int,
+) -> list[int]:
+    row = [0] * (card_high_number + 1)
+    for card, value in strategy.items():
+        row[card] = option_codes[value]
+    return row
+
+def encode_strategy(
+    strategy: Mapping[int, str],
+    bet_options: Mapping[str, float],
+    card_high_number: int = CARD_HIGH_NUMBER,
+) -> np.ndarray:
+    """
+    Encodes a strategy dictionary as an int8 vector indexed by card number.
+
+    Args:
+        strategy (Mapping[int, str]): The strategy, e.g. {9: 'H', 8: 'M'}.
+        bet_options (Mapping[str, float]): OPEN_BET_OPTIONS for an open strategy or SEE_BET_OPTIONS for a see or raise strategy.
+        card_high_number (int): The highest card number in the deck.
+
+    Returns:
+        np.ndarray: A vector of card_high_number + 1 codes.
+    """
+    return encode_strategy_list([strategy], bet_options, card_high_number)[0]
+
+def encode_strategy_list(
+    strategy_list: Iterable[Mapping[int, str]],
+    bet_options: Mapping[str, float],
+    card_high_number: int = CARD_HIGH_NUMBER,
+) -> np.ndarray:
+    """
+    Encodes a list of strategy dictionaries as an int8 array with one row per strategy.
+    See encode_strategy.
+    """
+    import numpy as np
+    option_codes = {option: code for code, option in enumerate(bet_options, start=1)}
+    rows = [_encode_strategy_row(strategy, option_codes, card_high_number) for strategy in strategy_list]
+    return np.array(rows, dtype=STRATEGY_CODE_TYPE).reshape(len(rows), card_high_number + 1)
+
+def decode_strategy(
+    codes: Iterable[int],
+    bet_options: Mapping[str, float],
+) -> dict[int, str]:
+    """
+    Decodes an encoded strategy back to a strategy dictionary.
+    The keys are ordered from the highest card down, as in the lists from generate_possible_lists, so the dictionary prints the same as the original.
+
+    Args:
+        codes (Iterable[int]): The codes indexed by card number.
+        bet_options (Mapping[str, float]): The bet options the strategy was encoded with.
+
+    Returns:
+        dict[int, str]: The strategy, e.g. {9: 'H', 8: 'M'}.
+    """
+    options = tuple(bet_options)
+    codes = [int(code) for code in codes]
+    return {card: options[codes[card] - 1] for card in range(len(codes) - 1, 0, -1) if codes[card] != 0}
+
+def decode_strategy_list(
+    codes: np.ndarray,
+    bet_options: Mapping[str, float],
+) -> list[dict[int, str]]:
+    """
+    Decodes an array of encoded strategies, one per row, back to a list of strategy dictionaries.
+    See decode_strategy.
+    """
+    return [decode_strategy(row, bet_options) for row in codes.tolist()]
+
+def pack_strategy(
+    codes: Iterable[int],
+    bet_options: Mapping[str, float],
+) -> int:
+    """
+    Packs an encoded strategy into a single integer, with one base len(bet_options) + 1 digit per card and the highest card as the most significant digit.
+
+    Args:
+        codes (Iterable[int]): The codes indexed by card number.
+        bet_options (Mapping[str, float]): The bet options the strategy was encoded with.
+
+    Returns:
+        int: The packed strategy.
+    """
+    base = len(bet_options) + 1
+    packed = 0
+    for code in reversed([int(code) for code in codes][1:]):
+        packed = packed * base + code
+    return packed
+
+def unpack_strategy(
+    packed: int,
+    bet_options: Mapping[str, float],
+    card_high_number: int = CARD_HIGH_NUMBER,
+) -> np.ndarray:
+    """
+    Unpacks a strategy packed by pack_strategy back to an int8 vector indexed by card number.
+    """
+    import numpy as np
+    base = len(bet_options) + 1
+    codes = np.zeros(card_high_number + 1, dtype=STRATEGY_CODE_TYPE)
+    for card in range(1, card_high_number + 1):
+        packed, codes[card] = divmod(packed, base)
+    return codes
+
+def strategy_bet_options(strategy_key: str) -> Mapping[str, float]:
+    """
+    Returns the bet options used by one of the strategies in the Strategy type, i.e., OPEN_BET_OPTIONS for the open strategies and SEE_BET_OPTIONS for the see or raise strategies.
+    """
+    if strategy_key.split("_after_")[0].endswith("_Opens"):
+        return OPEN_BET_OPTIONS
+    return SEE_BET_OPTIONS
+
+def encode_player_strategy(
+    strategy: Strategy,
+    card_high_number: int = CARD_HIGH_NUMBER,
+) -> StrategyCodes:
+    """
+    Encodes each of the strategies of a player.
+    The codes are held in int8 arrays from the standard library array module, which return plain integers when indexed, so a player can look up the code for its card quickly while betting.
+
+    Args:
+        strategy (Strategy): The player's strategies.
+        card_high_number (int): The highest card number in the deck.
+
+    Returns:
+        StrategyCodes: The codes for each strategy, indexed by card number.
+    """
+    codes: dict[str, array[int]] = {}
+    for key, value in cast(Mapping[str, Mapping[int, str]], strategy).items():
+        option_codes = {option: code for code, option in enumerate(strategy_bet_options(key), start=1)}
+        codes[key] = array("b", _encode_strategy_row(value, option_codes, card_high_number))
+    return cast(StrategyCodes, codes)
+
+# Look-up tables from a strategy code to the bet, used when a player takes a bet
+OPEN_BET_AMOUNTS: tuple[int, ...] = (0, *OPEN_BET_OPTIONS.values())
+SEE_BET_FACTORS: tuple[float, ...] = (0, *SEE_BET_OPTIONS.values())
+SEE_CODE: int = 1 + list(SEE_BET_OPTIONS).index("S")
@@ -0,0 +1,27 @@
+import unittest
+
+from configuration import OPEN_BET_OPTIONS, SEE_BET_OPTIONS
+from strategy_encoding import encode_strategy, decode_strategy, pack_strategy, unpack_strategy, encode_player_strategy
+from utilities import generate_possible_lists
+
+
+class TestStrategyEncoding(unittest.TestCase):
+
+    def test_round_trip(self):
+        for strategy in generate_possible_lists(3, "HML", "345"):
+            codes = encode_strategy(strategy, OPEN_BET_OPTIONS)
+            self.assertEqual(decode_strategy(codes, OPEN_BET_OPTIONS), strategy)
+            packed = pack_strategy(codes, OPEN_BET_OPTIONS)
+            self.assertEqual(unpack_strategy(packed, OPEN_BET_OPTIONS).tolist(), codes.tolist())
+
+    def test_encode_player_strategy(self):
+        codes = encode_player_strategy({
+            "Dealer_Opens": {9: "H"},
+            "Non_Dealer_Sees_after_Dealer_Opens": {9: "S", 8: "M"},
+        }) # type: ignore
+        self.assertEqual(codes["Dealer_Opens"][9], 1 + list(OPEN_BET_OPTIONS).index("H"))
+        self.assertEqual(codes["Dealer_Opens"][8], 0)
+        self.assertEqual(codes["Non_Dealer_Sees_after_Dealer_Opens"][8], 1 + list(SEE_BET_OPTIONS).index("M"))
+
+if __name__ == '__main__':
+    unittest.main()
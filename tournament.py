@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+
+"""
+This program runs a tournament of Pokerlite games between every pairing of the player files.
+Each pairing plays a number of games in each seat order, and the games are shared out across a process pool.
+Author: Seán Young
+"""
+
+import contextlib
+import io
+from concurrent.futures import ProcessPoolExecutor
+from importlib import import_module
+from itertools import combinations
+from typing import Optional, Sequence, TypedDict
+import numpy as np
+from scipy.stats import t # type: ignore
+
+from components import derive_rng
+from configuration import ALL_PLAYER_FILES, GAME_CONFIG, PLAYER_CLASS, GameConfig
+from pokerlite import Game
+from records import GameRecords
+from utilities import print_records
+
+class TournamentResult(TypedDict):
+    Player: str # The player file
+    Opponent: str # The opponent player file, or "All" for the player's games against every opponent
+    Games: int
+    Gain_per_Round: float # The mean over the games of the player's gain per round
+    CI_Low: float # The lower bound of the confidence interval of the gain per round
+    CI_High: float # The upper bound of the confidence interval of the gain per round
+
+def get_player_files(player_files: Sequence[str] = ALL_PLAYER_FILES, player_class: str = PLAYER_CLASS) -> list[str]:
+    """
+    Returns the player files that define a player class, e.g. leaving out player files whose strategy is still to be written.
+    """
+    return [file_name for file_name in player_files if hasattr(import_module(file_name), player_class)]
+
+def play_tournament_game(player_files: tuple[str, ...], seed: int, game_index: int, game_config: GameConfig) -> list[float]:
+    """
+    Plays one tournament game, seating the players in the order of player_files, and returns each player's gain per round in that order.
+    The game has its own records with the record policy "Off", so nothing is shared between games, and is played with Game.play_fast, with the printed results discarded.
+    The cards are dealt with components.derive_rng(seed, game_index), so the game is the same whichever process plays it.
+
+    Args:
+        player_files (tuple[str, ...]): The player files in seat order.
+        seed (int): The master seed of the tournament.
+        game_index (int): The index of the game's stream of random numbers.
+        game_config (GameConfig): The game configuration, whose PLAYER_FILES are replaced by player_files.
+    """
+    game = Game(
+        f"Tournament {' v '.join(player_files)} game {game_index}",
+        game_records=GameRecords("Off"),
+        GAME_CONFIG={**game_config, "PLAYER_FILES": list(player_files)},
+        rng=derive_rng(seed, game_index)
+    )
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.play_fast()
+    return [player.cash_balance / game.NUMBER_ROUNDS for player in game.players]
+
+def summarize_gains(player: str, opponent: str, gains: Sequence[float], confidence: float) -> TournamentResult:
+    """
+    Returns the mean gain per round over a player's games, with a Student's t confidence interval.
+    The interval is NaN with fewer than two games.
+    """
+    gains_array = np.asarray(gains, dtype=np.float64)
+    mean = float(gains_array.mean())
+    if len(gains_array) > 1:
+        half_width = float(t.ppf((1 + confidence) / 2, len(gains_array) - 1) * gains_array.std(ddof=1) / np.sqrt(len(gains_array)))
+    else:
+        half_width = float("nan")
+    return {
+        "Player": player,
+        "Opponent": opponent,
+        "Games": len(gains_array),
+        "Gain_per_Round": round(mean, 4),
+        "CI_Low": round(mean - half_width, 4),
+        "CI_High": round(mean + half_width, 4),
+    }
+
+def run_tournament(
+    player_files: Optional[Sequence[str]] = None,
+    num_games: int = 10,
+    number_rounds: int = 10_000,
+    seed: int = 0,
+    workers: int = 1,
+    confidence: float = 0.95,
+    game_config: GameConfig = GAME_CONFIG,
+) -> list[TournamentResult]:
+    """
+    Plays every pairing of the player files, num_games games in each seat order, and returns each player's gain per round against each opponent and overall.
+    Game i of each pairing and seat order deals the cards with components.derive_rng(seed, i), so each pairing and seat order plays the same deals, and a run is repeatable with any number of workers.
+
+    Args:
+        player_files (Optional[Sequence[str]]): The player files. Defaults to the files in ALL_PLAYER_FILES that define a player class.
+        num_games (int): The number of games each pairing plays in each seat order.
+        number_rounds (int): The number of rounds in each game.
+        seed (int): The master seed.
+        workers (int): The number of worker processes. 1 plays the games in this process.
+        confidence (float): The confidence level of the confidence intervals.
+        game_config (GameConfig): The game configuration, whose PLAYER_FILES and NUMBER_ROUNDS are replaced.
+
+    Returns:
+        list[TournamentResult]: The results of each player against each opponent, followed by each player's overall results.
+    """
+    if player_files is None:
+        player_files = get_player_files(ALL_PLAYER_FILES, game_config["PLAYER_CLASS"])
+    if len(player_files) < 2:
+        raise ValueError("A tournament needs at least two player files")
+    tournament_config: GameConfig = {**game_config, "NUMBER_ROUNDS": number_rounds}
+    seat_orders = [seat_order for pairing in combinations(player_files, 2) for seat_order in (pairing, pairing[::-1])]
+    games = [(seat_order, game_index) for seat_order in seat_orders for game_index in range(num_games)]
+
+    if workers <= 1:
+        game_gains = [play_tournament_game(seat_order, seed, game_index, tournament_config) for seat_order, game_index in games]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            game_gains = list(executor.map(
+                play_tournament_game,
+                [seat_order for seat_order, _ in games],
+                [seed] * len(games),
+                [game_index for _, game_index in games],
+                [tournament_config] * len(games),
+                chunksize=max(1, len(games) // (workers * 4))
+            ))
+
+    # Collect each player's gains per round against each opponent, in both seat orders
+    pairing_gains: dict[tuple[str, str], list[float]] = {}
+    for (seat_order, _), gains in zip(games, game_gains):
+        for player, opponent, gain in ((seat_order[0], seat_order[1], gains[0]), (seat_order[1], seat_order[0], gains[1])):
+            pairing_gains.setdefault((player, opponent), []).append(gain)
+
+    results = [
+        summarize_gains(player, opponent, gains, confidence)
+        for (player, opponent), gains in sorted(pairing_gains.items())
+    ]
+    for player in player_files:
+        player_gains = [gain for (pairing_player, _), gains in sorted(pairing_gains.items()) if pairing_player == player for gain in gains]
+        results.append(summarize_gains(player, "All", player_gains, confidence))
+    return results
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Run a pokerlite tournament between every pairing of the players")
+    parser.add_argument("--players", nargs="+", help="The player files, by default those in ALL_PLAYER_FILES that define a player class")
+    parser.add_argument("--games", type=int, default=10, help="The number of games each pairing plays in each seat order")
+    parser.add_argument("--rounds", type=int, default=10_000, help="The number of rounds in each game")
+    parser.add_argument("--seed", type=int, default=0, help="The master random seed")
+    parser.add_argument("--workers", type=int, default=1, help="The number of worker processes used to play the games")
+    args = parser.parse_args()
+    print_records(run_tournament(args.players, args.games, args.rounds, args.seed, args.workers)) # type: ignore
@@ -0,0 +1,38 @@
+import contextlib
+import io
+import unittest
+
+from components import derive_rng
+from configuration import GAME_CONFIG, GameConfig
+from pokerlite import Game
+from records import GameRecords
+from tournament import get_player_files, play_tournament_game, run_tournament
+
+class TestTournament(unittest.TestCase):
+
+    def test_player_files(self):
+        self.assertEqual(get_player_files(), ["player1", "player4"])
+
+    def test_game_matches_play(self):
+        game_config: GameConfig = {**GAME_CONFIG, "NUMBER_ROUNDS": 500, "PLAYER_FILES": ["player4", "player1"]}
+        game = Game("test", game_records=GameRecords("Off"), GAME_CONFIG=game_config, rng=derive_rng(7, 3))
+        with contextlib.redirect_stdout(io.StringIO()):
+            game.play()
+        expected = [player.cash_balance / 500 for player in game.players]
+        self.assertEqual(play_tournament_game(("player4", "player1"), 7, 3, game_config), expected)
+
+    def test_workers_match_serial_run(self):
+        results = run_tournament(num_games=3, number_rounds=300)
+        self.assertEqual([(result["Player"], result["Opponent"], result["Games"]) for result in results], [
+            ("player1", "player4", 6),
+            ("player4", "player1", 6),
+            ("player1", "All", 6),
+            ("player4", "All", 6),
+        ])
+        for result in results:
+            self.assertLessEqual(result["CI_Low"], result["Gain_per_Round"])
+            self.assertLessEqual(result["Gain_per_Round"], result["CI_High"])
+        self.assertEqual(run_tournament(num_games=3, number_rounds=300, workers=2), results)
+
+if __name__ == '__main__':
+    unittest.main()
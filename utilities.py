@@ -5,18 +5,15 @@ Utilities.
 Author: Seán Young
 """
 
-import ast
 import logging
-import logging.config
-logging.config.fileConfig('logging.conf')
-logger = logging.getLogger('utility')
-
-from typing import Any, Iterable, cast
+from typing import Any, Iterable, Iterator, Sequence, cast
 from collections import defaultdict
 import csv
-from itertools import islice, product
+from itertools import islice
 
-from configuration import GameConfig, CARD_HIGH_NUMBER, ANTE_BET, OPEN_BET_OPTIONS, GameRecord
+from configuration import GameConfig, CARD_HIGH_NUMBER, ANTE_BET, OPEN_BET_OPTIONS, GameRecord, configure_logging
+configure_logging()
+logger = logging.getLogger('utility')
 
 # Utility function to validate bets
 def validate_bet(
@@ -39,10 +36,10 @@ def validate_bet(
         raise ValueError(f"The difference between the bet of {bet} and the required bet {required_bet} was outside the min {game_config["OPEN_BET_OPTIONS"]["L"]} or max {game_config["SEE_BET_OPTIONS"]["H"]} bet limits")
 
 # Utility function to print list of records of type Round_Record or Game_Record
-def print_records(record_list: list[Any], num_keys: int = 0, num_rows = 0) -> None:
+def print_records(record_list: Sequence[Any], num_keys: int = 0, num_rows = 0) -> None:
 
     """
-    record_list (list[Round_Record] or list[Game_Record]): A list of records to print out. Each record is a dictionary.
+    record_list (Sequence[Round_Record] or Sequence[Game_Record]): A list, or other sequence, of records to print out. Each record is a dictionary.
     num_keys (int): The number of keys of each dictionary record to print out. If 0, all keys are printed out. Default is 0.
     num_rows (int): The number of rows to print out. If 0, all rows are printed out. Default is 0.
     
@@ -139,53 +136,67 @@ def download_matrix(matrix: list[list[float]], file_path: str) -> None:
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
 
-def generate_possible_lists(length: int = 5, chars: str = 'HML', limits = "999") -> list[dict[int, str]]:
+def _composition_counts(length: int, max_occurrences: list[int]) -> Iterator[tuple[int, ...]]:
+    """
+    Yields every way of splitting length into one count per character, with each count no more than the character's limit.
+    The counts are yielded with the count of the first character descending, then the count of the second character, and so on.
+    """
+    if len(max_occurrences) == 1:
+        if length <= max_occurrences[0]:
+            yield (length,)
+        return
+    for count in range(min(length, max_occurrences[0]), -1, -1):
+        for rest in _composition_counts(length - count, max_occurrences[1:]):
+            yield (count, *rest)
+
+def iter_possible_lists(
+    length: int = 5,
+    chars: str = 'HML',
+    limits = "999",
+    card_high_number: int = CARD_HIGH_NUMBER,
+) -> Iterator[dict[int, str]]:
+    """
+    Lazily yields the dictionaries returned by generate_possible_lists, in the same order, without building the whole list.
+    Each dictionary is built directly from the number of times each character appears, so no invalid or duplicate combinations are visited.
+    The dictionaries can be encoded as they are yielded using strategy_encoding.encode_strategy_list.
+    Args:
+        length (int): The maximum dictionary length.
+        chars (str): The characters to use as dictionary values, in the order they must appear.
+        limits (str): One digit per character giving the maximum number of appearances of that character.
+        card_high_number (int): The key of the first entry in each dictionary, i.e. the highest card number.
+    """
+    max_occurrences = [int(limit) for limit in limits[:len(chars)]]
+    for list_length in range(1, length + 1):
+        for counts in _composition_counts(list_length, max_occurrences):
+            values = [char for char, count in zip(chars, counts) for _ in range(count)]
+            yield {card_high_number - index: value for index, value in enumerate(values)}
+
+def count_possible_lists(length: int = 5, chars: str = 'HML', limits = "999") -> int:
+    """
+    Returns the number of dictionaries generate_possible_lists would return for the same parameters, without generating them, so the size of a simulation can be planned beforehand.
+    """
+    max_occurrences = [int(limit) for limit in limits[:len(chars)]]
+    # ways[n] is the number of ways of making a dictionary of length n from the characters processed so far
+    ways = [1] + [0] * length
+    for max_occurrence in max_occurrences:
+        ways = [sum(ways[n - count] for count in range(min(n, max_occurrence) + 1)) for n in range(length + 1)]
+    return sum(ways[1:])
+
+def generate_possible_lists(
+    length: int = 5,
+    chars: str = 'HML',
+    limits = "999",
+    card_high_number: int = CARD_HIGH_NUMBER,
+) -> list[dict[int, str]]:
     
     """
-    Takes a length, a string of 3 characters, and a limit string of 3 digits, and generates a list of all possible dictionaries from length 1 to the given length, where each value in each dictionary is one of the characters in the provided string, and where each dictionary is such that the values only appear in the order that they appear in the provided string.  The number of appearances of a character in any dictionary is limited to the digit in the parameter limits that is in the same position as the character . The dictionaries have keys starting from 9 downwards and are sorted by length and then by the characters in the provided string.
+    Takes a length, a string of 3 characters, and a limit string of 3 digits, and generates a list of all possible dictionaries from length 1 to the given length, where each value in each dictionary is one of the characters in the provided string, and where each dictionary is such that the values only appear in the order that they appear in the provided string.  The number of appearances of a character in any dictionary is limited to the digit in the parameter limits that is in the same position as the character . The dictionaries have keys starting from card_high_number (9 by default) downwards and are sorted by length and then by the characters in the provided string.
     Example: generate_possible_lists(3, 'ABC', 133) returns: {9: A}, {9: B}, {9: A, 8: B}, {9: B, 8: B}, {9: A, 8: B, 7: B}, {9: B, 8: B, 7: B} 
+    See iter_possible_lists to generate the dictionaries lazily and count_possible_lists to count them.
     
     """
-    
-    def sort_lists_by_order(lists: list[list], sort_order: str) -> list[list]:
-        # Define a custom sort key function
-        def custom_sort_key(lst: list) -> tuple:
-            # Create a tuple of two elements: the list length and a tuple representing the sort order of each element in the list, e.g., if sort_order = "HML", then the element "L" in the list will be represented by 2 in the tuple
-            return (len(lst), tuple(sort_order.index(char) if char in sort_order else len(sort_order) for char in lst))        
-        # Sort the lists using the custom sort key
-        sorted_lists = sorted(lists, key=custom_sort_key)
-        return sorted_lists
-
-    def tuple_to_dict(tup: list[str]) -> dict:
-        # Convert a list to a dictionary with keys starting from 9 and decreasing
-        result_dict: dict = {}
-        # Iterate over the tuple with index
-        for index, value in enumerate(tup):
-            # Calculate key starting from 9 and decreasing
-            key = 9 - index
-            # Assign the value to the calculated key in the dictionary
-            result_dict[key] = value
-        return result_dict
-    
-    max_occurrences = [int(limit) for limit in limits]
-    all_possible_lists_set: set[tuple[str, ...]] = set()
+    return list(iter_possible_lists(length, chars, limits, card_high_number))
 
-    for list_length in range(1, length + 1):
-        for combination in product(chars, repeat=list_length):
-            if all(combination.count(char) <= max_occurrences[i] for i, char in enumerate(chars)):
-                sorted_combination = sorted(combination, key=lambda x: chars.index(x))
-                all_possible_lists_set.add(tuple(sorted_combination))
-
-    all_possible_lists = sort_lists_by_order([list(combination) for combination in all_possible_lists_set], chars)
-    all_possible_lists_dicts = [tuple_to_dict(combination) for combination in all_possible_lists]
-
-    return all_possible_lists_dicts
-
-list_dicts = generate_possible_lists(5, "HML", "345")
-
-# for dict_i in list_dicts:
-#    print(f"{dict_i}", end="\n")
-# print(len(list_dicts))
  
 def get_intersection_value(
     file_path: str,
@@ -211,44 +222,11 @@ def get_intersection_value(
         str: See description above
     """
     
-    # Open the CSV file
-    with open(file_path, mode='r', newline='') as file:
-            matrix = list(csv.reader(file))
-    
-    # Find the column index for combo1 in the first three row lists
-    col_index = -1
-    for col in range(len(matrix[0])):
-        try:
-            # The matrix is read in from a csv so matrix[x][y] returns ("{9; 'H'}", "{9; 'H'}", "{9; 'S'}"), for example'
-            # To convert this to a tuple of dictionaries, e.g. ({9; 'H'}, {9; 'H'}, {9; 'S'}), we use ast.literal_eval
-            col_data = tuple(ast.literal_eval(matrix[i][col]) for i in range(3))
-        except Exception as e:
-            # Ignore any errors on any values in the first few columns that are not valid dict values e.g. ""
-            continue
-        if col_data == combo1:
-            col_index = col
-            break
-    if col_index == -1:
-        raise ValueError("Combination 1 not found in the first three row lists")
-    
-    # Find the row index for combo2 in the first three elements of the remaining row lists
-    row_index = -1
-    for row in range(3, len(matrix)):
-        try:
-            # The matrix is read in from a csv so matrix[x][y] returns ("{9; 'H'}", "{9; 'H'}", "{9; 'S'}"), for example'
-            # To convert this to a tuple of dictionaries, e.g. ({9; 'H'}, {9; 'H'}, {9; 'S'}), we use ast.literal_eval
-            row_data = tuple(ast.literal_eval(matrix[row][i]) for i in range(3))
-        except Exception as e:
-            # Ignore any errors on any values in the first few rows that are not valid dict values e.g. ""
-            continue
-        if row_data == combo2:
-            row_index = row
-            break
-    if row_index == -1:
-        raise ValueError("Combination 2 not found in the first three elements of the remaining row lists")
-    
-    # Return the value at the intersection
-    return matrix[row_index][col_index]
+    # Read the file once into a store indexed by strategy set, rather than scanning the headers for each combination
+    # Use matrix_store.MatrixStore directly to look up many combinations
+    from matrix_store import MatrixStore
+    store = MatrixStore.from_csv(file_path)
+    return str(store.get_intersection_value(combo1, combo2))
 
 def is_float_and_greater_than_zero(value: Any) -> bool:
     """
@@ -275,33 +253,5 @@ def get_key_data(file_path: str) -> dict[str, tuple[dict[int, str],... ]]:
     Returns:
         tuple: Indices of values greater than zero in the 4th row.
     """
-    # Open the CSV file
-    with open(file_path, mode='r', newline='') as file:
-            matrix = list(csv.reader(file))
-
-    # Find the indices of the values greater than zero in the 4th row
-    col_indices = tuple(
-            index for index, value in enumerate(matrix[3])
-            if is_float_and_greater_than_zero(value)
-        )
-    col_headers = tuple(ast.literal_eval(matrix[i][col_indices[0]]) for i in range(3))
-    
-    # Find the indices of the values greater than zero in the 4th column
-    row_indices = tuple(
-            index for index, row in enumerate(matrix)
-            if is_float_and_greater_than_zero(row[3])
-        )
-    row_headers = tuple(ast.literal_eval(matrix[i][row_indices[0]]) for i in range(3))
-    
-    # Find the value at the intersection of the row and column indices
-    intersection = matrix[row_indices[0]][col_indices[0]]
-    
-    # Print the results
-    print(f"Dealer best strategy: {col_headers}")
-    print(f"Non-Dealer best strategy: {row_headers}")
-    print(f"Value at intersection: {intersection}")
-    
-    return {
-        "Dealer best strategy": col_headers,
-        "Non-dealer best strategy": row_headers,
-    }
+    from matrix_store import MatrixStore
+    return MatrixStore.from_csv(file_path).get_key_data()
@@ -0,0 +1,34 @@
+from itertools import product
+import unittest
+
+from utilities import generate_possible_lists, count_possible_lists
+
+
+def brute_force_possible_lists(length: int, chars: str, limits: str, card_high_number: int) -> list[dict[int, str]]:
+    # Reference implementation that enumerates every combination of characters
+    max_occurrences = [int(limit) for limit in limits]
+    combinations: set[tuple[str, ...]] = set()
+    for list_length in range(1, length + 1):
+        for combination in product(chars, repeat=list_length):
+            if all(combination.count(char) <= max_occurrences[i] for i, char in enumerate(chars)):
+                combinations.add(tuple(sorted(combination, key=chars.index)))
+    ordered = sorted(combinations, key=lambda combination: (len(combination), tuple(chars.index(char) for char in combination)))
+    return [{card_high_number - index: char for index, char in enumerate(combination)} for combination in ordered]
+
+
+class TestGeneratePossibleLists(unittest.TestCase):
+
+    def test_matches_brute_force(self):
+        for length, chars, limits, card_high_number in [
+            (5, "HML", "345", 9),
+            (5, "HMS", "345", 9),
+            (5, "S", "999", 9),
+            (6, "HML", "999", 12),
+            (4, "AB", "13", 5),
+        ]:
+            expected = brute_force_possible_lists(length, chars, limits, card_high_number)
+            self.assertEqual(generate_possible_lists(length, chars, limits, card_high_number), expected)
+            self.assertEqual(count_possible_lists(length, chars, limits), len(expected))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,549 @@
+"""
+A vectorized NumPy engine for the simulator betting round loop.
+
+The pure-Python inner_betting_round_loop in simulator.py walks every dealer/non-dealer card pair through a tree of if branches. This module precomputes the card-pair grid once, turns each strategy dictionary into boolean and bet-size masks indexed by card number, and evaluates every card pair at once with NumPy array operations.
+"""
+
+from functools import cache
+from typing import Mapping, Optional, TypedDict
+import numpy as np
+
+from configuration import \
+    CARD_HIGH_NUMBER, \
+    ANTE_BET, \
+    IS_CARRY_POT, \
+    OPEN_BET_OPTIONS, \
+    SEE_BET_OPTIONS, \
+    OpenBetValues, \
+    SeeBetValues
+from strategy_encoding import encode_strategy_list
+
+# The card pairs dealt in a betting round, one element per possible deal
+class CardPairGrid(TypedDict):
+    Dealer_Cards: np.ndarray
+    Non_Dealer_Cards: np.ndarray
+    Is_Dealer_Higher: np.ndarray
+
+# A strategy converted into arrays indexed by card number (index 0 is unused as cards start at 1)
+class StrategyMasks(TypedDict):
+    # True if the card is in the strategy, i.e. the player opens, sees or raises rather than checking or folding
+    Plays: np.ndarray
+    # True if the strategy value is "S", i.e. the player sees rather than raises
+    Sees: np.ndarray
+    # The opening bet for an open strategy, or the raise factor for a see strategy, and 0 if the card is not in the strategy
+    Amount: np.ndarray
+
+# The outcome of each card pair in a betting round
+class CardPairOutcomes(TypedDict):
+    Dealer_Cash: np.ndarray
+    Is_Dealer_Win: np.ndarray
+    Is_Non_Dealer_Win: np.ndarray
+    Is_Checked: np.ndarray
+
+# The outcome of every dealer action against every non-dealer action for every card pair
+# Each table is indexed by (dealer card - 1, dealer action, non-dealer card - 1, non-dealer action) and is zero where the cards are equal
+class PayoffTables(TypedDict):
+    Dealer_Cash: np.ndarray
+    Is_Dealer_Win: np.ndarray
+    Is_Checked: np.ndarray
+
+@cache
+def create_card_pair_grid(card_high_number: int = CARD_HIGH_NUMBER) -> CardPairGrid:
+    """
+    Creates the grid of every possible card combination between dealer and non-dealer, all equally likely.
+    The grid is cached so it is only built once per card high number.
+
+    Args:
+        card_high_number (int): The highest card number in the deck.
+
+    Returns:
+        CardPairGrid: The dealer cards, non-dealer cards and whether the dealer card is the higher card, one element per card pair.
+    """
+    cards = np.arange(1, card_high_number + 1)
+    dealer_cards, non_dealer_cards = np.meshgrid(cards, cards, indexing="ij")
+    is_different = dealer_cards != non_dealer_cards
+    dealer_cards = dealer_cards[is_different]
+    non_dealer_cards = non_dealer_cards[is_different]
+    # The arrays are shared by every caller so they are made read-only
+    for array in (dealer_cards, non_dealer_cards):
+        array.flags.writeable = False
+    is_dealer_higher = dealer_cards > non_dealer_cards
+    is_dealer_higher.flags.writeable = False
+    return {
+        "Dealer_Cards": dealer_cards,
+        "Non_Dealer_Cards": non_dealer_cards,
+        "Is_Dealer_Higher": is_dealer_higher,
+    }
+
+def strategy_to_masks(
+    strategy: Mapping[int, str],
+    bet_options: Mapping[str, float],
+    card_high_number: int = CARD_HIGH_NUMBER,
+) -> StrategyMasks:
+    """
+    Converts a strategy dictionary, e.g. {9: 'H', 8: 'M'}, into arrays indexed by card number.
+
+    Args:
+        strategy (Mapping[int, str]): The strategy dictionary mapping card numbers to bet values.
+        bet_options (Mapping[str, float]): OPEN_BET_OPTIONS for an open strategy or SEE_BET_OPTIONS for a see or raise strategy.
+        card_high_number (int): The highest card number in the deck.
+
+    Returns:
+        StrategyMasks: See the StrategyMasks type.
+    """
+    plays = np.zeros(card_high_number + 1, dtype=bool)
+    sees = np.zeros(card_high_number + 1, dtype=bool)
+    amount = np.zeros(card_high_number + 1, dtype=np.float64)
+    for card, value in strategy.items():
+        plays[card] = True
+        sees[card] = value == "S"
+        amount[card] = bet_options.get(value, 0)
+    return {
+        "Plays": plays,
+        "Sees": sees,
+        "Amount": amount,
+    }
+
+def card_pair_outcomes(
+    dealer_open: StrategyMasks,
+    dealer_see: StrategyMasks,
+    dealer_raise: StrategyMasks,
+    non_dealer_open: StrategyMasks,
+    non_dealer_see: StrategyMasks,
+    non_dealer_raise: StrategyMasks,
+    is_dealer_higher: np.ndarray,
+    ante_bet: int = ANTE_BET,
+) -> CardPairOutcomes:
+    """
+    Plays out a betting round for card pairs using array operations.
+    The masks must already be indexed by the card of the player they belong to, and all arrays must broadcast to a common shape, i.e., one element per card pair.
+    The branches follow inner_betting_round_loop in simulator.py exactly.
+
+    Args:
+        dealer_open, dealer_see, dealer_raise (StrategyMasks): The dealer's strategy masks at the dealer's card.
+        non_dealer_open, non_dealer_see, non_dealer_raise (StrategyMasks): The non-dealer's strategy masks at the non-dealer's card.
+        is_dealer_higher (np.ndarray): True where the dealer's card beats the non-dealer's card.
+        ante_bet (int): The ante paid by each player.
+
+    Returns:
+        CardPairOutcomes: The dealer's net cash for each card pair, ignoring pot carries, and flags for who won or if the round was checked.
+    """
+
+    dealer_opens = dealer_open["Plays"]
+    non_dealer_opens = non_dealer_open["Plays"]
+
+    # Dealer opens and the non-dealer sees, raises or folds
+    open_bet = dealer_open["Amount"]
+    non_dealer_calls = non_dealer_see["Plays"]
+    non_dealer_raises = non_dealer_calls & ~non_dealer_see["Sees"]
+    non_dealer_raise_amount = np.round(open_bet * non_dealer_see["Amount"])
+    dealer_folds_on_raise = non_dealer_raises & ~dealer_raise["Plays"]
+    # The amount each player has put in the pot if the round goes to a showdown
+    open_stake = ante_bet + open_bet + np.where(non_dealer_raises, non_dealer_raise_amount, 0)
+    open_showdown = non_dealer_calls & ~dealer_folds_on_raise
+
+    # Dealer checks and the non-dealer opens, after which the dealer sees, raises or folds
+    check_bet = non_dealer_open["Amount"]
+    dealer_calls = dealer_see["Plays"]
+    dealer_raises = dealer_calls & ~dealer_see["Sees"]
+    dealer_raise_amount = np.round(check_bet * dealer_see["Amount"])
+    non_dealer_folds_on_raise = dealer_raises & ~non_dealer_raise["Plays"]
+    check_stake = ante_bet + check_bet + np.where(dealer_raises, dealer_raise_amount, 0)
+    check_showdown = dealer_calls & ~non_dealer_folds_on_raise
+
+    is_showdown = np.where(dealer_opens, open_showdown, non_dealer_opens & check_showdown)
+    stake = np.where(dealer_opens, open_stake, check_stake)
+    # A player who folds loses what they have put in the pot: the ante plus the opening bet (if they opened) plus the raise (if they raised)
+    dealer_fold_loss = np.where(dealer_opens, ante_bet + open_bet, ante_bet)
+    non_dealer_fold_loss = np.where(dealer_opens, ante_bet, ante_bet + check_bet)
+    is_dealer_fold = np.where(dealer_opens, dealer_folds_on_raise, non_dealer_opens & ~dealer_calls)
+    is_checked = ~dealer_opens & ~non_dealer_opens
+
+    is_dealer_win = (is_showdown & is_dealer_higher) | (~is_showdown & ~is_dealer_fold & ~is_checked)
+    is_non_dealer_win = ~is_dealer_win & ~is_checked
+    dealer_cash = np.select(
+        [is_checked, is_showdown, is_dealer_fold],
+        [0, np.where(is_dealer_higher, stake, -stake), -dealer_fold_loss],
+        default=non_dealer_fold_loss,
+    )
+
+    return {
+        "Dealer_Cash": dealer_cash,
+        "Is_Dealer_Win": is_dealer_win,
+        "Is_Non_Dealer_Win": is_non_dealer_win,
+        "Is_Checked": is_checked,
+    }
+
+def vectorized_betting_round_loop(
+    dealer_open_strategy: dict[int, OpenBetValues],
+    dealer_see_strategy: dict[int, SeeBetValues],
+    dealer_raise_strategy: dict[int, SeeBetValues],
+    non_dealer_open_strategy: dict[int, OpenBetValues],
+    non_dealer_see_strategy: dict[int, SeeBetValues],
+    non_dealer_raise_strategy: dict[int, SeeBetValues],
+) -> dict[str, int | float]:
+    """
+    A drop-in replacement for inner_betting_round_loop in simulator.py that returns the same result dictionary.
+    See inner_betting_round_loop for the arguments and the returned dictionary.
+    """
+    return vectorized_betting_round_loop_from_masks(
+        dealer_open=strategy_to_masks(dealer_open_strategy, OPEN_BET_OPTIONS),
+        dealer_see=strategy_to_masks(dealer_see_strategy, SEE_BET_OPTIONS),
+        dealer_raise=strategy_to_masks(dealer_raise_strategy, SEE_BET_OPTIONS),
+        non_dealer_open=strategy_to_masks(non_dealer_open_strategy, OPEN_BET_OPTIONS),
+        non_dealer_see=strategy_to_masks(non_dealer_see_strategy, SEE_BET_OPTIONS),
+        non_dealer_raise=strategy_to_masks(non_dealer_raise_strategy, SEE_BET_OPTIONS),
+    )
+
+def vectorized_betting_round_loop_from_masks(
+    dealer_open: StrategyMasks,
+    dealer_see: StrategyMasks,
+    dealer_raise: StrategyMasks,
+    non_dealer_open: StrategyMasks,
+    non_dealer_see: StrategyMasks,
+    non_dealer_raise: StrategyMasks,
+) -> dict[str, int | float]:
+    """
+    As vectorized_betting_round_loop but takes strategies already converted with strategy_to_masks so a caller testing many strategy combinations only converts each strategy once.
+    """
+
+    grid = create_card_pair_grid()
+    dealer_cards = grid["Dealer_Cards"]
+    non_dealer_cards = grid["Non_Dealer_Cards"]
+
+    def at_cards(masks: StrategyMasks, cards: np.ndarray) -> StrategyMasks:
+        return {
+            "Plays": masks["Plays"][cards],
+            "Sees": masks["Sees"][cards],
+            "Amount": masks["Amount"][cards],
+        }
+
+    outcomes = card_pair_outcomes(
+        dealer_open=at_cards(dealer_open, dealer_cards),
+        dealer_see=at_cards(dealer_see, dealer_cards),
+        dealer_raise=at_cards(dealer_raise, dealer_cards),
+        non_dealer_open=at_cards(non_dealer_open, non_dealer_cards),
+        non_dealer_see=at_cards(non_dealer_see, non_dealer_cards),
+        non_dealer_raise=at_cards(non_dealer_raise, non_dealer_cards),
+        is_dealer_higher=grid["Is_Dealer_Higher"],
+    )
+
+    return _betting_round_results(
+        dealer_cash=float(outcomes["Dealer_Cash"].sum()),
+        num_dealer_wins=int(np.count_nonzero(outcomes["Is_Dealer_Win"])),
+        num_checked=int(np.count_nonzero(outcomes["Is_Checked"])),
+        num_deals=len(dealer_cards),
+    )
+
+def _betting_round_results(
+    dealer_cash: float,
+    num_dealer_wins: int,
+    num_checked: int,
+    num_deals: int,
+) -> dict[str, int | float]:
+    """
+    Shares any carried pot between the players and returns the result dictionary of inner_betting_round_loop in simulator.py.
+
+    Args:
+        dealer_cash (float): The dealer's total net cash over all card pairs, ignoring pot carries.
+        num_dealer_wins (int): The number of card pairs the dealer wins.
+        num_checked (int): The number of card pairs where both players check.
+        num_deals (int): The number of card pairs.
+    """
+    num_non_dealer_wins = num_deals - num_dealer_wins - num_checked
+    num_pot_carries = num_checked if IS_CARRY_POT else 0
+    num_pot_returns = 0 if IS_CARRY_POT else num_checked
+    # The game is zero sum so the non-dealer's cash is the negative of the dealer's cash
+    non_dealer_cash: float = -dealer_cash
+
+    # Divide carried pot between players
+    pot_carried = num_pot_carries * (2 * ANTE_BET)
+    dealer_cash_adding_carry_calculation = \
+        dealer_cash - (num_pot_carries * ANTE_BET) + \
+        (pot_carried * num_dealer_wins / (num_dealer_wins + num_non_dealer_wins))
+    non_dealer_cash_adding_carry_calculation = \
+        non_dealer_cash - (num_pot_carries * ANTE_BET) + \
+        (pot_carried * num_non_dealer_wins / (num_dealer_wins + num_non_dealer_wins))
+
+    return {
+        "num_deals": num_deals,
+        "num_dealer_wins": num_dealer_wins,
+        "num_non_dealer_wins": num_non_dealer_wins,
+        "dealer_cash_with_carries": dealer_cash_adding_carry_calculation,
+        "non_dealer_cash_with_carries": non_dealer_cash_adding_carry_calculation,
+        "num_pot_carries": num_pot_carries,
+        "num_pot_returns": num_pot_returns,
+    }
+
+# Per-card-pair payoff tables and batched whole-matrix evaluation
+# At each card a player's three strategies combine into one action, e.g. 'open high, raise medium after a check, see a raise'.
+# The outcome of a card pair depends only on the two players' actions and which card is higher, so the dealer gain matrix is a sum over card pairs of small action-vs-action tables.
+# Encoding every strategy triple as a one-hot vector of its action at each card turns that sum into matrix products, which are evaluated in tiles of rows so memory stays bounded.
+
+# The number of cells of the dealer gain matrix calculated at once by batched_dealer_gain_matrix
+MAX_TILE_CELLS: int = 2 ** 22
+
+def encode_strategy_triples(
+    open_strategy_list: list[dict[int, OpenBetValues]],
+    see_strategy_list: list[dict[int, SeeBetValues]],
+    raise_strategy_list: list[dict[int, SeeBetValues]],
+    card_high_number: int = CARD_HIGH_NUMBER,
+) -> np.ndarray:
+    """
+    Encodes every combination of an open, a see or raise, and a see after a raise strategy as the action taken at each card.
+    The combinations are ordered as the simulator loops through them, i.e., with the open strategy varying slowest and the see after a raise strategy varying fastest.
+
+    Args:
+        open_strategy_list (list[dict[int, str]]): The open strategies.
+        see_strategy_list (list[dict[int, str]]): The see or raise strategies.
+        raise_strategy_list (list[dict[int, str]]): The see after a raise strategies. Only card membership matters, as in the simulator.
+        card_high_number (int): The highest card number in the deck.
+
+    Returns:
+        np.ndarray: An array with one row per strategy triple and one column per card number (column 0 is unused) holding action codes.
+    """
+    num_see_codes = len(SEE_BET_OPTIONS) + 1
+    open_codes = encode_strategy_list(open_strategy_list, OPEN_BET_OPTIONS, card_high_number).astype(np.intp)
+    see_codes = encode_strategy_list(see_strategy_list, SEE_BET_OPTIONS, card_high_number).astype(np.intp)
+    raise_codes = (encode_strategy_list(raise_strategy_list, SEE_BET_OPTIONS, card_high_number) > 0).astype(np.intp)
+    actions = \
+        (open_codes[:, None, None, :] * num_see_codes + see_codes[None, :, None, :]) * 2 + \
+        raise_codes[None, None, :, :]
+    return actions.reshape(-1, card_high_number + 1)
+
+def _action_masks() -> tuple[StrategyMasks, StrategyMasks, StrategyMasks]:
+    """
+    Returns the open, see or raise, and see after a raise strategy masks indexed by action code rather than by card number.
+    """
+    num_see_codes = len(SEE_BET_OPTIONS) + 1
+    num_actions = (len(OPEN_BET_OPTIONS) + 1) * num_see_codes * 2
+    open_codes, see_codes, raise_codes = np.unravel_index(
+        np.arange(num_actions), (len(OPEN_BET_OPTIONS) + 1, num_see_codes, 2)
+    )
+    open_amounts = np.array([0, *OPEN_BET_OPTIONS.values()], dtype=np.float64)
+    see_amounts = np.array([0, *SEE_BET_OPTIONS.values()], dtype=np.float64)
+    is_see_option = np.array([False, *(option == "S" for option in SEE_BET_OPTIONS)])
+    return (
+        {"Plays": open_codes > 0, "Sees": np.zeros(num_actions, dtype=bool), "Amount": open_amounts[open_codes]},
+        {"Plays": see_codes > 0, "Sees": is_see_option[see_codes], "Amount": see_amounts[see_codes]},
+        {"Plays": raise_codes > 0, "Sees": raise_codes > 0, "Amount": np.zeros(num_actions)},
+    )
+
+@cache
+def create_payoff_tables(card_high_number: int = CARD_HIGH_NUMBER) -> PayoffTables:
+    """
+    Plays every dealer action against every non-dealer action for every card pair and stores the dealer's net cash, whether the dealer wins, and whether the round is checked.
+    The tables are calculated once and cached, so any strategy combination can then be scored by looking up its action at each card and summing over the card pairs.
+    Pot carries are not included as they depend on the totals over all card pairs, so they are applied afterwards.
+
+    Args:
+        card_high_number (int): The highest card number in the deck.
+
+    Returns:
+        PayoffTables: See the PayoffTables type. The tables are float32 (which holds the small integer values exactly) and read-only.
+    """
+    open_masks, see_masks, raise_masks = _action_masks()
+    num_actions = len(open_masks["Plays"])
+
+    def reshape(masks: StrategyMasks, shape: tuple[int, ...]) -> StrategyMasks:
+        return {
+            "Plays": masks["Plays"].reshape(shape),
+            "Sees": masks["Sees"].reshape(shape),
+            "Amount": masks["Amount"].reshape(shape),
+        }
+
+    # Play every dealer action against every non-dealer action, once with the dealer card lower and once with it higher
+    dealer_shape = (1, num_actions, 1)
+    non_dealer_shape = (1, 1, num_actions)
+    outcomes = card_pair_outcomes(
+        dealer_open=reshape(open_masks, dealer_shape),
+        dealer_see=reshape(see_masks, dealer_shape),
+        dealer_raise=reshape(raise_masks, dealer_shape),
+        non_dealer_open=reshape(open_masks, non_dealer_shape),
+        non_dealer_see=reshape(see_masks, non_dealer_shape),
+        non_dealer_raise=reshape(raise_masks, non_dealer_shape),
+        is_dealer_higher=np.array([False, True]).reshape(2, 1, 1),
+    )
+
+    cards = np.arange(1, card_high_number + 1)
+    # 0 where the dealer card is lower, 1 where it is higher
+    is_dealer_higher = (cards[:, None] > cards[None, :]).astype(np.intp)
+    is_different = cards[:, None] != cards[None, :]
+
+    def expand(by_card_order: np.ndarray) -> np.ndarray:
+        by_card_order = np.broadcast_to(by_card_order, (2, num_actions, num_actions))
+        table = by_card_order[is_dealer_higher] * is_different[:, :, None, None]
+        # Order the axes as (dealer card, dealer action, non-dealer card, non-dealer action)
+        table = np.ascontiguousarray(table.transpose(0, 2, 1, 3), dtype=np.float32)
+        table.flags.writeable = False
+        return table
+
+    return {
+        "Dealer_Cash": expand(outcomes["Dealer_Cash"]),
+        "Is_Dealer_Win": expand(outcomes["Is_Dealer_Win"]),
+        "Is_Checked": expand(outcomes["Is_Checked"]),
+    }
+
+def one_hot_actions(actions: np.ndarray, num_actions: int) -> np.ndarray:
+    """
+    Converts action codes, one row per strategy triple and one column per card number (column 0 unused), into one-hot rows of (card, action) indicators.
+    """
+    num_triples, num_cards = actions.shape[0], actions.shape[1] - 1
+    one_hot = np.zeros((num_triples, num_cards * num_actions), dtype=np.float32)
+    columns = np.arange(num_cards) * num_actions + actions[:, 1:]
+    one_hot[np.arange(num_triples)[:, None], columns] = 1
+    return one_hot
+
+def batched_dealer_gain_matrix(
+    dealer_open_strategy_list: list[dict[int, OpenBetValues]],
+    dealer_see_strategy_list: list[dict[int, SeeBetValues]],
+    dealer_raise_strategy_list: list[dict[int, SeeBetValues]],
+    non_dealer_open_strategy_list: list[dict[int, OpenBetValues]],
+    non_dealer_see_strategy_list: list[dict[int, SeeBetValues]],
+    non_dealer_raise_strategy_list: list[dict[int, SeeBetValues]],
+    max_tile_cells: int = MAX_TILE_CELLS,
+    row_slice: slice = slice(None),
+    out: Optional[np.ndarray] = None,
+    decimals: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Calculates the dealer gain per round for every dealer strategy triple against every non-dealer strategy triple in a few matrix products.
+    Each element equals dealer_cash_with_carries / num_deals as returned by inner_betting_round_loop for the same strategies.
+    The strategy triples are ordered as encode_strategy_triples orders them.
+
+    Args:
+        dealer_open_strategy_list ... non_dealer_raise_strategy_list: The lists of strategies to combine, as passed to outer_strategies_to_be_tested_loop.
+        max_tile_cells (int): The maximum number of matrix cells calculated at once, which bounds the temporary memory used.
+        row_slice (slice): Only calculate these rows of the matrix, e.g. when the rows are shared between worker processes. Defaults to all rows.
+        out, decimals: See dealer_gain_matrix_from_actions.
+
+    Returns:
+        np.ndarray: The dealer gain matrix with one row per non-dealer strategy triple (in row_slice) and one column per dealer strategy triple.
+    """
+
+    dealer_actions = encode_strategy_triples(
+        dealer_open_strategy_list, dealer_see_strategy_list, dealer_raise_strategy_list
+    )
+    non_dealer_actions = encode_strategy_triples(
+        non_dealer_open_strategy_list, non_dealer_see_strategy_list, non_dealer_raise_strategy_list
+    )[row_slice]
+    return dealer_gain_matrix_from_actions(dealer_actions, non_dealer_actions, max_tile_cells, out, decimals)
+
+def dealer_gain_matrix_from_actions(
+    dealer_actions: np.ndarray,
+    non_dealer_actions: np.ndarray,
+    max_tile_cells: int = MAX_TILE_CELLS,
+    out: Optional[np.ndarray] = None,
+    decimals: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Calculates the dealer gain matrix as batched_dealer_gain_matrix does, for any set of dealer and non-dealer strategy triples, e.g. only the triples missing from an earlier matrix.
+
+    Args:
+        dealer_actions (np.ndarray): The dealer strategy triples as rows of encode_strategy_triples.
+        non_dealer_actions (np.ndarray): The non-dealer strategy triples as rows of encode_strategy_triples.
+        max_tile_cells (int): The maximum number of matrix cells calculated at once, which bounds the temporary memory used.
+        out (Optional[np.ndarray]): A preallocated matrix of any float type, e.g. a memory map, which is filled in place one tile at a time. Defaults to a new float64 matrix.
+        decimals (Optional[int]): The number of decimal places to round each element to, or None to not round.
+
+    Returns:
+        np.ndarray: The dealer gain matrix with one row per non-dealer strategy triple and one column per dealer strategy triple.
+    """
+    tables = create_payoff_tables()
+    num_actions = tables["Dealer_Cash"].shape[1]
+    # Flatten each table to a matrix with one row per (dealer card, dealer action) and one column per (non-dealer card, non-dealer action)
+    num_card_actions = CARD_HIGH_NUMBER * num_actions
+    cash_table = tables["Dealer_Cash"].reshape(num_card_actions, num_card_actions)
+    dealer_win_table = tables["Is_Dealer_Win"].reshape(num_card_actions, num_card_actions)
+    checked_table = tables["Is_Checked"].reshape(num_card_actions, num_card_actions)
+
+    dealer_one_hot = one_hot_actions(dealer_actions, num_actions)
+    non_dealer_one_hot = one_hot_actions(non_dealer_actions, num_actions)
+    # Only keep the (card, action) columns that some dealer strategy triple uses
+    is_used = dealer_one_hot.any(axis=0)
+    dealer_one_hot_t = np.ascontiguousarray(dealer_one_hot[:, is_used].T)
+    # Sum each table over the non-dealer's card actions, leaving one row per non-dealer triple and one column per (dealer card, dealer action)
+    non_dealer_cash = non_dealer_one_hot @ cash_table[is_used].T
+    non_dealer_dealer_wins = non_dealer_one_hot @ dealer_win_table[is_used].T
+    non_dealer_checked = non_dealer_one_hot @ checked_table[is_used].T
+
+    num_rows, num_columns = len(non_dealer_actions), len(dealer_actions)
+    num_deals = CARD_HIGH_NUMBER * (CARD_HIGH_NUMBER - 1)
+    dealer_gain = np.empty((num_rows, num_columns), dtype=np.float64) if out is None else out
+    tile_rows = max(1, max_tile_cells // max(1, num_columns))
+    for start in range(0, num_rows, tile_rows):
+        stop = min(start + tile_rows, num_rows)
+        # The tables hold small integers so the float32 products are exact
+        dealer_cash = (non_dealer_cash[start:stop] @ dealer_one_hot_t).astype(np.float64)
+        num_dealer_wins = (non_dealer_dealer_wins[start:stop] @ dealer_one_hot_t).astype(np.float64)
+        num_checked = (non_dealer_checked[start:stop] @ dealer_one_hot_t).astype(np.float64)
+        # Divide carried pot between players, as in inner_betting_round_loop
+        num_pot_carries = num_checked if IS_CARRY_POT else np.zeros_like(num_checked)
+        num_wins = num_deals - num_checked
+        pot_carried = num_pot_carries * (2 * ANTE_BET)
+        # If every round is checked there are no wins to share the carried pot over
+        with np.errstate(divide="ignore", invalid="ignore"):
+            carry_share = np.where(num_wins > 0, pot_carried * num_dealer_wins / num_wins, 0)
+        tile = (dealer_cash - (num_pot_carries * ANTE_BET) + carry_share) / num_deals
+        dealer_gain[start:stop] = tile if decimals is None else np.round(tile, decimals)
+
+    return dealer_gain
+
+@cache
+def _stacked_payoff_tables(card_high_number: int = CARD_HIGH_NUMBER) -> np.ndarray:
+    """
+    Returns the dealer cash, dealer win and checked tables flattened and stacked into one array so all three are looked up in one indexing operation.
+    """
+    tables = create_payoff_tables(card_high_number)
+    stacked = np.stack([tables["Dealer_Cash"].ravel(), tables["Is_Dealer_Win"].ravel(), tables["Is_Checked"].ravel()])
+    stacked.flags.writeable = False
+    return stacked
+
+def score_strategy_combo(
+    dealer_actions: np.ndarray,
+    non_dealer_actions: np.ndarray,
+) -> dict[str, int | float]:
+    """
+    Scores one dealer strategy triple against one non-dealer strategy triple by looking up each card pair in the payoff tables and summing, then sharing any carried pot.
+    The cost is one table lookup per card pair rather than a run through the betting round tree.
+
+    Args:
+        dealer_actions (np.ndarray): The dealer's action at each card, i.e. one row of encode_strategy_triples.
+        non_dealer_actions (np.ndarray): The non-dealer's action at each card, i.e. one row of encode_strategy_triples.
+
+    Returns:
+        dict[str, int | float]: The result dictionary of inner_betting_round_loop in simulator.py.
+    """
+    grid = create_card_pair_grid()
+    dealer_cards = grid["Dealer_Cards"]
+    non_dealer_cards = grid["Non_Dealer_Cards"]
+    stacked_tables = _stacked_payoff_tables()
+    num_actions = create_payoff_tables()["Dealer_Cash"].shape[1]
+    num_card_actions = CARD_HIGH_NUMBER * num_actions
+    index = \
+        ((dealer_cards - 1) * num_actions + dealer_actions[dealer_cards]) * num_card_actions + \
+        (non_dealer_cards - 1) * num_actions + non_dealer_actions[non_dealer_cards]
+    dealer_cash, num_dealer_wins, num_checked = stacked_tables[:, index].sum(axis=1, dtype=np.float64)
+    return _betting_round_results(
+        dealer_cash=float(dealer_cash),
+        num_dealer_wins=int(num_dealer_wins),
+        num_checked=int(num_checked),
+        num_deals=len(dealer_cards),
+    )
+
+def table_betting_round_loop(
+    dealer_open_strategy: dict[int, OpenBetValues],
+    dealer_see_strategy: dict[int, SeeBetValues],
+    dealer_raise_strategy: dict[int, SeeBetValues],
+    non_dealer_open_strategy: dict[int, OpenBetValues],
+    non_dealer_see_strategy: dict[int, SeeBetValues],
+    non_dealer_raise_strategy: dict[int, SeeBetValues],
+) -> dict[str, int | float]:
+    """
+    A drop-in replacement for inner_betting_round_loop in simulator.py that scores the strategies with score_strategy_combo.
+    See inner_betting_round_loop for the arguments and the returned dictionary.
+    """
+    return score_strategy_combo(
+        dealer_actions=encode_strategy_triples([dealer_open_strategy], [dealer_see_strategy], [dealer_raise_strategy])[0],
+        non_dealer_actions=encode_strategy_triples([non_dealer_open_strategy], [non_dealer_see_strategy], [non_dealer_raise_strategy])[0],
+    )
@@ -0,0 +1,79 @@
+from itertools import product
+from typing import cast
+import random
+import unittest
+
+from simulator import inner_betting_round_loop
+from utilities import generate_possible_lists
+from vectorized_simulator import create_card_pair_grid, strategy_to_masks, vectorized_betting_round_loop, batched_dealer_gain_matrix, table_betting_round_loop
+from configuration import CARD_HIGH_NUMBER, OPEN_BET_OPTIONS, SEE_BET_OPTIONS, OpenBetValues, SeeBetValues
+
+
+class TestCardPairGrid(unittest.TestCase):
+
+    def test_grid(self):
+        grid = create_card_pair_grid()
+        self.assertEqual(len(grid["Dealer_Cards"]), CARD_HIGH_NUMBER * (CARD_HIGH_NUMBER - 1))
+        self.assertFalse((grid["Dealer_Cards"] == grid["Non_Dealer_Cards"]).any())
+        self.assertTrue(((grid["Dealer_Cards"] > grid["Non_Dealer_Cards"]) == grid["Is_Dealer_Higher"]).all())
+
+
+class TestStrategyToMasks(unittest.TestCase):
+
+    def test_open_strategy(self):
+        masks = strategy_to_masks({9: "H", 8: "L"}, OPEN_BET_OPTIONS)
+        self.assertEqual(masks["Plays"].tolist()[7:], [False, True, True])
+        self.assertEqual(masks["Amount"][9], OPEN_BET_OPTIONS["H"])
+        self.assertEqual(masks["Amount"][8], OPEN_BET_OPTIONS["L"])
+        self.assertEqual(masks["Amount"][7], 0)
+
+    def test_see_strategy(self):
+        masks = strategy_to_masks({9: "H", 8: "S"}, SEE_BET_OPTIONS)
+        self.assertFalse(masks["Sees"][9])
+        self.assertTrue(masks["Sees"][8])
+        self.assertEqual(masks["Amount"][9], SEE_BET_OPTIONS["H"])
+
+
+class TestBettingRoundLoopParity(unittest.TestCase):
+
+    def setUp(self):
+        self.open_list = cast(list[dict[int, OpenBetValues]], generate_possible_lists(5, "HML", "345"))
+        self.see_list = cast(list[dict[int, SeeBetValues]], generate_possible_lists(5, "HMS", "345"))
+        self.raise_list = cast(list[dict[int, SeeBetValues]], generate_possible_lists(5, "S"))
+
+    def test_parity_with_inner_betting_round_loop(self):
+        # Compare against the pure-Python loop for a random sample of strategy combinations
+        rng = random.Random(0)
+        for _ in range(500):
+            strategies = (
+                rng.choice(self.open_list),
+                rng.choice(self.see_list),
+                rng.choice(self.raise_list),
+                rng.choice(self.open_list),
+                rng.choice(self.see_list),
+                rng.choice(self.raise_list),
+            )
+            expected = inner_betting_round_loop(*strategies)
+            self.assertEqual(vectorized_betting_round_loop(*strategies), expected, msg=f"Strategies: {strategies}")
+            self.assertEqual(table_betting_round_loop(*strategies), expected, msg=f"Strategies: {strategies}")
+
+
+class TestBatchedDealerGainMatrix(unittest.TestCase):
+
+    def test_parity_with_inner_betting_round_loop(self):
+        open_list = cast(list[dict[int, OpenBetValues]], generate_possible_lists(2, "HML", "345"))
+        see_list = cast(list[dict[int, SeeBetValues]], generate_possible_lists(2, "HMS", "345"))
+        raise_list = cast(list[dict[int, SeeBetValues]], generate_possible_lists(2, "S"))
+        # A small tile size so the matrix is calculated over several tiles
+        matrix = batched_dealer_gain_matrix(
+            open_list, see_list, raise_list, open_list, see_list, raise_list, max_tile_cells=100
+        )
+        triples = list(product(open_list, see_list, raise_list))
+        self.assertEqual(matrix.shape, (len(triples), len(triples)))
+        for row, non_dealer_strategies in enumerate(triples):
+            for col, dealer_strategies in enumerate(triples):
+                results = inner_betting_round_loop(*dealer_strategies, *non_dealer_strategies)
+                self.assertEqual(matrix[row, col], results["dealer_cash_with_carries"] / results["num_deals"])
+
+if __name__ == '__main__':
+    unittest.main()